@@ -1,7 +1,66 @@
 # ai_exporter.py
+import json
 import os
-from typing import Dict, List, Optional, Union
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+from PIL import Image
 from data_structures import Project, Part
+from export_system import Exporter, resolve_image
+from page_format import PAGE_FORMATS
+from page_geometry import PageGeometry, Placement, PT_PER_MM
+
+
+class AIStreamWriter:
+    """PDF uyumlu AI dosyasını nesne nesne diske yazan yardımcı"""
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.offsets: Dict[int, int] = {}
+        self.next_id = 1
+
+    def reserve(self) -> int:
+        """İleride yazılacak nesne için numara ayır"""
+        obj_id = self.next_id
+        self.next_id += 1
+        return obj_id
+
+    def write(self, data: bytes):
+        self.f.write(data)
+
+    def write_object(self, obj_id: int, body: str):
+        self.offsets[obj_id] = self.f.tell()
+        self.f.write(f"{obj_id} 0 obj\n{body}\nendobj\n".encode('latin-1'))
+
+    def write_stream(self, obj_id: int, dictionary: str, data: bytes):
+        self.offsets[obj_id] = self.f.tell()
+        self.f.write(f"{obj_id} 0 obj\n<< {dictionary} /Length {len(data)} >>\nstream\n".encode('latin-1'))
+        self.f.write(data)
+        self.f.write(b"\nendstream\nendobj\n")
+
+    def begin_stream(self, obj_id: int, dictionary: str) -> int:
+        """Uzunluğu sonradan yazılacak bir stream başlat, uzunluk nesnesinin numarasını döndür"""
+        length_id = self.reserve()
+        self.offsets[obj_id] = self.f.tell()
+        self.f.write(f"{obj_id} 0 obj\n<< {dictionary} /Length {length_id} 0 R >>\nstream\n".encode('latin-1'))
+        return length_id
+
+    def end_stream(self, length_id: int, length: int):
+        self.f.write(b"\nendstream\nendobj\n")
+        self.write_object(length_id, str(length))
+
+    def write_xref(self, root_id: int, info_id: int):
+        xref_offset = self.f.tell()
+        size = self.next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        for obj_id in range(1, size):
+            lines.append(f"{self.offsets[obj_id]:010d} 00000 n \n")
+        lines.append(f"trailer\n<< /Size {size} /Root {root_id} 0 R /Info {info_id} 0 R >>\n")
+        lines.append(f"startxref\n{xref_offset}\n")
+        self.f.write("".join(lines).encode('latin-1'))
+
 
 class AIExporter:
     def __init__(self):
@@ -10,75 +69,363 @@ class AIExporter:
             'AI CC 2020': 'v24.0',
             'AI CC 2023': 'v27.0'
         }
+        # Her Illustrator sürümünün okuduğu PDF uyumluluk seviyesi
+        self.pdf_versions = {
+            'v16.0': '1.5',
+            'v24.0': '1.6',
+            'v27.0': '1.7'
+        }
+        # A4 sayfa, 10 mm kenar boşluğu, 3x3 grid
+        self.geometry = PageGeometry(PAGE_FORMATS['A4'], (3, 3), margin_mm=10.0, header_mm=15.0)
+        self.band_height = 256              # görüntüler bu yükseklikte şeritler halinde sıkıştırılır
         self.export_path = "exports/ai/"
         os.makedirs(self.export_path, exist_ok=True)
-        
-    def export_to_ai(self, data: Union[Project, Part], path: str, version: str = 'AI CC 2020') -> bool:
-        """Veriyi AI formatında dışa aktar"""
+
+    @property
+    def page_size(self) -> Tuple[float, float]:
+        return self.geometry.page_format.size_pt()
+
+    @property
+    def margin(self) -> float:
+        return self.geometry.margin_mm * PT_PER_MM
+
+    def export_to_ai(self, data: Union[Project, Part], path: str, version: str = 'AI CC 2020',
+                     plan: Optional[Dict] = None) -> bool:
+        """Veriyi AI formatında dışa aktar; plan verilirse görüntüler ön kontrol planından alınır"""
         if version not in self.supported_versions:
             raise ValueError(f"Desteklenmeyen AI versiyonu: {version}")
-            
+
         try:
-            # AI dosya formatı oluşturma
-            ai_data = self._convert_to_ai_format(data, version)
-            
             # Dosya uzantısını kontrol et
             if not path.lower().endswith('.ai'):
                 path += '.ai'
-                
-            # Dosyayı kaydet
+
+            # Sayfalar ve parçalar üretildikçe dosyaya yazılır
             with open(path, 'wb') as f:
-                f.write(ai_data)
-                
+                self._write_ai(f, data, version, plan=plan)
+
             return True
         except Exception as e:
             print(f"AI export hatası: {str(e)}")
             return False
-    
-    def _convert_to_ai_format(self, data: Union[Project, Part], version: str) -> bytes:
-        """AI dosya formatına dönüştür"""
+
+    def export_batch(self, project: Project, output_dir: Optional[str] = None, split: str = 'page',
+                     versions: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict:
+        """Projeyi sayfa ya da parça başına ayrı AI dosyalarına böl ve paralel yaz"""
+        if split not in ('page', 'part'):
+            raise ValueError(f"Geçersiz bölme türü: {split}")
+        versions = versions or self.get_supported_versions()
+        for version in versions:
+            if version not in self.supported_versions:
+                raise ValueError(f"Desteklenmeyen AI versiyonu: {version}")
+
+        output_dir = output_dir or self.export_path
+        os.makedirs(output_dir, exist_ok=True)
+        project_slug = self._slug(project.name)
+
+        jobs = []
+        for page_num, page in enumerate(project.pages):
+            if split == 'page':
+                # İşçiye sadece ilgili sayfa gönderilir
+                units = [(Project(project.name), f"{project_slug}_sayfa{page_num + 1:03d}")]
+                units[0][0].pages = [page]
+            else:
+                units = [
+                    (part, f"{project_slug}_sayfa{page_num + 1:03d}_{self._slug(part.name)}_{part.id[:8]}")
+                    for part in page.get('parts', []) if isinstance(part, Part)
+                ]
+            for data, base_name in units:
+                for version in versions:
+                    jobs.append({
+                        'data': data,
+                        'version': version,
+                        'path': os.path.join(output_dir, f"{base_name}_{self._slug(version)}.ai"),
+                        'page': page_num,
+                        'page_count': len(project.pages),
+                        'geometry': self.geometry
+                    })
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            files = list(executor.map(_export_batch_job, jobs))
+
+        manifest = {
+            'project': project.name,
+            'split': split,
+            'versions': versions,
+            'files': files,
+            'total_size': sum(item['size'] for item in files),
+            'total_seconds': time.perf_counter() - start,
+            'failed': sum(1 for item in files if not item['success'])
+        }
+        try:
+            with open(os.path.join(output_dir, f"{project_slug}_manifest.json"), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=4)
+        except Exception as e:
+            print(f"AI manifest kaydetme hatası: {str(e)}")
+        return manifest
+
+    def _slug(self, text: str) -> str:
+        """Dosya adında güvenle kullanılabilecek metin üret"""
+        return re.sub(r'[^\w.-]+', '_', text, flags=re.UNICODE).strip('_') or 'adsiz'
+
+    def _write_ai(self, f: BinaryIO, data: Union[Project, Part], version: str,
+                  first_page: int = 0, page_count: Optional[int] = None, plan: Optional[Dict] = None):
+        """AI dosyasını akış halinde yaz"""
         version_code = self.supported_versions[version]
-        
-        # AI dosya header'ı
-        header = self._create_ai_header(version_code)
-        
-        # Veri dönüşümü
+        writer = AIStreamWriter(f)
+        writer.write(self._create_ai_header(version_code))
+
+        catalog_id = writer.reserve()
+        pages_id = writer.reserve()
+        font_id = writer.reserve()
+        writer.write_object(
+            font_id,
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+        )
+
+        # Görüntü kaynakları sayfalar arasında paylaşılır: path -> XObject numarası
+        image_ids: Dict[str, Optional[int]] = {}
+        page_ids: List[int] = []
+
         if isinstance(data, Project):
-            content = self._convert_project(data)
+            self._convert_project(writer, data, pages_id, font_id, image_ids, page_ids, first_page, page_count, plan)
         else:
-            content = self._convert_part(data)
-            
-        # Footer
-        footer = self._create_ai_footer()
-        
-        return header + content + footer
-    
+            self._convert_part(writer, data, pages_id, font_id, image_ids, page_ids, plan)
+
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+        writer.write_object(pages_id, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>")
+        writer.write_object(catalog_id, f"<< /Type /Catalog /Pages {pages_id} 0 R >>")
+
+        info_id = writer.reserve()
+        title = data.name if isinstance(data, (Project, Part)) else ''
+        writer.write_object(
+            info_id,
+            f"<< /Creator ({self._escape(f'Adobe Illustrator {version_code}')}) "
+            f"/Producer (Pafta) /Title ({self._escape(title)}) >>"
+        )
+        writer.write_xref(catalog_id, info_id)
+        writer.write(self._create_ai_footer())
+
     def _create_ai_header(self, version: str) -> bytes:
         """AI dosya header'ını oluştur"""
-        # AI dosya formatı için gerekli header
-        header = f"%!PS-Adobe-3.0\n"
+        # PDF uyumlu AI dosyası: Illustrator bu başlığı doğrudan açar
+        header = f"%PDF-{self.pdf_versions.get(version, '1.6')}\n"
+        header += "%\xe2\xe3\xcf\xd3\n"
         header += f"%%Creator: Adobe Illustrator {version}\n"
-        header += f"%%BoundingBox: 0 0 595.276 841.89\n"  # A4 boyutu
-        return header.encode()
-    
-    def _convert_project(self, project: Project) -> bytes:
-        """Projeyi AI formatına dönüştür"""
-        # Proje dönüşüm mantığı
-        pass
-    
-    def _convert_part(self, part: Part) -> bytes:
-        """Parçayı AI formatına dönüştür"""
-        # Parça dönüşüm mantığı
-        pass
-    
+        header += f"%%BoundingBox: 0 0 {self.page_size[0]:.3f} {self.page_size[1]:.3f}\n"
+        return header.encode('latin-1')
+
+    def _convert_project(self, writer: AIStreamWriter, project: Project, pages_id: int, font_id: int,
+                         image_ids: Dict, page_ids: List[int], first_page: int = 0,
+                         page_count: Optional[int] = None, plan: Optional[Dict] = None):
+        """Projeyi sayfa sayfa AI formatına dönüştür"""
+        # Bölünmüş export'ta sayfa numaraları asıl projeye göre yazılır
+        page_count = page_count or len(project.pages)
+        for page_num, page in enumerate(project.pages, start=first_page):
+            operations = [self._text(f"Proje: {project.name}", self.margin, self.page_size[1] - 20, 12)]
+            operations.append(self._text(
+                f"Sayfa: {page_num + 1}/{page_count}", self.margin, self.page_size[1] - 34, 9
+            ))
+
+            used_images = {}
+            placements = self.geometry.placements(page)
+            for part in page.get('parts', []):
+                if isinstance(part, Part):
+                    operations.append(self._part_operations(
+                        writer, part, resolve_image(part, plan), placements[part.id], image_ids, used_images
+                    ))
+
+            self._write_page(writer, operations, pages_id, font_id, used_images, page_ids)
+
+    def _convert_part(self, writer: AIStreamWriter, part: Part, pages_id: int, font_id: int,
+                      image_ids: Dict, page_ids: List[int], plan: Optional[Dict] = None):
+        """Parçayı tek sayfalık AI çizimine dönüştür"""
+        # Tek parça kenar boşlukları içindeki tüm sayfayı kaplar
+        margin = self.geometry.margin_mm
+        width_mm, height_mm = self.geometry.page_format.size_mm
+        placement = self.geometry.placement(part, (margin, margin, width_mm - 2 * margin, height_mm - 2 * margin))
+        used_images = {}
+        operations = [self._part_operations(
+            writer, part, resolve_image(part, plan), placement, image_ids, used_images
+        )]
+        self._write_page(writer, operations, pages_id, font_id, used_images, page_ids)
+
+    def _write_page(self, writer: AIStreamWriter, operations: List[str], pages_id: int, font_id: int,
+                    used_images: Dict[str, int], page_ids: List[int]):
+        """Sayfa içeriğini sıkıştırıp hemen dosyaya yaz"""
+        content_id = writer.reserve()
+        writer.write_stream(content_id, "/Filter /FlateDecode", zlib.compress("\n".join(operations).encode('latin-1')))
+
+        xobjects = " ".join(f"/{name} {obj_id} 0 R" for name, obj_id in used_images.items())
+        page_id = writer.reserve()
+        writer.write_object(
+            page_id,
+            f"<< /Type /Page /Parent {pages_id} 0 R "
+            f"/MediaBox [0 0 {self.page_size[0]:.3f} {self.page_size[1]:.3f}] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> /XObject << {xobjects} >> >> "
+            f"/Contents {content_id} 0 R >>"
+        )
+        page_ids.append(page_id)
+
+    def _part_operations(self, writer: AIStreamWriter, part: Part, image_path: Optional[str],
+                         placement: Placement, image_ids: Dict, used_images: Dict[str, int]) -> str:
+        """Parça için çerçeve, etiket ve görüntü çizim komutlarını üret"""
+        page_height_mm = self.geometry.page_format.height_mm
+        x, y, width, height = placement.rect(PT_PER_MM, page_height_mm)
+        operations = [
+            f"q 0.5 w 0.6 G {x:.2f} {y:.2f} {width:.2f} {height:.2f} re S Q",
+            self._text(part.name, x + 3, y + 3, 7)
+        ]
+
+        image = self._image_resource(writer, image_path, image_ids)
+        if image:
+            obj_id, (image_width, image_height) = image
+            name = f"Im{obj_id}"
+            used_images[name] = obj_id
+
+            # Hücre merkezine taşı, döndür ve ölçekle; sonra görüntüyü kutuya sığdır
+            a, b, c, d, e, f = placement.transform(PT_PER_MM, page_height_mm)
+            fit_width, fit_height = placement.fit((image_width, image_height))
+            draw_width, draw_height = fit_width * PT_PER_MM, fit_height * PT_PER_MM
+            operations.append(
+                f"q {x:.2f} {y:.2f} {width:.2f} {height:.2f} re W n "
+                f"{a:.4f} {b:.4f} {c:.4f} {d:.4f} {e:.2f} {f:.2f} cm "
+                f"{draw_width:.2f} 0 0 {draw_height:.2f} {-draw_width / 2:.2f} {-draw_height / 2:.2f} cm /{name} Do Q"
+            )
+        return "\n".join(operations)
+
+    def _image_resource(self, writer: AIStreamWriter, image_path: Optional[str],
+                        image_ids: Dict) -> Optional[Tuple[int, Tuple[int, int]]]:
+        """Görüntüyü ilk kullanımda bir kez yaz, sonraki sayfalarda aynı nesneye başvur"""
+        if not image_path or not os.path.exists(image_path):
+            return None
+        if image_path not in image_ids:
+            try:
+                with Image.open(image_path):
+                    pass
+            except Exception as e:
+                # Okunamayan görüntü atlanır; yazma sırasındaki hatalar export'u durdurur
+                print(f"AI görüntü okuma hatası: {str(e)}")
+                image_ids[image_path] = None
+                return None
+            image_ids[image_path] = self._write_image(writer, image_path)
+        return image_ids[image_path]
+
+    def _write_image(self, writer: AIStreamWriter, image_path: str) -> Tuple[int, Tuple[int, int]]:
+        """Görüntüyü XObject olarak akış halinde yaz"""
+        obj_id = writer.reserve()
+        with Image.open(image_path) as img:
+            size = img.size
+
+            # RGB ve gri JPEG'ler çözülmeden olduğu gibi gömülür
+            if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+                color_space = '/DeviceRGB' if img.mode == 'RGB' else '/DeviceGray'
+                length_id = writer.begin_stream(
+                    obj_id,
+                    f"/Type /XObject /Subtype /Image /Width {size[0]} /Height {size[1]} "
+                    f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /DCTDecode"
+                )
+                length = 0
+                with open(image_path, 'rb') as source:
+                    for chunk in iter(lambda: source.read(1024 * 1024), b''):
+                        writer.write(chunk)
+                        length += len(chunk)
+                writer.end_stream(length_id, length)
+                return obj_id, size
+
+            has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+
+            smask = ""
+            if has_alpha:
+                smask_id = writer.reserve()
+                self._write_flate_image(writer, smask_id, img.getchannel('A'), '/DeviceGray')
+                smask = f" /SMask {smask_id} 0 R"
+
+            rgb = img.convert('RGB') if has_alpha else img
+            self._write_flate_image(writer, obj_id, rgb, '/DeviceRGB', smask)
+        return obj_id, size
+
+    def _write_flate_image(self, writer: AIStreamWriter, obj_id: int, img: Image.Image,
+                           color_space: str, extra: str = ""):
+        """Görüntüyü şerit şerit sıkıştırarak yaz; tüm piksel verisi tek seferde bellekte tutulmaz"""
+        width, height = img.size
+        length_id = writer.begin_stream(
+            obj_id,
+            f"/Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /FlateDecode{extra}"
+        )
+        compressor = zlib.compressobj()
+        length = 0
+        for top in range(0, height, self.band_height):
+            band = img.crop((0, top, width, min(top + self.band_height, height)))
+            chunk = compressor.compress(band.tobytes())
+            writer.write(chunk)
+            length += len(chunk)
+        chunk = compressor.flush()
+        writer.write(chunk)
+        length += len(chunk)
+        writer.end_stream(length_id, length)
+
+    def _text(self, text: str, x: float, y: float, size: int) -> str:
+        return f"BT /F1 {size} Tf {x:.2f} {y:.2f} Td ({self._escape(text)}) Tj ET"
+
+    def _escape(self, text: str) -> str:
+        """Metni WinAnsi uyumlu PDF string'ine çevir"""
+        # WinAnsi kodlamasında olmayan Türkçe karakterler
+        text = text.translate(str.maketrans('ıİşŞğĞ', 'iIsSgG'))
+        text = text.encode('cp1252', errors='replace').decode('latin-1')
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
     def _create_ai_footer(self) -> bytes:
         """AI dosya footer'ını oluştur"""
         return b"%%EOF\n"
-    
+
     def get_supported_versions(self) -> List[str]:
         """Desteklenen AI versiyonlarını listele"""
         return list(self.supported_versions.keys())
-    
+
     def validate_version(self, version: str) -> bool:
         """Versiyon geçerliliğini kontrol et"""
-        return version in self.supported_versions
\ No newline at end of file
+        return version in self.supported_versions
+
+
+class AIProjectExporter(Exporter):
+    """AIExporter'ı ExportManager'ın Project tabanlı arayüzüne bağlar"""
+
+    def __init__(self, version: str = 'AI CC 2020'):
+        self.ai_exporter = AIExporter()
+        self.version = version
+        self.geometry = self.ai_exporter.geometry
+
+    def configure(self, page_format=None, dpi=None, geometry=None):
+        super().configure(page_format, dpi, geometry)
+        self.ai_exporter.geometry = self.geometry
+
+    def export(self, project: Project, path: str, plan: Optional[Dict] = None) -> bool:
+        return self.ai_exporter.export_to_ai(project, path, self.version, plan)
+
+
+def _export_batch_job(job: Dict) -> Dict:
+    """Süreç havuzunda tek bir AI dosyası üret ve süresini ölç"""
+    exporter = AIExporter()
+    exporter.geometry = job['geometry']
+    start = time.perf_counter()
+    result = {
+        'path': job['path'],
+        'version': job['version'],
+        'page': job['page'],
+        'part_id': job['data'].id if isinstance(job['data'], Part) else None,
+        'success': False,
+        'size': 0
+    }
+    try:
+        with open(job['path'], 'wb') as f:
+            exporter._write_ai(f, job['data'], job['version'], job['page'], job['page_count'])
+        result['success'] = True
+        result['size'] = os.path.getsize(job['path'])
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
@@ -1,5 +1,5 @@
 # data_structures.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from enum import Enum
 import uuid
@@ -15,7 +15,7 @@ class PartType(Enum):
     ASSEMBLY = "Montaj"
     PARTS_LIST = "Parça Listesi"
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     id: str
     type: PartType
@@ -29,6 +29,31 @@ class Part:
     def __post_init__(self):
         if not self.id:
             self.id = str(uuid.uuid4())
+    
+    def freeze(self) -> 'FrozenPart':
+        return FrozenPart(self.id, self.type, self.name, tuple(self.size),
+                          tuple(self.position) if self.position else None,
+                          self.rotation, self.scale, self.image_path)
+
+@dataclass(frozen=True, slots=True)
+class FrozenPart:
+    """Değişmez, hashlenebilir parça (katalog ve önbellek anahtarları için)"""
+    id: str
+    type: PartType
+    name: str
+    size: tuple
+    position: Optional[tuple] = None
+    rotation: int = 0
+    scale: float = 1.0
+    image_path: Optional[str] = None
+    
+    def __post_init__(self):
+        if not self.id:
+            object.__setattr__(self, 'id', str(uuid.uuid4()))
+    
+    def thaw(self) -> Part:
+        return Part(self.id, self.type, self.name, self.size, self.position,
+                    self.rotation, self.scale, self.image_path)
 
 @dataclass
 class Template:
@@ -37,6 +62,8 @@ class Template:
     description: str
     layout_rules: Dict
     default_parts: List[PartType]
+    grid_size: tuple = (3, 3)  # (satır, sütun)
+    settings: Dict = field(default_factory=dict)  # sayfa, özel alan ve export ayarları
     
 class Project:
     def __init__(self, name: str):
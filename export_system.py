@@ -1,60 +1,193 @@
 # export_system.py
 from abc import ABC, abstractmethod
 from data_structures import Project, Part, PartType
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A3  # A3 kullanıyoruz
-from reportlab.lib.units import mm
-from PIL import Image
+from render_cache import RenderCache
+from page_format import PageFormat, PAGE_FORMATS, DPI_PRESETS, MM_PER_INCH, get_page_format, resolve_dpi
+from page_geometry import PageGeometry, Placement
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union, Callable, TYPE_CHECKING
+from xml.sax.saxutils import escape, quoteattr
+import importlib
+import importlib.metadata
+import base64
+import shutil
 import os
 
+# ReportLab ve PIL sadece ilgili exporter kullanıldığında yüklenir
+if TYPE_CHECKING:
+    from PIL import Image
+    from resolution_checker import ResolutionChecker
+
+# format -> "modül:sınıf"; ilk kullanımda import edilir
+BUILTIN_EXPORTERS = {
+    'pdf': 'export_system:PDFExporter',
+    'png': 'export_system:PNGExporter',
+    'svg': 'export_system:SVGExporter',
+    'ai': 'ai_exporter:AIProjectExporter'
+}
+
+# Üçüncü parti exporter'lar bu entry point grubuyla kaydolur
+EXPORTER_ENTRY_POINT_GROUP = 'pafta.exporters'
+
+# pypdf eksikliği (sayfa önbelleği kapalı) bir kez bildirildi mi
+_pypdf_missing_logged = False
+
+def resolve_image(part: Part, plan: Optional[Dict]) -> Optional[str]:
+    """Ön kontrol planındaki (gerekirse değiştirilmiş) görüntü yolunu getir"""
+    if plan is None:
+        return part.image_path
+    return plan['images'].get(part.id)
+
 class Exporter(ABC):
+    # ExportManager tarafından atanır; None ise her sayfa baştan render edilir
+    render_cache: Optional[RenderCache] = None
+    # Sayfa geometrisi; ExportManager her export öncesi configure ile atar
+    geometry: PageGeometry = PageGeometry()
+    dpi: int = DPI_PRESETS['print']
+    
+    @property
+    def page_format(self) -> PageFormat:
+        return self.geometry.page_format
+    
+    def configure(self, page_format: Union[str, tuple, PageFormat, None] = None,
+                  dpi: Union[int, str, None] = None, geometry: Optional[PageGeometry] = None):
+        """Sayfa formatını, yerleşim geometrisini ve raster çözünürlüğünü ayarla"""
+        if geometry is not None:
+            self.geometry = geometry
+        elif page_format is not None:
+            page_format = get_page_format(page_format)
+            if page_format != self.geometry.page_format:
+                self.geometry = PageGeometry(
+                    page_format, self.geometry.grid_size, self.geometry.margin_mm, self.geometry.header_mm
+                )
+        if dpi is not None:
+            self.dpi = resolve_dpi(dpi)
+    
     @abstractmethod
-    def export(self, project: Project, path: str) -> bool:
+    def export(self, project: Project, path: str, plan: Optional[Dict] = None) -> bool:
         pass
+    
+    def _resolve_image(self, part: Part, plan: Optional[Dict]) -> Optional[str]:
+        return resolve_image(part, plan)
+    
+    def _page_key(self, page: Dict, plan: Optional[Dict], **extra) -> str:
+        """Sayfanın render önbelleği anahtarını üret"""
+        return self.render_cache.page_fingerprint(page, plan['images'] if plan else {}, extra)
 
 class PDFExporter(Exporter):
-    def export(self, project: Project, path: str) -> bool:
+    def export(self, project: Project, path: str, plan: Optional[Dict] = None) -> bool:
+        # Her export kendi sayımını raporlar; önceki export'un sonucu kalmaz
+        self.last_stats = {'rendered': 0, 'cached': 0}
         try:
-            c = canvas.Canvas(path, pagesize=A3)
+            if self.render_cache is not None and self._can_splice():
+                return self._export_cached(project, path, plan)
+            
+            from reportlab.pdfgen import canvas
+            
+            c = canvas.Canvas(path, pagesize=self.page_format.size_pt())
             for page_num, page in enumerate(project.pages):
                 if page_num > 0:
                     c.showPage()
-                self._create_page(c, page, project)
+                self._create_page(c, page_num, page, project, plan)
+                self.last_stats['rendered'] += 1
             c.save()
             return True
         except Exception as e:
             print(f"PDF export hatası: {str(e)}")
             return False
     
-    def _create_page(self, c, page, project):
-        # Sayfa başlığı
+    def _can_splice(self) -> bool:
+        # Önbellekteki sayfaları birleştirmek için pypdf gerekir (opsiyonel)
+        global _pypdf_missing_logged
+        try:
+            import pypdf  # noqa: F401
+            return True
+        except ImportError:
+            # Her export'ta değil, süreç başına bir kez bildirilir
+            if not _pypdf_missing_logged:
+                _pypdf_missing_logged = True
+                print("PDF sayfa önbelleği kapalı: pypdf kurulu değil, tüm sayfalar yeniden render edilecek")
+            return False
+    
+    def _export_cached(self, project: Project, path: str, plan: Optional[Dict]) -> bool:
+        """Sadece değişen sayfaları render et, diğerlerini önbellekten ekle"""
+        from pypdf import PdfWriter
+        from reportlab.pdfgen import canvas
+        
+        writer = PdfWriter()
+        for page_num, page in enumerate(project.pages):
+            key = self._page_key(
+                page, plan,
+                format='pdf',
+                geometry=self.geometry.signature,
+                project=project.name,
+                page_number=page_num,
+                page_count=len(project.pages)
+            )
+            fragment = self.render_cache.get(key, 'pdf')
+            if fragment is None:
+                temp_path = self.render_cache.reserve(key, 'pdf')
+                try:
+                    c = canvas.Canvas(temp_path, pagesize=self.page_format.size_pt())
+                    self._create_page(c, page_num, page, project, plan)
+                    c.save()
+                except Exception:
+                    self.render_cache.discard(temp_path)
+                    raise
+                fragment = self.render_cache.commit(key, 'pdf', temp_path)
+                self.last_stats['rendered'] += 1
+            else:
+                self.last_stats['cached'] += 1
+            writer.append(fragment)
+        
+        with open(path, 'wb') as f:
+            writer.write(f)
+        return True
+    
+    def _create_page(self, c, page_num, page, project, plan=None, images=None):
+        from reportlab.lib.units import mm
+        
+        # Sayfa başlığı (üst kenardan 20 mm aşağıda)
+        top = self.page_format.height_mm
         c.setFont("Helvetica-Bold", 14)
-        c.drawString(20*mm, 400*mm, f"Proje: {project.name}")
-        c.drawString(20*mm, 390*mm, f"Sayfa: {project.current_page + 1}/{len(project.pages)}")
+        c.drawString(20*mm, (top - 20)*mm, f"Proje: {project.name}")
+        c.drawString(20*mm, (top - 30)*mm, f"Sayfa: {page_num + 1}/{len(project.pages)}")
+        
+        # Sayfa bilgileri (ürün adı, kodu, seri...)
+        c.setFont("Helvetica", 11)
+        y_pos = top - 40
+        for label, value in page.get('info', {}).items():
+            c.drawString(20*mm, y_pos*mm, f"{label}: {value}")
+            y_pos -= 7
         
-        # Parçaları yerleştir
+        # Parçaları grid hücrelerine yerleştir
+        placements = self.geometry.placements(page)
         for part in page.get('parts', []):
             if isinstance(part, Part):
-                self._place_part(c, part)
+                self._place_part(c, part, self._resolve_image(part, plan), placements[part.id], images)
     
-    def _place_part(self, c, part: Part):
-        if part.image_path and os.path.exists(part.image_path):
-            x, y = part.position or (0, 0)
-            width, height = part.size
+    def _place_part(self, c, part: Part, image_path: Optional[str], placement: Placement,
+                    images: Optional[Dict] = None):
+        from reportlab.lib.units import mm
+        from reportlab.lib.utils import ImageReader
+        
+        if image_path and os.path.exists(image_path):
+            # Önceden çözülmüş görüntü varsa dosya tekrar okunmaz
+            source = ImageReader(images[image_path]) if images and image_path in images else image_path
+            box_width, box_height = placement.box
             
-            # Rotasyon ve ölçek uygula
+            # Kutu merkezli yerel koordinatlara geç (rotasyon ve ölçek dahil)
             c.saveState()
-            c.translate(x*mm, y*mm)
-            c.rotate(part.rotation)
-            c.scale(part.scale, part.scale)
+            c.transform(*placement.transform(mm, self.page_format.height_mm))
             
             try:
                 c.drawImage(
-                    part.image_path,
-                    0, 0,
-                    width=width*mm,
-                    height=height*mm,
-                    preserveAspectRatio=True
+                    source,
+                    -box_width / 2 * mm, -box_height / 2 * mm,
+                    width=box_width*mm,
+                    height=box_height*mm,
+                    preserveAspectRatio=True,
+                    anchor='c'
                 )
             except Exception as e:
                 print(f"Görsel yerleştirme hatası: {str(e)}")
@@ -62,53 +195,531 @@ class PDFExporter(Exporter):
             c.restoreState()
 
 class PNGExporter(Exporter):
-    def export(self, project: Project, path: str) -> bool:
+    def export(self, project: Project, path: str, plan: Optional[Dict] = None) -> bool:
         try:
             # Aktif sayfayı PNG olarak kaydet
             page = project.pages[project.current_page]
             
-            # Boş bir A3 görsel oluştur
-            img = Image.new('RGB', (3508, 4961), 'white')  # A3 300dpi
-            
-            # Parçaları yerleştir
-            for part in page.get('parts', []):
-                if isinstance(part, Part) and part.image_path:
-                    self._place_part(img, part)
+            key = None
+            if self.render_cache is not None:
+                key = self._page_key(page, plan, format='png', geometry=self.geometry.signature, dpi=self.dpi)
+                cached = self.render_cache.get(key, 'png')
+                if cached:
+                    shutil.copyfile(cached, path)
+                    return True
             
-            img.save(path, 'PNG', dpi=(300, 300))
+            img = self.render_page(page, plan)
+            img.save(path, 'PNG', dpi=(self.dpi, self.dpi))
+            if key:
+                self.render_cache.put(key, 'png', path)
             return True
             
         except Exception as e:
             print(f"PNG export hatası: {str(e)}")
             return False
     
-    def _place_part(self, img: Image.Image, part: Part):
-        if os.path.exists(part.image_path):
+    def render_page(self, page: Dict, plan: Optional[Dict] = None, images: Optional[Dict] = None) -> 'Image.Image':
+        """Sayfayı raster görüntü olarak oluştur"""
+        from PIL import Image
+        
+        # Sayfa formatı ve DPI'a göre boş görsel oluştur (A3 300dpi: 3508x4961)
+        img = Image.new('RGB', self.page_format.size_px(self.dpi), 'white')
+        
+        # Parçaları grid hücrelerine yerleştir
+        placements = self.geometry.placements(page)
+        for part in page.get('parts', []):
+            if isinstance(part, Part):
+                image_path = self._resolve_image(part, plan)
+                if image_path:
+                    self._place_part(img, part, image_path, placements[part.id], images)
+        return img
+    
+    def _place_part(self, img: 'Image.Image', part: Part, image_path: str, placement: Placement,
+                    images: Optional[Dict] = None):
+        from PIL import Image
+        
+        if os.path.exists(image_path):
             try:
-                part_img = Image.open(part.image_path)
+                part_img = images[image_path] if images and image_path in images else Image.open(image_path)
                 
-                # Rotasyon ve ölçek uygula
-                if part.rotation:
-                    part_img = part_img.rotate(part.rotation, expand=True)
-                if part.scale != 1.0:
-                    new_size = tuple(int(dim * part.scale) for dim in part_img.size)
-                    part_img = part_img.resize(new_size, Image.Resampling.LANCZOS)
+                # Kutuya sığan boyutu ölçekle birlikte piksele çevir
+                px_per_mm = self.dpi / MM_PER_INCH
+                fit_width, fit_height = placement.fit(part_img.size)
+                new_size = (
+                    max(1, round(fit_width * placement.scale * px_per_mm)),
+                    max(1, round(fit_height * placement.scale * px_per_mm))
+                )
+                if part_img.mode not in ('RGB', 'RGBA'):
+                    part_img = part_img.convert('RGBA' if 'transparency' in part_img.info else 'RGB')
+                part_img = part_img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
                 
-                # Parçayı yerleştir
-                x, y = part.position or (0, 0)
-                img.paste(part_img, (int(x), int(y)))
+                if placement.rotation % 360:
+                    # Köşelerde boşluk kalmaması için saydam zeminde döndür
+                    part_img = part_img.convert('RGBA').rotate(placement.rotation, expand=True)
+                
+                # Görüntüyü hücre merkezine yerleştir
+                center_x, center_y = placement.center
+                position = (
+                    round(center_x * px_per_mm - part_img.width / 2),
+                    round(center_y * px_per_mm - part_img.height / 2)
+                )
+                img.paste(part_img, position, part_img if part_img.mode == 'RGBA' else None)
                 
             except Exception as e:
                 print(f"Parça yerleştirme hatası: {str(e)}")
 
+class SVGExporter(Exporter):
+    def __init__(self, page_format: Union[str, tuple, PageFormat] = 'A3', grid_size: tuple = (3, 3),
+                 embed_images: bool = False):
+        self.geometry = PageGeometry(page_format, grid_size)
+        self.embed_images = embed_images  # False: dosyaya bağlantı, True: base64 gömme
+        self.page_gap = 10                # sayfalar arası boşluk (mm)
+        self.mime_types = {
+            '.png': 'image/png',
+            '.jpg': 'image/jpeg',
+            '.jpeg': 'image/jpeg',
+            '.gif': 'image/gif',
+            '.svg': 'image/svg+xml'
+        }
+    
+    def export(self, project: Project, path: str, plan: Optional[Dict] = None) -> bool:
+        try:
+            page_width, page_height = self.page_format.size_mm
+            total_height = len(project.pages) * (page_height + self.page_gap) - self.page_gap
+            total_height = max(total_height, page_height)
+            
+            # Sayfalar üretildikçe dosyaya yazılır; hiçbir görüntü rasterize edilmez
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+                f.write(
+                    f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+                    f'width="{page_width}mm" height="{total_height}mm" '
+                    f'viewBox="0 0 {page_width} {total_height}">\n'
+                )
+                f.write(f'<title>{escape(project.name)}</title>\n')
+                for page_num, page in enumerate(project.pages):
+                    self._write_page(f, page_num, page, project, path, plan)
+                f.write('</svg>\n')
+            return True
+        except Exception as e:
+            print(f"SVG export hatası: {str(e)}")
+            return False
+    
+    def _write_page(self, f, page_num: int, page: Dict, project: Project, path: str, plan: Optional[Dict]):
+        page_width, page_height = self.page_format.size_mm
+        offset = page_num * (page_height + self.page_gap)
+        f.write(f'<g id="page-{page_num + 1}" transform="translate(0 {offset})">\n')
+        f.write(f'<rect width="{page_width}" height="{page_height}" fill="white" stroke="#cccccc" stroke-width="0.3"/>\n')
+        f.write(
+            f'<text x="20" y="15" font-family="Helvetica" font-size="5" font-weight="bold">'
+            f'Proje: {escape(project.name)} - Sayfa: {page_num + 1}/{len(project.pages)}</text>\n'
+        )
+        placements = self.geometry.placements(page)
+        for part in page.get('parts', []):
+            if isinstance(part, Part):
+                self._place_part(f, part, self._resolve_image(part, plan), placements[part.id], path)
+        f.write('</g>\n')
+    
+    def _place_part(self, f, part: Part, image_path: Optional[str], placement: Placement, svg_path: str):
+        x, y, width, height = placement.cell
+        
+        f.write(f'<g id={quoteattr("part-" + part.id)} data-type={quoteattr(part.type.name)}>\n')
+        f.write(
+            f'<rect x="{x:.3f}" y="{y:.3f}" '
+            f'width="{width:.3f}" height="{height:.3f}" fill="none" stroke="#999999" stroke-width="0.2"/>\n'
+        )
+        f.write(
+            f'<text x="{x + 2:.3f}" y="{y + height - 2:.3f}" '
+            f'font-family="Helvetica" font-size="3">{escape(part.name)}</text>\n'
+        )
+        
+        if image_path and os.path.exists(image_path):
+            # SVG matrisi sayfa geometrisiyle aynı sırada ve aynı (y aşağı) eksende
+            box_width, box_height = placement.box
+            matrix = " ".join(f"{value:.4f}" for value in placement.matrix)
+            f.write(
+                f'<g transform="matrix({matrix})">\n'
+                f'<image x="{-box_width / 2:.3f}" y="{-box_height / 2:.3f}" '
+                f'width="{box_width:.3f}" height="{box_height:.3f}" preserveAspectRatio="xMidYMid meet" xlink:href="'
+            )
+            self._write_href(f, image_path, svg_path)
+            f.write('"/>\n</g>\n')
+        
+        f.write('</g>\n')
+    
+    def _write_href(self, f, image_path: str, svg_path: str):
+        if not self.embed_images:
+            relative = os.path.relpath(os.path.abspath(image_path), os.path.dirname(os.path.abspath(svg_path)))
+            f.write(escape(relative.replace(os.sep, '/'), {'"': '&quot;'}))
+            return
+        
+        mime_type = self.mime_types.get(os.path.splitext(image_path)[1].lower(), 'application/octet-stream')
+        f.write(f'data:{mime_type};base64,')
+        # 3'ün katı parçalar halinde kodla: bütün dosya bellekte tutulmaz
+        with open(image_path, 'rb') as source:
+            for chunk in iter(lambda: source.read(3 * 256 * 1024), b''):
+                f.write(base64.b64encode(chunk).decode('ascii'))
+
+class PageSink(ABC):
+    """Tek geçişli export hattında sayfa render'ını alan hedef"""
+    needs_raster = False
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def begin(self, project: Project):
+        pass
+    
+    @abstractmethod
+    def add_page(self, page_num: int, page: Dict, project: Project, plan: Optional[Dict],
+                 images: Dict, raster: Optional['Image.Image']):
+        pass
+    
+    def finish(self) -> bool:
+        return True
+    
+    def _page_path(self, page_num: int, page_count: int, ext: Optional[str] = None) -> str:
+        """Çok sayfalı çıktılarda sayfa numaralı dosya adı üret"""
+        base, current_ext = os.path.splitext(self.path)
+        ext = ext or current_ext
+        if page_count == 1:
+            return base + ext
+        return f"{base}_{page_num + 1:03d}{ext}"
+
+class PDFSink(PageSink):
+    def __init__(self, path: str, exporter: PDFExporter):
+        super().__init__(path)
+        self.exporter = exporter
+        self.canvas = None
+    
+    def begin(self, project: Project):
+        from reportlab.pdfgen import canvas
+        self.canvas = canvas.Canvas(self.path, pagesize=self.exporter.page_format.size_pt())
+    
+    def add_page(self, page_num, page, project, plan, images, raster):
+        if page_num > 0:
+            self.canvas.showPage()
+        self.exporter._create_page(self.canvas, page_num, page, project, plan, images)
+    
+    def finish(self) -> bool:
+        self.canvas.save()
+        return True
+
+class PNGSink(PageSink):
+    needs_raster = True
+    
+    def __init__(self, path: str, dpi: int = DPI_PRESETS['print']):
+        super().__init__(path)
+        self.dpi = dpi
+    
+    def add_page(self, page_num, page, project, plan, images, raster):
+        raster.save(self._page_path(page_num, len(project.pages), '.png'), 'PNG', dpi=(self.dpi, self.dpi))
+
+class ThumbnailSink(PageSink):
+    needs_raster = True
+    
+    def __init__(self, path: str, max_size: tuple = (256, 362), quality: int = 85):
+        super().__init__(path)
+        self.max_size = max_size
+        self.quality = quality
+    
+    def add_page(self, page_num, page, project, plan, images, raster):
+        from PIL import Image
+        # Katalog küçük resmi: önce hızlı tamsayı indirgeme, sonra kaliteli küçültme
+        factor = max(1, min(raster.width // (self.max_size[0] * 2), raster.height // (self.max_size[1] * 2)))
+        thumbnail = raster.reduce(factor) if factor > 1 else raster.copy()
+        thumbnail.thumbnail(self.max_size, Image.Resampling.LANCZOS)
+        thumbnail.save(self._page_path(page_num, len(project.pages), '.jpg'), 'JPEG', quality=self.quality)
+
+class ExporterRegistry:
+    def __init__(self, entry_point_group: str = EXPORTER_ENTRY_POINT_GROUP):
+        self.entry_point_group = entry_point_group
+        # format -> "modül:sınıf", sınıf/fabrika ya da entry point
+        self._specs: Dict[str, object] = dict(BUILTIN_EXPORTERS)
+        self._instances: Dict[str, Exporter] = {}
+        self._discovered = False
+    
+    def register(self, format_type: str, spec: Union[str, Callable[[], Exporter]]):
+        """Exporter kaydet; spec "modül:sınıf" metni ya da çağrılabilir bir fabrika olabilir"""
+        self._specs[format_type] = spec
+        self._instances.pop(format_type, None)
+    
+    def discover(self):
+        """Kurulu paketlerin entry point'lerini tara (modüller henüz yüklenmez)"""
+        if self._discovered:
+            return
+        self._discovered = True
+        try:
+            entry_points = importlib.metadata.entry_points()
+            if hasattr(entry_points, 'select'):
+                group = entry_points.select(group=self.entry_point_group)
+            else:
+                group = entry_points.get(self.entry_point_group, [])
+            for entry_point in group:
+                self._specs.setdefault(entry_point.name, entry_point)
+        except Exception as e:
+            print(f"Exporter eklenti tarama hatası: {str(e)}")
+    
+    def get(self, format_type: str) -> Optional[Exporter]:
+        """Exporter'ı getir; backend ilk istekte import edilip oluşturulur"""
+        if format_type in self._instances:
+            return self._instances[format_type]
+        
+        self.discover()
+        spec = self._specs.get(format_type)
+        if spec is None:
+            return None
+        
+        try:
+            exporter = self._load(spec)()
+        except Exception as e:
+            print(f"Exporter yükleme hatası ({format_type}): {str(e)}")
+            return None
+        
+        self._instances[format_type] = exporter
+        return exporter
+    
+    def _load(self, spec) -> Callable[[], Exporter]:
+        if isinstance(spec, str):
+            module_name, _, attr = spec.partition(':')
+            return getattr(importlib.import_module(module_name), attr)
+        if isinstance(spec, importlib.metadata.EntryPoint):
+            return spec.load()
+        return spec
+    
+    def get_formats(self) -> List[str]:
+        """Kayıtlı formatları listele"""
+        self.discover()
+        return list(self._specs.keys())
+    
+    def is_loaded(self, format_type: str) -> bool:
+        return format_type in self._instances
+
 class ExportManager:
     def __init__(self):
-        self.exporters = {
-            'pdf': PDFExporter(),
-            'png': PNGExporter()
+        self.registry = ExporterRegistry()
+        self._resolution_checker: Optional['ResolutionChecker'] = None
+        self.render_cache = RenderCache()
+        
+        # Yerleşim geometrisi: A3 sayfa, 3x3 grid, baskı çözünürlüğü
+        self.geometry = PageGeometry(PAGE_FORMATS['A3'], (3, 3))
+        self.dpi = DPI_PRESETS['print']
+        
+        self.substitutes: Dict[str, str] = {}  # düşük çözünürlüklü yol -> yüksek çözünürlüklü yol
+        self.last_preflight: Optional[Dict] = None
+    
+    @property
+    def resolution_checker(self) -> 'ResolutionChecker':
+        # PIL'i sadece ön kontrol gerektiğinde yükle
+        if self._resolution_checker is None:
+            from resolution_checker import ResolutionChecker
+            self._resolution_checker = ResolutionChecker()
+        return self._resolution_checker
+    
+    def register_exporter(self, format_type: str, spec: Union[str, Callable[[], Exporter]]):
+        """Yeni export formatı ekle"""
+        self.registry.register(format_type, spec)
+    
+    def get_formats(self) -> List[str]:
+        """Kullanılabilir export formatlarını listele"""
+        return self.registry.get_formats()
+    
+    def register_substitute(self, image_path: str, replacement_path: str):
+        """Düşük çözünürlüklü görüntü için otomatik kullanılacak alternatifi kaydet"""
+        self.substitutes[image_path] = replacement_path
+    
+    @property
+    def page_format(self) -> PageFormat:
+        return self.geometry.page_format
+    
+    @property
+    def grid_size(self) -> tuple:
+        return self.geometry.grid_size
+    
+    def set_page_format(self, page_format: Union[str, tuple, PageFormat], dpi: Union[int, str, None] = None,
+                        grid_size: Optional[tuple] = None):
+        """Tüm exporter'ların ve ön kontrolün kullanacağı sayfa formatını ayarla"""
+        self.geometry = PageGeometry(
+            page_format, grid_size or self.geometry.grid_size, self.geometry.margin_mm, self.geometry.header_mm
+        )
+        if dpi is not None:
+            self.dpi = resolve_dpi(dpi)
+    
+    def set_grid_size(self, grid_size: tuple):
+        """Sadece yerleşim gridini değiştir; sayfa formatı, kenar boşlukları ve DPI korunur"""
+        self.geometry = self.geometry.with_grid(grid_size)
+    
+    def placed_size_mm(self, part: Part) -> tuple:
+        """Parçanın görüntü kutusunun sayfadaki fiziksel boyutu (mm, döndürme dahil)"""
+        return self.geometry.placement(part).placed_size
+    
+    def preflight(self, project: Project) -> Dict:
+        """Export girdilerini toplarken yerleşik DPI kontrolü yap"""
+        checker = self.resolution_checker
+        
+        # Tek geçişte görüntüleri topla; başlıkları paralel oku
+        parts = [
+            (page_num, part)
+            for page_num, page in enumerate(project.pages)
+            for part in page.get('parts', [])
+            if isinstance(part, Part) and part.image_path
+        ]
+        paths = {part.image_path for _, part in parts}
+        paths.update(self.substitutes[path] for path in list(paths) if path in self.substitutes)
+        
+        with ThreadPoolExecutor() as executor:
+            headers = dict(zip(paths, executor.map(checker.read_header, paths)))
+        
+        plan = {'images': {}, 'parts': [], 'issues': [], 'valid': True}
+        for page_num, part in parts:
+            placement = self.geometry.placement(part)
+            
+            entry = self._check_placement(part.image_path, headers, placement)
+            substitute = self.substitutes.get(part.image_path)
+            if not entry['valid'] and substitute:
+                candidate = self._check_placement(substitute, headers, placement)
+                if candidate['valid'] or candidate['effective_dpi'] > entry['effective_dpi']:
+                    candidate['substituted_for'] = part.image_path
+                    entry = candidate
+            
+            entry.update({'page': page_num, 'part_id': part.id, 'name': part.name})
+            plan['parts'].append(entry)
+            plan['images'][part.id] = entry['image_path'] if 'error' not in entry else None
+            
+            if not entry['valid']:
+                plan['valid'] = False
+                plan['issues'].extend(
+                    f"Sayfa {page_num + 1}, {part.name}: {issue}" for issue in entry['issues']
+                )
+        
+        self.last_preflight = plan
+        return plan
+    
+    def _check_placement(self, image_path: str, headers: Dict, placement: Placement) -> Dict:
+        header = headers[image_path]
+        if 'error' in header:
+            return {
+                'image_path': image_path,
+                'valid': False,
+                'error': header['error'],
+                'effective_dpi': 0.0,
+                'issues': [f"Görüntü okunamadı: {header['error']}"]
+            }
+        
+        # Görüntü döndürülmüş kutuya en-boy oranı korunarak sığdırılır; DPI basılan boyuttan hesaplanır
+        fitted_width, fitted_height = placement.fit(header['size'])
+        placed_mm = (fitted_width * placement.scale, fitted_height * placement.scale)
+        dpi = min(self.resolution_checker.calculate_effective_dpi(header['size'], placed_mm))
+        min_dpi = self.resolution_checker.min_dpi
+        entry = {
+            'image_path': image_path,
+            'valid': dpi >= min_dpi,
+            'effective_dpi': dpi,
+            'placed_size_mm': placed_mm,
+            'issues': []
         }
+        if dpi < min_dpi:
+            entry['issues'].append(f"Etkin DPI düşük: {dpi:.0f} (Minimum: {min_dpi})")
+        return entry
+    
+    def export(self, project: Project, format_type: str, path: str,
+               preflight: bool = True, strict: bool = False, use_cache: bool = True) -> bool:
+        exporter = self.registry.get(format_type)
+        if exporter is None:
+            return False
+        exporter.render_cache = self.render_cache if use_cache else None
+        exporter.configure(dpi=self.dpi, geometry=self.geometry)
+        
+        plan = None
+        if preflight:
+            plan = self.preflight(project)
+            if strict and not plan['valid']:
+                # Render'a başlamadan başarısız ol
+                for issue in plan['issues']:
+                    print(f"Export ön kontrol hatası: {issue}")
+                return False
+        
+        return exporter.export(project, path, plan)
+    
+    def export_multi(self, project: Project, targets: Dict[str, str],
+                     preflight: bool = True, strict: bool = False) -> Dict[str, bool]:
+        """Projeyi tek geçişte birden çok hedefe (pdf, png, thumbnail) aktar"""
+        results = {target: False for target in targets}
+        
+        plan = None
+        if preflight:
+            plan = self.preflight(project)
+            if strict and not plan['valid']:
+                for issue in plan['issues']:
+                    print(f"Export ön kontrol hatası: {issue}")
+                return results
+        
+        try:
+            from PIL import Image
+            
+            sinks: Dict[str, PageSink] = {}
+            for target, path in targets.items():
+                if target == 'pdf':
+                    pdf_exporter = self.registry.get('pdf')
+                    pdf_exporter.configure(dpi=self.dpi, geometry=self.geometry)
+                    sinks[target] = PDFSink(path, pdf_exporter)
+                elif target == 'png':
+                    sinks[target] = PNGSink(path, self.dpi)
+                elif target == 'thumbnail':
+                    sinks[target] = ThumbnailSink(path)
+                else:
+                    print(f"Desteklenmeyen export hedefi: {target}")
+            
+            png_exporter = self.registry.get('png')
+            png_exporter.configure(dpi=self.dpi, geometry=self.geometry)
+            needs_raster = any(sink.needs_raster for sink in sinks.values())
+            
+            # Her görüntünün son kullanıldığı sayfa: sonrasında bellekten atılır
+            last_use = {}
+            for page_num, page in enumerate(project.pages):
+                for part in page.get('parts', []):
+                    if isinstance(part, Part):
+                        image_path = png_exporter._resolve_image(part, plan)
+                        if image_path:
+                            last_use[image_path] = page_num
+            
+            for sink in sinks.values():
+                sink.begin(project)
+            
+            images: Dict[str, 'Image.Image'] = {}
+            for page_num, page in enumerate(project.pages):
+                # Görüntüler tüm hedefler için bir kez çözülür
+                for part in page.get('parts', []):
+                    if not isinstance(part, Part):
+                        continue
+                    image_path = png_exporter._resolve_image(part, plan)
+                    if image_path and image_path not in images and os.path.exists(image_path):
+                        try:
+                            with Image.open(image_path) as img:
+                                img.load()
+                                images[image_path] = img.copy()
+                        except Exception as e:
+                            print(f"Görüntü çözme hatası: {str(e)}")
+                
+                # Raster sayfa bir kez render edilip tüm raster hedeflerine dağıtılır
+                raster = png_exporter.render_page(page, plan, images) if needs_raster else None
+                for sink in sinks.values():
+                    sink.add_page(page_num, page, project, plan, images, raster)
+                
+                for image_path in [path for path, last_page in last_use.items() if last_page == page_num]:
+                    images.pop(image_path, None)
+            
+            for target, sink in sinks.items():
+                results[target] = sink.finish()
+        except Exception as e:
+            print(f"Çoklu export hatası: {str(e)}")
+        
+        return results
     
-    def export(self, project: Project, format_type: str, path: str) -> bool:
-        if format_type in self.exporters:
-            return self.exporters[format_type].export(project, path)
-        return False
\ No newline at end of file
+    def render_preview(self, project: Project, page_num: Optional[int] = None,
+                       dpi: Union[int, str] = 'preview') -> 'Image.Image':
+        """Sayfayı export ile aynı format ve yerleşimle, önizleme çözünürlüğünde render et"""
+        exporter = self.registry.get('png')
+        exporter.configure(dpi=dpi, geometry=self.geometry)
+        page = project.pages[project.current_page if page_num is None else page_num]
+        return exporter.render_page(page)
@@ -0,0 +1,209 @@
+# image_loader.py
+import threading
+from typing import Optional, Tuple
+from PIL import Image
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage
+from tile_pyramid import ImagePyramid, pil_to_qimage
+from sheet_preview import build_thumbnail
+
+
+def reduced_frame(image: Image.Image, draft_size: Tuple[int, int]) -> Optional[int]:
+    """Piramit (çok çözünürlüklü) TIFF'te taslak olarak çözülebilecek küçük sayfanın numarası"""
+    if getattr(image, 'n_frames', 1) < 2:
+        return None
+    width, height = image.size
+    candidates = []
+    try:
+        for frame in range(1, image.n_frames):
+            image.seek(frame)
+            frame_width, frame_height = image.size
+            # Aynı en-boy oranındaki küçültülmüş kopyalar; ilgisiz sayfalar atlanır
+            if frame_width < width and abs(frame_width * height - frame_height * width) <= 0.01 * width * height:
+                candidates.append((frame_width, frame))
+    finally:
+        image.seek(0)
+    if not candidates:
+        return None
+    # Taslak boyutunun yarısını karşılayan en küçük sayfa; yoksa en büyüğü
+    covering = [candidate for candidate in candidates if candidate[0] * 2 >= draft_size[0]]
+    return min(covering)[1] if covering else max(candidates)[1]
+
+
+def quick_draft(image: Image.Image, draft_size: Tuple[int, int]) -> Image.Image:
+    """Çözülmüş görüntüden tamsayı oranlı hızlı küçültmeyle taslak"""
+    factor = max(1, min(image.width // draft_size[0], image.height // draft_size[1]))
+    return image.reduce(factor) if factor > 1 else image
+
+
+class ImageLoadSignals(QObject):
+    draft = Signal(int, str, object)   # istek no, dosya yolu, düşük çözünürlüklü QImage
+    loaded = Signal(int, str, object, object)  # istek no, dosya yolu, QImage, ImagePyramid
+    failed = Signal(int, str, str)     # istek no, dosya yolu, hata mesajı
+    thumbnail = Signal(object, object)  # küçük resim anahtarı, PIL görüntüsü (ya da None)
+
+
+class ThumbnailTask(QRunnable):
+    """Sayfa önizlemesi için parça küçük resmini GUI thread'i dışında çöz"""
+
+    def __init__(self, thumbnail_key: tuple, signals: ImageLoadSignals):
+        super().__init__()
+        self.thumbnail_key = thumbnail_key
+        self.signals = signals
+
+    def run(self):
+        self.signals.thumbnail.emit(self.thumbnail_key, build_thumbnail(self.thumbnail_key))
+
+
+class ImageLoadTask(QRunnable):
+    def __init__(self, request_id: int, image_path: str, max_size: Tuple[int, int],
+                 draft_size: Tuple[int, int], signals: ImageLoadSignals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.request_id = request_id
+        self.image_path = image_path
+        self.max_size = max_size
+        self.draft_size = draft_size
+        self.signals = signals
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+
+    def cancel(self):
+        """Yüklemeyi iptal et (bir sonraki aşama başlamadan durur)"""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self):
+        """Önce hızlı bir taslak, ardından karo piramidini üret"""
+        try:
+            if self.cancelled:
+                return
+            full_image = self._load_draft()
+            if self.cancelled:
+                return
+
+            if full_image is None:
+                # Çözülmüş görüntü kopyalanmadan kullanılır; dosya load() sonrası kapanır
+                with Image.open(self.image_path) as image:
+                    image.load()
+                    full_image = image
+                if self.cancelled:
+                    return
+
+            # Yakınlaştırma için tam çözünürlükten mip seviyeleri
+            pyramid = ImagePyramid(full_image)
+            if self.cancelled:
+                return
+            preview = pil_to_qimage(pyramid.fit_level(self.max_size))
+            self.signals.loaded.emit(self.request_id, self.image_path, preview, pyramid)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.request_id, self.image_path, str(e))
+        finally:
+            self.done_event.set()
+
+    def _load_draft(self) -> Optional[Image.Image]:
+        """Taslağı gönder; draft() desteklemeyen formatlarda tam çözülmüş görüntüyü de döndür"""
+        with Image.open(self.image_path) as image:
+            # JPEG'de 1/2, 1/4, 1/8 ölçekli çözme: tam görüntü hiç açılmaz
+            if image.draft('RGB', self.draft_size) is not None:
+                image.thumbnail(self.draft_size, Image.Resampling.NEAREST)
+                self.signals.draft.emit(self.request_id, self.image_path, pil_to_qimage(image))
+                return None
+
+            # Piramit TIFF'in küçük sayfası tam çözümden önce gösterilir
+            frame = reduced_frame(image, self.draft_size)
+            if frame is not None:
+                image.seek(frame)
+                self._emit_draft(quick_draft(image, self.draft_size))
+                image.seek(0)
+                if self.cancelled:
+                    return None
+
+            # Diğerlerinde taslak tam çözümden hemen sonra, piramit kurulmadan gönderilir;
+            # çözülen görüntü kopyalanmadan kullanılır
+            image.load()
+            if frame is None:
+                self._emit_draft(quick_draft(image, self.draft_size))
+            return image
+
+    def _emit_draft(self, draft: Image.Image):
+        if not self.cancelled:
+            self.signals.draft.emit(self.request_id, self.image_path, pil_to_qimage(draft))
+
+
+class ImageLoader(QObject):
+    draft_ready = Signal(str, object)   # dosya yolu, taslak QImage
+    image_loaded = Signal(str, object, object)  # dosya yolu, QImage, ImagePyramid
+    load_failed = Signal(str, str)      # dosya yolu, hata mesajı
+    thumbnail_ready = Signal(object, object)  # küçük resim anahtarı, PIL görüntüsü (ya da None)
+
+    def __init__(self, max_size: Tuple[int, int] = (2480, 3508),
+                 draft_size: Tuple[int, int] = (620, 877), parent=None):
+        super().__init__(parent)
+        self.max_size = max_size      # 300 DPI'da A4
+        self.draft_size = draft_size  # ~75 DPI'da A4
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self._request_id = 0
+        self._current_task: Optional[ImageLoadTask] = None
+        self._running_tasks = set()  # iptal edilse de run() bitene kadar referans tutulur
+        self._pending_thumbnails = set()  # aynı küçük resim iki kez kuyruğa alınmaz
+
+        self.signals = ImageLoadSignals()
+        self.signals.draft.connect(self._on_draft)
+        self.signals.loaded.connect(self._on_loaded)
+        self.signals.failed.connect(self._on_failed)
+        self.signals.thumbnail.connect(self._on_thumbnail)
+
+    def load(self, image_path: str) -> int:
+        """Görüntüyü arka planda yükle, önceki yüklemeyi iptal et"""
+        self.cancel()
+        self._running_tasks = {task for task in self._running_tasks if not task.done_event.is_set()}
+        self._request_id += 1
+        self._current_task = ImageLoadTask(
+            self._request_id, image_path, self.max_size, self.draft_size, self.signals
+        )
+        self._running_tasks.add(self._current_task)
+        self.pool.start(self._current_task)
+        return self._request_id
+
+    def load_thumbnail(self, thumbnail_key: tuple):
+        """Önizleme küçük resmini arka planda hazırla; bitince thumbnail_ready yayınlanır"""
+        if thumbnail_key in self._pending_thumbnails:
+            return
+        self._pending_thumbnails.add(thumbnail_key)
+        self.pool.start(ThumbnailTask(thumbnail_key, self.signals))
+
+    def _on_thumbnail(self, thumbnail_key: tuple, image):
+        self._pending_thumbnails.discard(thumbnail_key)
+        self.thumbnail_ready.emit(thumbnail_key, image)
+
+    def cancel(self):
+        """Süren yüklemeyi iptal et; henüz başlamadıysa kuyruktan çıkar"""
+        if self._current_task is not None:
+            self._current_task.cancel()
+            if self.pool.tryTake(self._current_task):
+                self._running_tasks.discard(self._current_task)
+            self._current_task = None
+
+    def _is_current(self, request_id: int) -> bool:
+        return self._current_task is not None and request_id == self._request_id
+
+    def _on_draft(self, request_id: int, image_path: str, qimage: QImage):
+        if self._is_current(request_id):
+            self.draft_ready.emit(image_path, qimage)
+
+    def _on_loaded(self, request_id: int, image_path: str, qimage: QImage, pyramid: ImagePyramid):
+        # Sadece en son isteğin sonucunu ilet, eskileri yok say
+        if self._is_current(request_id):
+            self._current_task = None
+            self.image_loaded.emit(image_path, qimage, pyramid)
+
+    def _on_failed(self, request_id: int, image_path: str, message: str):
+        if self._is_current(request_id):
+            self._current_task = None
+            self.load_failed.emit(image_path, message)
@@ -1,122 +1,333 @@
 # language_system.py
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+import atexit
 import json
 import os
+import pickle
+import sys
+import threading
+
+# Derlenmiş katalog: dil başına düz {anahtar: metin} sözlüğünün pickle'ı; dilin asıl kaynağıdır
+CATALOG_EXTENSION = ".catalog"
+
+
+# Yerleşik tablolar modül yüklenirken kurulmaz; sadece dilin kataloğu yoksa ya da eskimişse
+# çağrılır ve sonuç kataloğa yazılır
+def _builtin_tr() -> Dict[str, str]:
+    """Yerleşik Türkçe tablo"""
+    return {
+        # Menü
+        'new_project': 'Yeni Proje',
+        'save': 'Kaydet',
+        'save_as': 'Farklı Kaydet',
+        'export': 'Dışa Aktar',
+        'import': 'İçe Akta',
+        'close': 'Kapat',
+        
+        # Düzenleme
+        'undo': 'Geri Al',
+        'redo': 'İleri Al',
+        'cut': 'Kes',
+        'copy': 'Kopyala',
+        'paste': 'Yapıştır',
+        'delete': 'Sil',
+        
+        # Parça Tipleri
+        'front_view': 'Ön Görünüş',
+        'side_view': 'Yan Görünüş',
+        'top_view': 'Üst Görünüş',
+        'detail': 'Detay',
+        'section': 'Kesit',
+        
+        # Hata Mesajları
+        'error_save': 'Kaydetme hatası!',
+        'error_load': 'Yükleme hatası!',
+        'error_export': 'Dışa aktarma hatası!'
+    }
+
+
+def _builtin_en() -> Dict[str, str]:
+    """Yerleşik İngilizce tablo"""
+    return {
+        # Menu
+        'new_project': 'New Project',
+        'save': 'Save',
+        'save_as': 'Save As',
+        'export': 'Export',
+        'import': 'Import',
+        'close': 'Close',
+        
+        # Editing
+        'undo': 'Undo',
+        'redo': 'Redo',
+        'cut': 'Cut',
+        'copy': 'Copy',
+        'paste': 'Paste',
+        'delete': 'Delete',
+        
+        # Part Types
+        'front_view': 'Front View',
+        'side_view': 'Side View',
+        'top_view': 'Top View',
+        'detail': 'Detail',
+        'section': 'Section',
+        
+        # Error Messages
+        'error_save': 'Save error!',
+        'error_load': 'Load error!',
+        'error_export': 'Export error!'
+    }
+
+
+BUILTIN_LANGUAGES: Dict[str, Callable[[], Dict[str, str]]] = {
+    'TR': _builtin_tr,
+    'EN': _builtin_en
+}
+
 
 class LanguageManager:
-    def __init__(self):
+    def __init__(self, save_delay: float = 1.0):
         self.current_lang = 'TR'
         self.languages_path = "languages/"
         os.makedirs(self.languages_path, exist_ok=True)
         
-        self.translations = {
-            'TR': {
-                # Menü
-                'new_project': 'Yeni Proje',
-                'save': 'Kaydet',
-                'save_as': 'Farklı Kaydet',
-                'export': 'Dışa Aktar',
-                'import': 'İçe Akta',
-                'close': 'Kapat',
-                
-                # Düzenleme
-                'undo': 'Geri Al',
-                'redo': 'İleri Al',
-                'cut': 'Kes',
-                'copy': 'Kopyala',
-                'paste': 'Yapıştır',
-                'delete': 'Sil',
-                
-                # Parça Tipleri
-                'front_view': 'Ön Görünüş',
-                'side_view': 'Yan Görünüş',
-                'top_view': 'Üst Görünüş',
-                'detail': 'Detay',
-                'section': 'Kesit',
-                
-                # Hata Mesajları
-                'error_save': 'Kaydetme hatası!',
-                'error_load': 'Yükleme hatası!',
-                'error_export': 'Dışa aktarma hatası!'
-            },
-            'EN': {
-                # Menu
-                'new_project': 'New Project',
-                'save': 'Save',
-                'save_as': 'Save As',
-                'export': 'Export',
-                'import': 'Import',
-                'close': 'Close',
-                
-                # Editing
-                'undo': 'Undo',
-                'redo': 'Redo',
-                'cut': 'Cut',
-                'copy': 'Copy',
-                'paste': 'Paste',
-                'delete': 'Delete',
-                
-                # Part Types
-                'front_view': 'Front View',
-                'side_view': 'Side View',
-                'top_view': 'Top View',
-                'detail': 'Detail',
-                'section': 'Section',
-                
-                # Error Messages
-                'error_save': 'Save error!',
-                'error_load': 'Load error!',
-                'error_export': 'Export error!'
-            }
-        }
+        # Sadece kullanılan diller yüklenir: dil -> düz çeviri tablosu
+        self.translations: Dict[str, Dict[str, str]] = {}
+        # Sadece kullanıcı çevirileri (yerleşiklerin üstüne bindirilen katman) kaydedilir
+        self._custom_translations: Optional[Dict[str, Dict[str, str]]] = None
         
-        self._load_custom_translations()
+        # Ardışık eklemeler tek yazmada birleştirilir
+        self.save_delay = save_delay
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        atexit.register(self.flush)
+        
+        # Tablo ve özel çeviri dosyası ilk get_text çağrısında okunur
+        self._lookup: Callable[[str, str], str] = self._first_lookup
     
     def get_text(self, key: str, default: Optional[str] = None) -> str:
         """Belirtilen anahtarın çevirisini döndür"""
-        return self.translations[self.current_lang].get(key, default or key)
+        return self._lookup(key, default or key)
+    
+    def translator(self) -> Callable[[str, str], str]:
+        """Aktif dilin tablosuna bağlı hızlı arama fonksiyonu (toplu etiketleme için)"""
+        if self._lookup == self._first_lookup:
+            self._lookup = self._make_lookup(self.current_lang)
+        return self._lookup
+    
+    def _first_lookup(self, key: str, default: str) -> str:
+        # Gerçek arama fonksiyonunu kur ve kendini onunla değiştir
+        self._lookup = self._make_lookup(self.current_lang)
+        return self._lookup(key, default)
     
     def change_language(self, lang: str) -> bool:
         """Dili değiştir"""
-        if lang in self.translations:
-            self.current_lang = lang
-            return True
-        return False
+        if lang not in self.get_available_languages():
+            return False
+        self._lookup = self._make_lookup(lang)
+        self.current_lang = lang
+        return True
     
     def get_available_languages(self) -> list:
         """Mevcut dilleri listele"""
-        return list(self.translations.keys())
+        languages = list(BUILTIN_LANGUAGES)
+        try:
+            for filename in sorted(os.listdir(self.languages_path)):
+                lang, extension = os.path.splitext(filename)
+                if extension == CATALOG_EXTENSION and lang not in languages:
+                    languages.append(lang)
+        except OSError:
+            pass
+        for lang in list(self.translations) + list(self._get_custom_translations()):
+            if lang not in languages:
+                languages.append(lang)
+        return languages
     
     def add_translation(self, lang: str, translations: Dict[str, str]) -> bool:
         """Yeni dil veya çeviri ekle"""
+        return self.update_translations({lang: translations})
+    
+    def update_translations(self, updates: Dict[str, Dict[str, str]]) -> bool:
+        """Birden çok dile toplu çeviri ekle; dosyaya bir kez yazılır"""
         try:
-            if lang not in self.translations:
-                self.translations[lang] = {}
-            self.translations[lang].update(translations)
-            self._save_custom_translations()
+            with self._save_lock:
+                custom_translations = self._get_custom_translations()
+                for lang, translations in updates.items():
+                    # Katman aramada okunur; aktif dilin arama fonksiyonu aynı sözlüğü görür
+                    custom_translations.setdefault(lang, {}).update(
+                        (sys.intern(key), value) for key, value in translations.items()
+                    )
+                self._dirty = True
+            self._schedule_save()
             return True
         except:
             return False
     
-    def _load_custom_translations(self):
-        """Özel çevirileri yükle"""
+    @contextmanager
+    def batch_updates(self):
+        """Blok içindeki tüm eklemeleri blok sonunda tek seferde kaydet"""
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                finished = self._batch_depth == 0
+            if finished:
+                self.flush()
+    
+    def _catalog_path(self, lang: str) -> str:
+        return os.path.join(self.languages_path, f"{lang}{CATALOG_EXTENSION}")
+    
+    def _make_lookup(self, lang: str) -> Callable[[str, str], str]:
+        """Dilin arama fonksiyonu: önce özel çeviri katmanı, sonra dil tablosu"""
+        table = self._load_language(lang)
+        custom = self._get_custom_translations().setdefault(lang, {})
+        self._prune_custom(table, custom)
+        table_get = table.get
+        custom_get = custom.get
+        
+        def lookup(key: str, default: str) -> str:
+            value = custom_get(key)
+            return table_get(key, default) if value is None else value
+        return lookup
+    
+    def _load_language(self, lang: str) -> Dict[str, str]:
+        """Dil tablosunu ilk kullanımda kataloğundan yükle; katalog yoksa yerleşik tablodan derle"""
+        table = self.translations.get(lang)
+        if table is not None:
+            return table
+        
+        table = self._read_catalog(lang)
+        if table is None:
+            builder = BUILTIN_LANGUAGES.get(lang)
+            table = builder() if builder else {}
+            if builder:
+                # Sonraki açılışlar katalogdan yüklenir
+                self.compile_catalog(lang, table)
+        
+        # Anahtarlar intern edilir; arayüzdeki sabit anahtarlarla karşılaştırma kimlik üzerinden olur
+        table = {sys.intern(key): value for key, value in table.items()}
+        self.translations[lang] = table
+        return table
+    
+    def _read_catalog(self, lang: str) -> Optional[Dict[str, str]]:
+        """Dilin kataloğunu oku; yoksa, okunamıyorsa ya da yerleşik tablodan eskiyse None"""
+        catalog_file = self._catalog_path(lang)
+        try:
+            catalog_mtime = os.stat(catalog_file).st_mtime_ns
+        except OSError:
+            return None
+        # Yerleşik tablolar bu dosyada; dosya katalogdan yeniyse katalog yeniden derlenir
+        if lang in BUILTIN_LANGUAGES and catalog_mtime < os.stat(__file__).st_mtime_ns:
+            return None
+        try:
+            with open(catalog_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Dil kataloğu yükleme hatası: {str(e)}")
+            return None
+    
+    def compile_catalog(self, lang: str, translations: Optional[Dict[str, str]] = None) -> bool:
+        """Dilin tablosunu hızlı yüklenen katalog dosyasına yaz (özel çeviriler katılmaz)
+
+        translations verilmezse yerleşik tablo derlenir; yerleşik olmayan diller tablolarıyla eklenir.
+        """
+        if translations is None:
+            builder = BUILTIN_LANGUAGES.get(lang)
+            if builder is None:
+                print(f"Dil kataloğu derleme hatası: {lang} için çeviri tablosu yok")
+                return False
+            translations = builder()
+        try:
+            catalog_file = self._catalog_path(lang)
+            temp_file = catalog_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump(dict(translations), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, catalog_file)
+            # Yüklü tablo bir sonraki kullanımda yeni katalogdan okunur
+            if self.translations.pop(lang, None) is not None and lang == self.current_lang:
+                self._lookup = self._first_lookup
+            return True
+        except Exception as e:
+            print(f"Dil kataloğu derleme hatası: {str(e)}")
+            return False
+    
+    def _get_custom_translations(self) -> Dict[str, Dict[str, str]]:
+        if self._custom_translations is None:
+            self._custom_translations = self._load_custom_translations()
+        return self._custom_translations
+    
+    def _prune_custom(self, table: Dict[str, str], custom: Dict[str, str]):
+        # Eski sürümler yerleşik tabloların tamamını özel çeviri dosyasına yazıyordu; dil
+        # tablosuyla aynı olan kopyalar sonradan düzeltilen metinleri gizlemesin
+        with self._save_lock:
+            stale = [key for key, value in custom.items() if table.get(key) == value]
+            for key in stale:
+                del custom[key]
+            if stale:
+                # Budanmış dosya bir sonraki kayıtta yazılır
+                self._dirty = True
+    
+    def _load_custom_translations(self) -> Dict[str, Dict[str, str]]:
+        """Özel çevirileri yükle (dil tablosuyla aynı girdiler dil ilk yüklendiğinde atılır)"""
         try:
             custom_file = os.path.join(self.languages_path, "custom_translations.json")
             if os.path.exists(custom_file):
                 with open(custom_file, 'r', encoding='utf-8') as f:
                     custom_translations = json.load(f)
-                    for lang, trans in custom_translations.items():
-                        if lang not in self.translations:
-                            self.translations[lang] = {}
-                        self.translations[lang].update(trans)
+            else:
+                return {}
         except Exception as e:
             print(f"Özel çeviri yükleme hatası: {str(e)}")
+            return {}
+        return {
+            lang: {sys.intern(key): value for key, value in translations.items()}
+            for lang, translations in custom_translations.items()
+            if translations
+        }
+    
+    def _schedule_save(self):
+        """Kaydı save_delay saniye ertele; bu sürede gelen eklemeler aynı yazmaya katılır"""
+        with self._save_lock:
+            if self._batch_depth:
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """Bekleyen özel çevirileri hemen kaydet"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            if self._save_custom_translations():
+                self._dirty = False
+                return True
+            return False
     
-    def _save_custom_translations(self):
+    def _save_custom_translations(self) -> bool:
         """Özel çevirileri kaydet"""
         try:
             custom_file = os.path.join(self.languages_path, "custom_translations.json")
-            with open(custom_file, 'w', encoding='utf-8') as f:
-                json.dump(self.translations, f, ensure_ascii=False, indent=4)
+            temp_file = custom_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {lang: translations for lang, translations in self._get_custom_translations().items() if translations},
+                    f, ensure_ascii=False
+                )
+            # Yarım yazılmış dosya okunmasın
+            os.replace(temp_file, custom_file)
+            return True
         except Exception as e:
-            print(f"Özel çeviri kaydetme hatası: {str(e)}")
\ No newline at end of file
+            print(f"Özel çeviri kaydetme hatası: {str(e)}")
+            return False
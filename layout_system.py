@@ -1,6 +1,7 @@
 # layout_system.py
 from typing import List, Tuple, Optional, Dict
 from data_structures import Part, PartType
+from template_layout import CompiledLayout
 import numpy as np
 
 class Grid:
@@ -59,8 +60,8 @@ class Grid:
         return False
 
 class LayoutManager:
-    def __init__(self):
-        self.grid = Grid()
+    def __init__(self, rows: int = 3, cols: int = 3):
+        self.grid = Grid(rows, cols)
         self.default_sizes = {
             PartType.FRONT_VIEW: (2, 2),
             PartType.SIDE_VIEW: (1, 2),
@@ -72,11 +73,45 @@ class LayoutManager:
             PartType.ASSEMBLY: (2, 2),
             PartType.PARTS_LIST: (1, 2)
         }
+        # Son uygulanan şablonda yuvası olan parçalar: part_id -> yuvanın (genişlik, yükseklik)
+        self.slot_sizes: Dict[str, Tuple[int, int]] = {}
+
+    def set_grid_size(self, rows: int, cols: int) -> List[Part]:
+        """Yeni boyutta grid oluştur; sığan parçalar yerinde kalır, sığmayanlar döndürülür"""
+        parts = list(self.grid.parts.values())
+        self.grid = Grid(rows, cols)
+        dropped = []
+        for part in parts:
+            if part.position is None or not self.grid.place_part(part, part.position):
+                dropped.append(part)
+        return dropped
+
+    def apply_template(self, layout: CompiledLayout, parts: List[Part]) -> bool:
+        """Şablon yuvası olan parçaları doğrudan yerleştir, kalanları boş hücrelere paketle
+
+        Yuvaya yerleşen parçanın boyutu yuvanınki olur (slot_sizes'ta da tutulur); kalanlar
+        kendi boyutlarıyla paketlenir. Tüm parçalar yerleştiyse True.
+        """
+        self.grid = Grid(*layout.grid_size)
+        self.slot_sizes = {}
+        leftovers = []
+        for part, slot in zip(parts, layout.assign([part.type for part in parts])):
+            if slot is None:
+                leftovers.append(part)
+                continue
+            # Yuvalar derlenirken çakışma ve sınır kontrolü yapıldı
+            position, part.size = slot
+            self.slot_sizes[part.id] = part.size
+            self.grid.place_part(part, position)
+        return self._pack(leftovers)
 
     def auto_layout(self, parts: List[Part]) -> bool:
         # Grid'i temizle
-        self.grid = Grid()
-        
+        self.grid = Grid(self.grid.rows, self.grid.cols)
+        self.slot_sizes = {}
+        return self._pack(parts)
+
+    def _pack(self, parts: List[Part]) -> bool:
         # Parçaları boyutlarına göre sırala (büyükten küçüğe)
         sorted_parts = sorted(
             parts,
@@ -84,7 +119,8 @@ class LayoutManager:
             reverse=True
         )
         
-        # Her parça için uygun pozisyon bul
+        # Her parça için uygun pozisyon bul; sığmayan parça sonrakileri engellemez
+        all_placed = True
         for part in sorted_parts:
             placed = False
             for row in range(self.grid.rows):
@@ -95,15 +131,15 @@ class LayoutManager:
                 if placed:
                     break
             if not placed:
-                return False
-        return True
+                all_placed = False
+        return all_placed
 
     def optimize_layout(self, parts: List[Part]) -> Optional[Dict[str, Tuple[int, int]]]:
         best_layout = None
         best_score = float('-inf')
         
         for _ in range(100):  # 100 farklı deneme
-            self.grid = Grid()
+            self.grid = Grid(self.grid.rows, self.grid.cols)
             shuffled_parts = parts.copy()
             np.random.shuffle(shuffled_parts)
             
@@ -1,29 +1,29 @@
 import sys
+import copy
 import json
 import os
-from PIL import Image
-import io
+import itertools
 from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
 from data_structures import *
 from export_system import ExportManager
-from layout_system import LayoutManager
+import layout_system
 from optimization_engine import LayoutOptimizer
 from project_manager import ProjectManager
-from template_manager import TemplateManager
-from template_system import Template
+from template_system import TemplateManager
 from language_system import LanguageManager
 from part_detail_manager import PartDetailManager
 from security_manager import SecurityManager
 from version_control import VersionControl
-from resolution_checker import ResolutionChecker
-from ai_exporter import AIExporter
+from image_loader import ImageLoader
+from tile_pyramid import pil_to_qimage
+from sheet_preview import SheetPreview
 
 
+# Sürüklenen sayfa görüntüsünün tüm grid'i kaplayan parçası
+PAGE_IMAGE_PART_ID = 'page_image'
+
 class PreviewArea(QLabel):
     image_dropped = Signal(str)
     
@@ -46,7 +46,89 @@ class PreviewArea(QLabel):
         self.part_group_manager = PartGroupManager()
         self.collision_manager = CollisionManager()
         self.layout_optimizer = LayoutOptimizer(self.layout_manager)
-        self.project_manager = ProjectManager()
+        
+        # Karo piramidi ile yakınlaştırma ve kaydırma
+        self.pyramid = None
+        self.pan_offset = QPointF(0, 0)
+        self._drag_start = None
+        
+        # Yerleşim grid'inden birleştirilmiş sayfa önizlemesi
+        self.sheet = None
+        
+    def set_sheet(self, image, boxes=None):
+        # boxes verilirse sadece değişen alanlar pixmap'e yeniden aktarılır
+        if image is None:
+            self.sheet = None
+        elif self.sheet is None or boxes is None or self.sheet.size() != QSize(*image.size):
+            self.sheet = QPixmap.fromImage(pil_to_qimage(image))
+        else:
+            painter = QPainter(self.sheet)
+            for box in boxes:
+                if box[2] > box[0] and box[3] > box[1]:
+                    painter.drawImage(box[0], box[1], pil_to_qimage(image.crop(box)))
+            painter.end()
+        if self.sheet is not None:
+            self.setPixmap(QPixmap())
+        self.update()
+        
+    def set_pyramid(self, pyramid):
+        self.pyramid = pyramid
+        self.pan_offset = QPointF(0, 0)
+        if pyramid is not None:
+            self.setPixmap(QPixmap())
+        self.update()
+        
+    def set_zoom(self, zoom_factor):
+        self.zoom_factor = zoom_factor
+        self.update()
+        
+    def reset_view(self):
+        self.pan_offset = QPointF(0, 0)
+        self.update()
+        
+    def image_rect(self):
+        # Görüntünün widget koordinatlarında kapladığı alan
+        if self.sheet is not None:
+            width, height = self.sheet.width(), self.sheet.height()
+        else:
+            width, height = self.pyramid.size
+        scale = min(self.width() / width, self.height() / height) * self.zoom_factor
+        center = QPointF(self.rect().center()) + self.pan_offset
+        return QRectF(
+            center.x() - width * scale / 2,
+            center.y() - height * scale / 2,
+            width * scale,
+            height * scale
+        )
+        
+    def paintEvent(self, event):
+        if self.pyramid is None and self.sheet is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), Qt.white)
+        if self.sheet is not None:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawPixmap(self.image_rect(), self.sheet, QRectF(self.sheet.rect()))
+        else:
+            self.pyramid.draw(painter, self.image_rect(), QRectF(event.rect()))
+        painter.end()
+        
+    def mousePressEvent(self, event):
+        if (self.pyramid is not None or self.sheet is not None) and event.button() == Qt.LeftButton:
+            self._drag_start = event.position()
+        super().mousePressEvent(event)
+        
+    def mouseMoveEvent(self, event):
+        if self._drag_start is not None:
+            self.pan_offset += event.position() - self._drag_start
+            self._drag_start = event.position()
+            self.update()
+        super().mouseMoveEvent(event)
+        
+    def mouseReleaseEvent(self, event):
+        self._drag_start = None
+        super().mouseReleaseEvent(event)
         
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -60,65 +142,93 @@ class PreviewArea(QLabel):
             if file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
                 self.image_dropped.emit(file_path)
                 break
-class ExportManager:
-    def __init__(self):
-        self.exporters = {
-            'pdf': PDFExporter(),
-            'png': PNGExporter()
-        }
+class LayoutGridView(QGraphicsView):
+    cell_clicked = Signal(int, int)
+    CELL_SIZE = 40  # sahne biriminde hücre boyutu
     
-    def export(self, data, format_type, path):
-        if format_type in self.exporters:
-            return self.exporters[format_type].export(data, path)
-        return False
-
-class PDFExporter:
-    def export(self, data, path):
-        try:
-            # PDF oluştur
-            c = canvas.Canvas(path, pagesize=A4)
-            
-            # Her sayfa için
-            for page_num, page_data in enumerate(data['pages']):
-                if page_num > 0:
-                    c.showPage()  # Yeni sayfa
-                
-                # Sayfa başlığı
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(20*mm, 280*mm, f"Ürün: {page_data.get('urun_adi', '')}")
-                c.drawString(20*mm, 273*mm, f"Kod: {page_data.get('urun_kodu', '')}")
-                c.drawString(20*mm, 266*mm, f"Seri: {page_data.get('seri', '')}")
-                
-                # Çizgi çek
-                c.line(20*mm, 263*mm, 190*mm, 263*mm)
-                
-                # Görüntü varsa ekle
-                if 'image' in page_data:
-                    img_path = page_data['image']
-                    c.drawImage(img_path, 20*mm, 50*mm, width=170*mm, height=170*mm, preserveAspectRatio=True)
-                
-                # Sayfa numarası
-                c.setFont("Helvetica", 10)
-                c.drawString(100*mm, 10*mm, f"Sayfa {page_num + 1} / {len(data['pages'])}")
+    def __init__(self, rows=3, cols=3):
+        super().__init__()
+        self.setScene(QGraphicsScene(self))
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMinimumSize(200, 200)
+        self.setStyleSheet("border: none; background-color: #333333;")
+        
+        # parça adı -> (dikdörtgen, sahne nesnesi)
+        self.part_items = {}
+        self.set_grid_size(rows, cols)
+        
+    def set_grid_size(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.scene().clear()
+        self.part_items = {}
+        self.scene().setSceneRect(0, 0, cols * self.CELL_SIZE, rows * self.CELL_SIZE)
+        self.fit_grid()
+        
+    def rows_cols(self):
+        return (self.rows, self.cols)
+        
+    def fit_grid(self):
+        self.fitInView(self.sceneRect(), Qt.KeepAspectRatio)
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fit_grid()
+        
+    def drawBackground(self, painter, rect):
+        # Hücreler nesne değil, arka plan çizgisi; sadece görünen alan çizilir
+        painter.fillRect(rect, QColor('#333333'))
+        painter.fillRect(self.sceneRect(), QColor('#444444'))
+        pen = QPen(QColor('#555555'))
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        size = self.CELL_SIZE
+        for i in range(self.rows + 1):
+            painter.drawLine(QLineF(0, i * size, self.cols * size, i * size))
+        for j in range(self.cols + 1):
+            painter.drawLine(QLineF(j * size, 0, j * size, self.rows * size))
+        
+    def set_parts(self, parts):
+        # parts: parça adı -> (satır, sütun, genişlik, yükseklik); sadece değişenler güncellenir
+        for name in list(self.part_items):
+            if name not in parts:
+                self.scene().removeItem(self.part_items.pop(name)[1])
+        
+        size = self.CELL_SIZE
+        for name, rect in parts.items():
+            if name in self.part_items and self.part_items[name][0] == rect:
+                continue
+            if name in self.part_items:
+                self.scene().removeItem(self.part_items.pop(name)[1])
             
-            c.save()
-            return True
+            row, col, width, height = rect
+            item = QGraphicsRectItem(col * size + 1, row * size + 1, width * size - 2, height * size - 2)
+            item.setBrush(QColor('#2196F3'))
+            pen = QPen(QColor('#1976D2'))
+            pen.setCosmetic(True)
+            item.setPen(pen)
+            item.setFlag(QGraphicsItem.ItemClipsChildrenToShape)
             
-        except Exception as e:
-            print(f"PDF export hatası: {str(e)}")
-            return False
-
-class PNGExporter:
-    def export(self, data, path):
-        try:
-            if 'current_image' in data and data['current_image']:
-                data['current_image'].save(path, 'PNG')
-                return True
-            return False
+            label = QGraphicsSimpleTextItem(name, item)
+            font = label.font()
+            font.setPixelSize(8)
+            label.setFont(font)
+            label.setBrush(QColor('white'))
+            label.setPos(col * size + 3, row * size + 3)
             
-        except Exception as e:
-            print(f"PNG export hatası: {str(e)}")
-            return False
+            self.scene().addItem(item)
+            self.part_items[name] = (rect, item)
+        
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            pos = self.mapToScene(event.position().toPoint())
+            row = int(pos.y() // self.CELL_SIZE)
+            col = int(pos.x() // self.CELL_SIZE)
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                self.cell_clicked.emit(row, col)
+        super().mousePressEvent(event)
 
 class PartGroup:
     def __init__(self, name, parts=None):
@@ -207,7 +317,8 @@ class LayoutOptimizer:
     def generate_layouts(self, parts):
         # Tüm olası yerleşimleri üret
         layouts = []
-        positions = [(i, j) for i in range(3) for j in range(3)]
+        rows, cols = self.layout_manager.grid_size
+        positions = [(i, j) for i in range(rows) for j in range(cols)]
         
         for perm in itertools.permutations(parts):
             layout = {}
@@ -258,74 +369,16 @@ class LayoutOptimizer:
         # Görsel dengeyi değerlendir
         pass
 
-class ProjectManager:
-    def __init__(self):
-        self.current_project = None
-        self.autosave_interval = 300  # 5 dakika
-        
-    def save_project(self, filename):
-        project_data = {
-            'metadata': {
-                'version': '1.0',
-                'date': datetime.now().isoformat(),
-                'author': getpass.getuser()
-            },
-            'pages': self.pages,
-            'layout': self.layout_manager.serialize(),
-            'groups': self.part_group_manager.serialize(),
-            'settings': self.get_project_settings()
-        }
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, ensure_ascii=False, indent=4)
-            return True
-        except Exception as e:
-            self.log_error(f"Proje kaydedilemedi: {str(e)}")
-            return False
-
-    def validate_project_version(self, version):
-        try:
-            major, minor = map(int, version.split('.'))
-            return major == 1 and minor >= 0
-        except:
-            return False
-    
-    def load_project(self, filename):
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
-                
-            # Versiyon kontrolü
-            if self.validate_project_version(project_data['metadata']['version']):
-                self.pages = project_data['pages']
-                self.layout_manager.deserialize(project_data['layout'])
-                self.part_group_manager.deserialize(project_data['groups'])
-                self.apply_project_settings(project_data['settings'])
-                return True
-        except Exception as e:
-            self.log_error(f"Proje yüklenemedi: {str(e)}")
-            return False
-    
-    def autosave(self):
-        if self.current_project:
-            autosave_file = f"autosave/{self.current_project}_autosave.json"
-            self.save_project(autosave_file)
-    
-    def recover_autosave(self):
-        # En son otomatik kaydedilen dosyayı bul ve yükle
-        autosave_files = glob.glob("autosave/*_autosave.json")
-        if autosave_files:
-            latest_autosave = max(autosave_files, key=os.path.getmtime)
-            return self.load_project(latest_autosave)
-        return False
+# Arayüzdeki parça adı ("Ön Görünüş") -> parça tipi
+PART_TYPES_BY_VALUE = {part_type.value: part_type for part_type in PartType}
 
 class LayoutManager:
-    def __init__(self):
-        self.grid_size = (3, 3)  # 3x3 grid
-        self.cells = [[None for _ in range(3)] for _ in range(3)]
+    def __init__(self, grid_size=(3, 3)):
+        self.grid_size = tuple(grid_size)  # (satır, sütun)
+        self.cells = [[None for _ in range(self.grid_size[1])] for _ in range(self.grid_size[0])]
         self.part_rotations = {}  # Parça rotasyonlarını sakla
         self.part_scales = {}     # Parça ölçeklerini sakla
+        self.slot_sizes = {}      # Şablon yuvasından gelen (genişlik, yükseklik); varsayılan boyutun yerine geçer
         self.part_sizes = {
             "Ön Görünüş": {
                 "default": (2, 2),
@@ -374,24 +427,54 @@ class LayoutManager:
             }
         }
     
+    def overflow_parts(self, grid_size):
+        # Yeni boyuta tamamen sığmayan parçalar (yeniden boyutlandırmada yerleşimden çıkar)
+        rows, cols = grid_size
+        return {
+            part for i, row in enumerate(self.cells) for j, part in enumerate(row)
+            if part is not None and (i >= rows or j >= cols)
+        }
+    
+    def set_grid_size(self, grid_size):
+        # Yeni boyutta grid oluştur; tamamen sığan parçalar yerinde kalır, çıkarılanlar döndürülür
+        rows, cols = grid_size
+        overflow = self.overflow_parts(grid_size)
+        old_cells = self.cells
+        self.grid_size = (rows, cols)
+        self.cells = [[None for _ in range(cols)] for _ in range(rows)]
+        
+        for i, row in enumerate(old_cells[:rows]):
+            for j, part in enumerate(row[:cols]):
+                if part is not None and part not in overflow:
+                    self.cells[i][j] = part
+        return sorted(overflow)
+        
+    def clear(self):
+        rows, cols = self.grid_size
+        self.cells = [[None for _ in range(cols)] for _ in range(rows)]
+    
     def get_part_size(self, part_name):
         if part_name not in self.part_sizes:
             return (1, 1)
             
-        size = self.part_sizes[part_name]["default"]
+        size = self.slot_sizes.get(part_name, self.part_sizes[part_name]["default"])
+        # Şablon yuvası parçanın varsayılan üst sınırından büyük olabilir
+        max_size = (
+            max(self.part_sizes[part_name]["max"][0], size[0]),
+            max(self.part_sizes[part_name]["max"][1], size[1])
+        )
         rotation = self.part_rotations.get(part_name, 0)
         scale = self.part_scales.get(part_name, 1.0)
         
         # Rotasyona göre boyutu ayarla
         if rotation in [90, 270]:
             size = (size[1], size[0])
+            max_size = (max_size[1], max_size[0])
             
         # Ölçeğe göre boyutu ayarla
         size = (
-            min(max(int(size[0] * scale), self.part_sizes[part_name]["min"][0]), 
-                self.part_sizes[part_name]["max"][0]),
-            min(max(int(size[1] * scale), self.part_sizes[part_name]["min"][1]), 
-                self.part_sizes[part_name]["max"][1])
+            min(max(int(size[0] * scale), self.part_sizes[part_name]["min"][0]), max_size[0]),
+            min(max(int(size[1] * scale), self.part_sizes[part_name]["min"][1]), max_size[1])
         )
         
         return size
@@ -423,7 +506,7 @@ class LayoutManager:
         if part_name not in self.part_sizes:
             return False
             
-        width, height = self.part_sizes[part_name]
+        width, height = self.get_part_size(part_name)
         row, col = start_pos
         
         # Grid sınırlarını kontrol et
@@ -442,7 +525,7 @@ class LayoutManager:
         if not self.can_place_part(part_name, start_pos):
             return False
             
-        width, height = self.part_sizes[part_name]
+        width, height = self.get_part_size(part_name)
         row, col = start_pos
         
         # Parçayı yerleştir
@@ -459,14 +542,34 @@ class LayoutManager:
                 if self.cells[i][j] == part_name:
                     self.cells[i][j] = None
     
+    def apply_template(self, layout, selected_parts):
+        # Yerleşim layout_system'de yapılır; sonuç bu gridin hücrelerine ve yuva boyutlarına aktarılır
+        if layout.grid_size != self.grid_size:
+            return self.auto_layout(selected_parts)
+        
+        self.slot_sizes = {}
+        # Parça tipi olmayan adlar yerleşmez; kalanlar döndürme/ölçekle hesaplanan boyutlarıyla paketlenir
+        parts = [
+            Part(part_name, PART_TYPES_BY_VALUE[part_name], part_name, self.get_part_size(part_name))
+            for part_name in selected_parts if part_name in PART_TYPES_BY_VALUE
+        ]
+        grid_layout = layout_system.LayoutManager(*self.grid_size)
+        grid_layout.apply_template(layout, parts)
+        # Yuva boyutu saklanır; döndürme ve ölçekleme bu boyuttan yeniden hesaplar
+        self.slot_sizes = dict(grid_layout.slot_sizes)
+        self.cells = [list(row) for row in grid_layout.grid.grid]
+        return self.cells
+    
     def auto_layout(self, selected_parts):
         # Gridi temizle
-        self.cells = [[None for _ in range(3)] for _ in range(3)]
-        
+        self.clear()
+        return self.pack_parts(selected_parts)
+    
+    def pack_parts(self, selected_parts):
         # Parçaları boyutlarına göre sırala (büyükten küçüğe)
         sorted_parts = sorted(
             selected_parts,
-            key=lambda x: self.part_sizes[x][0] * self.part_sizes[x][1],
+            key=lambda x: self.get_part_size(x)[0] * self.get_part_size(x)[1],
             reverse=True
         )
         
@@ -483,34 +586,6 @@ class LayoutManager:
                     
         return self.cells
 
-class Template:
-    def __init__(self, name, description=""):
-        self.name = name
-        self.description = description
-        self.settings = {
-            'page_layout': [],
-            'default_parts': [],
-            'custom_fields': {},
-            'export_settings': {}
-        }
-    
-    def save(self, path):
-        data = {
-            'name': self.name,
-            'description': self.description,
-            'settings': self.settings
-        }
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-    
-    @classmethod
-    def load(cls, path):
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            template = cls(data['name'], data['description'])
-            template.settings = data['settings']
-            return template
-
 class UndoStack:
     def __init__(self):
         self.undo_stack = []
@@ -542,19 +617,28 @@ class PaftaOlusturucu(QMainWindow):
 
         self.export_manager = ExportManager()
         self.layout_manager = LayoutManager()
-        self.project_manager = ProjectManager()
-        self.template_manager = TemplateManager()
+        # Şablon deposu tektir; proje yöneticisi de aynı önbelleği kullanır
+        self.template_manager = TemplateManager("templates/")
+        self.project_manager = ProjectManager(self.template_manager)
         self.layout_optimizer = LayoutOptimizer(self.layout_manager)
         self.language_manager = LanguageManager()
         self.part_detail_manager = PartDetailManager()
         self.security_manager = SecurityManager()
         self.version_control = VersionControl()
-        self.resolution_checker = ResolutionChecker()
-        self.ai_exporter = AIExporter()
+        # AI modülü ilk kullanımda yüklenir
+        self._ai_exporter = None
+        
+        # Görüntüleri GUI thread'i dışında yükle
+        self.image_loader = ImageLoader()
+        self.image_loader.draft_ready.connect(self.on_image_draft)
+        self.image_loader.image_loaded.connect(self.on_image_loaded)
+        self.image_loader.load_failed.connect(self.on_image_load_failed)
+        self.image_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
 
         # Temel özellikleri başlat
         self.current_image = None
         self.zoom_factor = 1.0
+        self.max_zoom = 32.0
         self.template_path = "templates/"
         self.current_page = 0
         self.pages = [{}]
@@ -564,9 +648,12 @@ class PaftaOlusturucu(QMainWindow):
         self.part_group_manager = PartGroupManager()
         self.collision_manager = CollisionManager()
         self.layout_optimizer = LayoutOptimizer(self.layout_manager)
-        self.project_manager = ProjectManager()
         self.undo_stack = UndoStack()
         
+        # Yerleşimdeki parçaların görüntüleri ve birleştirilmiş sayfa önizlemesi
+        self.part_images = {}
+        self.sheet_preview = SheetPreview(self.export_manager.geometry)
+        
         # Otomatik kaydetme için timer
         self.autosave_timer = QTimer()
         self.autosave_timer.timeout.connect(self.autosave)
@@ -575,6 +662,18 @@ class PaftaOlusturucu(QMainWindow):
         # UI'ı başlat
         self.init_ui()
         
+    @property
+    def resolution_checker(self):
+        # Export yöneticisinin ön kontrolde kullandığı denetleyici paylaşılır
+        return self.export_manager.resolution_checker
+    
+    @property
+    def ai_exporter(self):
+        if self._ai_exporter is None:
+            from ai_exporter import AIExporter
+            self._ai_exporter = AIExporter()
+        return self._ai_exporter
+    
     def init_ui(self):
         self.setWindowTitle("Pafta Oluşturucu")
         self.setMinimumSize(1400, 800)
@@ -648,7 +747,7 @@ class PaftaOlusturucu(QMainWindow):
             self,
             'Export Format',
             'Format seçin:',
-            ['pdf', 'png'],
+            self.export_manager.get_formats(),
             0,
             False
         )
@@ -712,6 +811,11 @@ class PaftaOlusturucu(QMainWindow):
             action.triggered.connect(lambda checked, f=factor: self.scale_selected_part(part_name, f))
             scale_menu.addAction(action)
         
+        # Görüntü ata
+        image_action = QAction("Görüntü Ata...", self)
+        image_action.triggered.connect(lambda: self.assign_part_image(part_name))
+        menu.addAction(image_action)
+        
         # Kaldır
         remove_action = QAction("Kaldır", self)
         remove_action.triggered.connect(lambda: self.remove_selected_part(part_name))
@@ -724,7 +828,7 @@ class PaftaOlusturucu(QMainWindow):
         
         if current_part:
             # Parça varsa context menüyü göster
-            menu = self.create_part_context_menu(current_part, self.grid_buttons[row][col])
+            menu = self.create_part_context_menu(current_part, self.layout_view)
             menu.exec_(QCursor.pos())
         else:
             # Parça yoksa yeni parça yerleştirme dialogunu göster
@@ -843,11 +947,12 @@ class PaftaOlusturucu(QMainWindow):
                 # Ölçek değerini al
                 scale = scale_slider.value() / 100
                 
+                # Rotasyon ve ölçek parçanın kapladığı hücreleri belirler
+                self.layout_manager.part_rotations[part_name] = rotation
+                self.layout_manager.part_scales[part_name] = scale
+                
                 # Parçayı yerleştir
                 if self.layout_manager.place_part(part_name, (row, col)):
-                    # Rotasyon ve ölçeği kaydet
-                    self.layout_manager.part_rotations[part_name] = rotation
-                    self.layout_manager.part_scales[part_name] = scale
                     self.update_layout_grid()
                 else:
                     QMessageBox.warning(self, "Uyarı", "Bu parça buraya yerleştirilemez!")
@@ -858,36 +963,33 @@ class PaftaOlusturucu(QMainWindow):
         
         layout_main = QVBoxLayout()
         
-        # Yerleşim grid'i
-        self.layout_grid = QGridLayout()
-        self.layout_grid.setSpacing(5)
+        # Şablon seçimi grid boyutunu belirler
+        template_row = QHBoxLayout()
+        self.grid_template_combo = QComboBox()
+        for template_id, template in self.template_manager.builtin_templates.items():
+            rows, cols = template.grid_size
+            self.grid_template_combo.addItem(f"{template.name} ({cols}x{rows})", template_id)
+        self.grid_template_combo.currentIndexChanged.connect(self.apply_grid_template)
+        
+        # Satır/sütun elle de ayarlanabilir
+        self.grid_rows_spin = QSpinBox()
+        self.grid_cols_spin = QSpinBox()
+        for spin, value in [(self.grid_rows_spin, self.layout_manager.grid_size[0]),
+                            (self.grid_cols_spin, self.layout_manager.grid_size[1])]:
+            spin.setRange(1, 48)
+            spin.setValue(value)
+            spin.editingFinished.connect(
+                lambda: self.set_grid_size((self.grid_rows_spin.value(), self.grid_cols_spin.value()))
+            )
         
-        # Layout manager
-        self.layout_manager = LayoutManager()
+        template_row.addWidget(self.grid_template_combo, 1)
+        template_row.addWidget(self.grid_rows_spin)
+        template_row.addWidget(QLabel("x"))
+        template_row.addWidget(self.grid_cols_spin)
         
-        # Grid butonları
-        self.grid_buttons = []
-        for i in range(3):
-            row_buttons = []
-            for j in range(3):
-                btn = QPushButton()
-                btn.setFixedSize(60, 60)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #444444;
-                        border: 1px solid #555555;
-                        border-radius: 3px;
-                        color: white;
-                        font-size: 10px;
-                    }
-                    QPushButton:hover {
-                        background-color: #2196F3;
-                    }
-                """)
-                btn.clicked.connect(lambda checked, row=i, col=j: self.cell_clicked(row, col))
-                self.layout_grid.addWidget(btn, i, j)
-                row_buttons.append(btn)
-            self.grid_buttons.append(row_buttons)
+        # Yerleşim grid'i: tek QGraphicsView, büyük gridlerde de ölçeklenir
+        self.layout_view = LayoutGridView(*self.layout_manager.grid_size)
+        self.layout_view.cell_clicked.connect(self.cell_clicked)
         
         # Otomatik yerleşim butonu
         auto_layout_btn = QPushButton("Otomatik Yerleşim")
@@ -899,97 +1001,196 @@ class PaftaOlusturucu(QMainWindow):
         clear_layout_btn.setStyleSheet(self.get_button_style())
         clear_layout_btn.clicked.connect(self.clear_layout)
         
-        layout_main.addLayout(self.layout_grid)
+        layout_main.addLayout(template_row)
+        layout_main.addWidget(self.layout_view, 1)
         layout_main.addWidget(auto_layout_btn)
         layout_main.addWidget(clear_layout_btn)
         
         layout_group.setLayout(layout_main)
         return layout_group
     
-    def cell_clicked(self, row, col):
-        # Seçili parçayı bul
-        selected_parts = []
-        for checkbox, part_name in zip(self.part_checkboxes, [
-            "Ön Görünüş", "Yan Görünüş", "Üst Görünüş", 
-            "Perspektif", "Detay", "Ölçüler", "Kesit",
-            "Montaj", "Parça Listesi"
-        ]):
-            if checkbox.isChecked():
-                selected_parts.append(part_name)
+    def update_layout_grid(self):
+        # Grid görünümünü güncelle; her parça hücre başına değil tek nesne olarak çizilir
+        self.layout_view.set_parts({
+            part.name: (part.position[0], part.position[1], part.size[0], part.size[1])
+            for part in self.build_layout_parts()
+        })
         
-        if not selected_parts:
-            QMessageBox.warning(self, "Uyarı", "Önce bir parça seçin!")
+        self.refresh_sheet_preview()
+    
+    def set_grid_size(self, grid_size):
+        # Kullanıcının grid değişikliği: yerleşime ve export geometrisine uygulanır
+        grid_size = tuple(grid_size)
+        if grid_size == self.layout_manager.grid_size == self.layout_view.rows_cols():
             return
         
-        # Parça yerleştirme dialogu
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Parça Seç")
-        dialog.setModal(True)
-        
-        layout = QVBoxLayout(dialog)
-        
-        part_list = QListWidget()
-        part_list.addItems(selected_parts)
-        part_list.setStyleSheet("""
-            QListWidget {
-                background-color: #333333;
-                color: white;
-                border: none;
-                border-radius: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #2196F3;
-            }
-        """)
+        # Sığmayan parçalar sessizce atılmaz; kullanıcı onaylamazsa eski boyut kalır
+        overflow = self.layout_manager.overflow_parts(grid_size)
+        if overflow:
+            reply = QMessageBox.question(
+                self,
+                "Uyarı",
+                f"Yeni grid boyutuna sığmayan parçalar yerleşimden çıkarılacak: {', '.join(sorted(overflow))}. Devam edilsin mi?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                self.show_grid_size(self.layout_manager.grid_size)
+                return
         
-        layout.addWidget(part_list)
+        self.layout_manager.set_grid_size(grid_size)
+        self.export_manager.set_grid_size(grid_size)
+        self.show_grid_size(grid_size)
+        self.update_layout_grid()
+    
+    def show_grid_size(self, grid_size):
+        # Grid görünümünü ve satır/sütun kutularını boyuta uydur (export geometrisine dokunmaz)
+        if grid_size != self.layout_view.rows_cols():
+            self.layout_view.set_grid_size(*grid_size)
+        for spin, value in [(self.grid_rows_spin, grid_size[0]), (self.grid_cols_spin, grid_size[1])]:
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+    
+    def apply_grid_template(self, index=None):
+        template_id = self.grid_template_combo.currentData()
+        if template_id:
+            self.set_grid_size(self.template_manager.get_grid_size(template_id))
+    
+    def layout_state(self):
+        # Sayfa ile birlikte saklanan yerleşim durumu
+        return {
+            'cells': [row[:] for row in self.layout_manager.cells],
+            'rotations': dict(self.layout_manager.part_rotations),
+            'scales': dict(self.layout_manager.part_scales),
+            'slot_sizes': dict(self.layout_manager.slot_sizes)
+        }
+    
+    def build_layout_parts(self, layout=None, part_images=None):
+        # Grid hücrelerindeki parça adlarından konumlu Part listesi üret
+        layout = layout or self.layout_state()
+        part_images = self.part_images if part_images is None else part_images
+        cells = layout['cells']
+        
+        parts = []
+        seen = set()
+        for i, row in enumerate(cells):
+            for j, part_name in enumerate(row):
+                if part_name is None or part_name in seen:
+                    continue
+                seen.add(part_name)
+                # İlk rastlanan hücre sol üst köşedir; kapladığı alanı say
+                width = sum(1 for cell in row[j:] if cell == part_name)
+                height = sum(1 for cells_row in cells[i:] if cells_row[j] == part_name)
+                parts.append(Part(
+                    id=part_name,
+                    type=PartType(part_name),
+                    name=part_name,
+                    size=(width, height),
+                    position=(i, j),
+                    rotation=layout['rotations'].get(part_name, 0),
+                    scale=layout['scales'].get(part_name, 1.0),
+                    image_path=part_images.get(part_name)
+                ))
+        return parts
+    
+    def page_parts(self, layout, part_images, page_image, name=None):
+        # Yerleşim parçaları; sürüklenen sayfa görüntüsü tüm grid'i kaplayan alt katman olarak korunur
+        parts = self.build_layout_parts(layout, part_images) if layout else []
+        if page_image and page_image not in {part.image_path for part in parts}:
+            cells = layout['cells'] if layout else None
+            rows, cols = (len(cells), len(cells[0])) if cells else self.layout_manager.grid_size
+            parts.insert(0, Part(
+                id=PAGE_IMAGE_PART_ID,
+                type=PartType.ASSEMBLY,
+                name=name or os.path.basename(page_image),
+                size=(cols, rows),
+                position=(0, 0),
+                image_path=page_image
+            ))
+        return parts
+    
+    def refresh_sheet_preview(self):
+        # Yerleşimde parça varsa sayfayı önizleme DPI'ında birleştirerek göster; sürüklenen
+        # görüntü parçaların altında çizilir (karo piramidi görünümü yerine geçer, kaybolmaz)
+        parts = self.page_parts(
+            self.layout_state(), self.part_images, self.pages[self.current_page].get('image')
+        )
+        if not any(part.id != PAGE_IMAGE_PART_ID for part in parts):
+            self.preview_area.set_sheet(None)
+            return
         
-        place_btn = QPushButton("Yerleştir")
-        place_btn.setStyleSheet(self.get_button_style(primary=True))
-        place_btn.clicked.connect(dialog.accept)
+        # Grid ya da sayfa formatı değiştiyse tuval baştan çizilir
+        full_refresh = self.preview_area.sheet is None
+        geometry = self.export_manager.geometry.with_grid(self.layout_manager.grid_size)
+        if self.sheet_preview.geometry.signature != geometry.signature:
+            self.sheet_preview.set_geometry(geometry)
+            full_refresh = True
         
-        layout.addWidget(place_btn)
+        try:
+            # Sadece değişen hücreler yeniden çizilir; görüntüler işçi thread'de küçültülür
+            boxes = self.sheet_preview.render(parts, build_missing=False)
+            self.preview_area.set_sheet(self.sheet_preview.canvas, None if full_refresh else boxes)
+        except Exception as e:
+            print(f"Sayfa önizleme hatası: {str(e)}")
+            return
+        for thumbnail_key in self.sheet_preview.pending:
+            self.image_loader.load_thumbnail(thumbnail_key)
+    
+    def on_thumbnail_ready(self, thumbnail_key, image):
+        # Gelen küçük resmin parçası bir sonraki render'da yeniden çizilir
+        self.sheet_preview.add_thumbnail(thumbnail_key, image)
+        self.refresh_sheet_preview()
+    
+    def part_origin(self, part_name):
+        # Parçanın sol üst hücresi
+        for i, row in enumerate(self.layout_manager.cells):
+            for j, cell in enumerate(row):
+                if cell == part_name:
+                    return (i, j)
+        return None
+    
+    def update_part_transform(self, part_name, rotation=None, scale=None):
+        # Parçayı aynı köşede yeni boyutuyla yerleştir; sığmazsa geri al
+        origin = self.part_origin(part_name)
+        if origin is None:
+            return
         
-        if dialog.exec() == QDialog.Accepted:
-            selected_part = part_list.currentItem()
-            if selected_part:
-                part_name = selected_part.text()
-                if self.layout_manager.place_part(part_name, (row, col)):
-                    self.update_layout_grid()
-                else:
-                    QMessageBox.warning(self, "Uyarı", "Bu parça buraya yerleştirilemez!")
+        manager = self.layout_manager
+        previous = (manager.part_rotations.get(part_name, 0), manager.part_scales.get(part_name, 1.0))
+        manager.remove_part(part_name)
+        if rotation is not None:
+            manager.part_rotations[part_name] = rotation
+        if scale is not None:
+            manager.part_scales[part_name] = scale
+        
+        if not manager.place_part(part_name, origin):
+            manager.part_rotations[part_name], manager.part_scales[part_name] = previous
+            manager.place_part(part_name, origin)
+            QMessageBox.warning(self, "Uyarı", "Parça yeni boyutuyla buraya sığmıyor!")
+        self.update_layout_grid()
     
-    def update_layout_grid(self):
-        # Grid görünümünü güncelle
-        for i in range(3):
-            for j in range(3):
-                part = self.layout_manager.cells[i][j]
-                btn = self.grid_buttons[i][j]
-                if part:
-                    btn.setText(part)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #2196F3;
-                            border: 1px solid #1976D2;
-                            border-radius: 3px;
-                            color: white;
-                            font-size: 10px;
-                        }
-                    """)
-                else:
-                    btn.setText("")
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #444444;
-                            border: 1px solid #555555;
-                            border-radius: 3px;
-                            color: white;
-                            font-size: 10px;
-                        }
-                        QPushButton:hover {
-                            background-color: #2196F3;
-                        }
-                    """)
+    def rotate_selected_part(self, part_name):
+        rotation = (self.layout_manager.part_rotations.get(part_name, 0) + 90) % 360
+        self.update_part_transform(part_name, rotation=rotation)
+    
+    def scale_selected_part(self, part_name, scale):
+        self.update_part_transform(part_name, scale=scale)
+    
+    def remove_selected_part(self, part_name):
+        self.layout_manager.remove_part(part_name)
+        self.part_images.pop(part_name, None)
+        self.update_layout_grid()
+    
+    def assign_part_image(self, part_name):
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Parça Görüntüsü",
+            "",
+            "Images (*.png *.jpg *.jpeg)"
+        )
+        if file_name:
+            self.part_images[part_name] = file_name
+            self.refresh_sheet_preview()
     
     def auto_arrange_parts(self):
         # Seçili parçaları al
@@ -1006,13 +1207,21 @@ class PaftaOlusturucu(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Önce parça seçin!")
             return
         
-        # Otomatik yerleşim
-        self.layout_manager.auto_layout(selected_parts)
+        # Seçili şablonun kuralları bu grid için yazılmışsa arama yapmadan uygula
+        template_id = self.grid_template_combo.currentData()
+        layout = self.template_manager.get_compiled_layout(template_id) if template_id else None
+        if layout and layout.grid_size == self.layout_manager.grid_size:
+            self.layout_manager.apply_template(layout, selected_parts)
+        else:
+            self.layout_manager.slot_sizes.clear()
+            self.layout_manager.auto_layout(selected_parts)
         self.update_layout_grid()
     
     def clear_layout(self):
         # Gridi temizle
-        self.layout_manager.cells = [[None for _ in range(3)] for _ in range(3)]
+        self.layout_manager.clear()
+        self.layout_manager.slot_sizes.clear()
+        self.part_images = {}
         self.update_layout_grid()
                 
     def load_state(self, state):
@@ -1124,8 +1333,9 @@ class PaftaOlusturucu(QMainWindow):
         new_btn = QPushButton("Yeni")
         edit_btn = QPushButton("Düzenle")
         delete_btn = QPushButton("Sil")
+        apply_btn = QPushButton("Uygula")
         
-        for btn in [new_btn, edit_btn, delete_btn]:
+        for btn in [new_btn, edit_btn, delete_btn, apply_btn]:
             btn.setStyleSheet(self.get_button_style())
             btn_layout.addWidget(btn)
         
@@ -1133,6 +1343,7 @@ class PaftaOlusturucu(QMainWindow):
         new_btn.clicked.connect(lambda: self.create_new_template(template_list))
         edit_btn.clicked.connect(lambda: self.edit_template(template_list))
         delete_btn.clicked.connect(lambda: self.delete_template(template_list))
+        apply_btn.clicked.connect(lambda: self.apply_template(template_list))
         
         layout.addWidget(template_list)
         layout.addLayout(btn_layout)
@@ -1140,30 +1351,37 @@ class PaftaOlusturucu(QMainWindow):
         dialog.exec()
     
     def load_template_list(self, list_widget):
+        # Sadece dizindeki özetler listelenir; şablon gövdesi seçilince okunur
         list_widget.clear()
-        if os.path.exists(self.template_path):
-            for file in os.listdir(self.template_path):
-                if file.endswith('.json'):
-                    try:
-                        template = Template.load(os.path.join(self.template_path, file))
-                        item = QListWidgetItem(f"{template.name} - {template.description}")
-                        item.setData(Qt.UserRole, template)
-                        list_widget.addItem(item)
-                    except:
-                        continue
+        for entry in self.template_manager.catalog.list_entries():
+            item = QListWidgetItem(f"{entry.name} - {entry.description}")
+            item.setData(Qt.UserRole, entry.id)
+            list_widget.addItem(item)
+    
+    def selected_template(self, list_widget):
+        current = list_widget.currentItem()
+        if not current:
+            return None
+        return self.template_manager.get_template(current.data(Qt.UserRole))
+    
+    def apply_template(self, list_widget):
+        template = self.selected_template(list_widget)
+        if template:
+            self.set_grid_size(template.grid_size)
     
     def create_new_template(self, list_widget):
         name, ok = QInputDialog.getText(self, "Yeni Template", "Template Adı:")
         if ok and name:
-            template = Template(name)
+            template = Template(id=name, name=name, description="", layout_rules={}, default_parts=[])
             self.edit_template_settings(template)
             self.save_template(template)
             self.load_template_list(list_widget)
     
     def edit_template(self, list_widget):
-        current = list_widget.currentItem()
-        if current:
-            template = current.data(Qt.UserRole)
+        template = self.selected_template(list_widget)
+        if template:
+            # Depodaki nesne paylaşılır; düzenleme kopya üzerinde yapılır
+            template = copy.deepcopy(template)
             self.edit_template_settings(template)
             self.save_template(template)
             self.load_template_list(list_widget)
@@ -1191,7 +1409,18 @@ class PaftaOlusturucu(QMainWindow):
         
         # Yerleşim ayarları
         layout_tab = QWidget()
-        layout_layout = QVBoxLayout(layout_tab)
+        layout_layout = QFormLayout(layout_tab)
+        
+        rows, cols = template.grid_size
+        rows_spin = QSpinBox()
+        rows_spin.setRange(1, 48)
+        rows_spin.setValue(rows)
+        cols_spin = QSpinBox()
+        cols_spin.setRange(1, 48)
+        cols_spin.setValue(cols)
+        
+        layout_layout.addRow("Grid Satır:", rows_spin)
+        layout_layout.addRow("Grid Sütun:", cols_spin)
         
         # Parça ayarları
         parts_tab = QWidget()
@@ -1218,19 +1447,18 @@ class PaftaOlusturucu(QMainWindow):
         if dialog.exec():  # Burayı düzelttim
             template.name = name_edit.text()
             template.description = desc_edit.text()
+            template.grid_size = (rows_spin.value(), cols_spin.value())
             # Diğer ayarları kaydet
     
     def save_template(self, template):
-        if not os.path.exists(self.template_path):
-            os.makedirs(self.template_path)
-        
-        file_path = os.path.join(self.template_path, f"{template.name}.json")
-        template.save(file_path)
+        return self.template_manager.save_template(template)
     
     def delete_template(self, list_widget):
         current = list_widget.currentItem()
         if current:
-            template = current.data(Qt.UserRole)
+            template = self.template_manager.catalog.entries.get(current.data(Qt.UserRole))
+            if not template:
+                return
             reply = QMessageBox.question(
                 self,
                 "Template Sil",
@@ -1239,62 +1467,13 @@ class PaftaOlusturucu(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                file_path = os.path.join(self.template_path, f"{template.name}.json")
-                try:
-                    os.remove(file_path)
+                if self.template_manager.delete_template(template.id):
                     self.load_template_list(list_widget)
-                except:
+                else:
                     QMessageBox.warning(self, "Hata", "Template silinemedi!")
     
     
 
-    def export_as_pdf(self, file_name):
-        try:
-            # PDF oluştur
-            c = canvas.Canvas(file_name, pagesize=A4)
-            
-            # Her sayfa için
-            for page_num, page_data in enumerate(self.pages):
-                if page_num > 0:
-                    c.showPage()  # Yeni sayfa
-                
-                # Sayfa başlığı
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(20*mm, 280*mm, f"Ürün: {page_data.get('urun_adi', '')}")
-                c.drawString(20*mm, 273*mm, f"Kod: {page_data.get('urun_kodu', '')}")
-                c.drawString(20*mm, 266*mm, f"Seri: {page_data.get('seri', '')}")
-                
-                # Çizgi çek
-                c.line(20*mm, 263*mm, 190*mm, 263*mm)
-                
-                # Seçili parçaları listele
-                c.setFont("Helvetica", 12)
-                y_pos = 250
-                for i, (checkbox, part_name) in enumerate(zip(self.part_checkboxes, [
-                    "Ön Görünüş", "Yan Görünüş", "Üst Görünüş", 
-                    "Perspektif", "Detay", "Ölçüler", "Kesit",
-                    "Montaj", "Parça Listesi"
-                ])):
-                    if checkbox.isChecked():
-                        c.drawString(20*mm, y_pos*mm, f"• {part_name}")
-                        y_pos -= 7
-                
-                # Görüntü varsa ekle
-                if 'image' in page_data:
-                    img_path = page_data['image']
-                    c.drawImage(img_path, 20*mm, 50*mm, width=170*mm, height=170*mm, preserveAspectRatio=True)
-                
-                # Sayfa numarası
-                c.setFont("Helvetica", 10)
-                c.drawString(100*mm, 10*mm, f"Sayfa {page_num + 1} / {len(self.pages)}")
-            
-            c.save()
-            return True
-        
-        except Exception as e:
-            QMessageBox.warning(self, "Hata", f"PDF oluşturulurken hata: {str(e)}")
-            return False
-
     def create_right_panel(self, main_layout):
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
@@ -1377,37 +1556,6 @@ class PaftaOlusturucu(QMainWindow):
         parts_group.setLayout(parts_layout)
         return parts_group
 
-    def create_layout_group(self):
-        layout_group = QGroupBox("Yerleşim Düzeni")
-        layout_group.setStyleSheet(self.get_group_style())
-        
-        layout_main = QVBoxLayout()
-        
-        # Yerleşim grid'i
-        self.layout_grid = QGridLayout()
-        self.layout_grid.setSpacing(5)
-        
-        # 3x3 grid oluştur
-        for i in range(3):
-            for j in range(3):
-                cell = QPushButton()
-                cell.setFixedSize(50, 50)
-                cell.setStyleSheet("""
-                    QPushButton {
-                        background-color: #444444;
-                        border: 1px solid #555555;
-                        border-radius: 3px;
-                    }
-                    QPushButton:hover {
-                        background-color: #2196F3;
-                    }
-                """)
-                self.layout_grid.addWidget(cell, i, j)
-        
-        layout_main.addLayout(self.layout_grid)
-        layout_group.setLayout(layout_main)
-        return layout_group
-        
     def create_export_group(self):
         export_group = QGroupBox("Export")
         export_group.setStyleSheet(self.get_group_style())
@@ -1509,28 +1657,30 @@ class PaftaOlusturucu(QMainWindow):
         """
 
     def handle_dropped_image(self, image_path):
-        try:
-            image = Image.open(image_path)
-            # A4 boyutuna ölçekle
-            a4_size = (2480, 3508)  # 300 DPI'da A4
-            image.thumbnail(a4_size, Image.Resampling.LANCZOS)
-            
-            # QPixmap'e dönüştür
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.getvalue())
-            
-            self.current_image = pixmap
-            self.pages[self.current_page]['image'] = image_path
-            self.update_preview()
-            self.save_state()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Hata", f"Görüntü yüklenemedi: {str(e)}")
+        # Çözme ve ölçekleme işçi thread'de yapılır
+        self.image_loader.load(image_path)
+
+    def on_image_draft(self, image_path, qimage):
+        # Tam kalite gelene kadar düşük çözünürlüklü taslağı göster
+        self.current_image = QPixmap.fromImage(qimage)
+        self.preview_area.set_pyramid(None)
+        self.update_preview()
+
+    def on_image_loaded(self, image_path, qimage, pyramid):
+        self.current_image = QPixmap.fromImage(qimage)
+        self.preview_area.set_pyramid(pyramid)
+        self.pages[self.current_page]['image'] = image_path
+        self.update_preview()
+        self.save_state()
+
+    def on_image_load_failed(self, image_path, message):
+        QMessageBox.warning(self, "Hata", f"Görüntü yüklenemedi: {message}")
 
     def update_preview(self):
-        if self.current_image:
+        if self.preview_area.pyramid is not None:
+            # Sadece görünür karolar en yakın mip seviyesinden çizilir
+            self.preview_area.set_zoom(self.zoom_factor)
+        elif self.current_image:
             scaled_pixmap = self.current_image.scaled(
                 self.preview_area.size() * self.zoom_factor,
                 Qt.KeepAspectRatio,
@@ -1539,20 +1689,21 @@ class PaftaOlusturucu(QMainWindow):
             self.preview_area.setPixmap(scaled_pixmap)
 
     def zoom_in(self):
-        if self.zoom_factor < 2.0:
-            self.zoom_factor += 0.25
+        if self.zoom_factor < self.max_zoom:
+            self.zoom_factor = min(self.zoom_factor * 1.25, self.max_zoom)
             self.zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
             self.update_preview()
 
     def zoom_out(self):
         if self.zoom_factor > 0.25:
-            self.zoom_factor -= 0.25
+            self.zoom_factor = max(self.zoom_factor / 1.25, 0.25)
             self.zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
             self.update_preview()
 
     def zoom_fit(self):
         self.zoom_factor = 1.0
         self.zoom_label.setText("100%")
+        self.preview_area.reset_view()
         self.update_preview()
 
     def previous_page(self):
@@ -1577,12 +1728,15 @@ class PaftaOlusturucu(QMainWindow):
         self.page_label.setText(f"Sayfa {self.current_page + 1}")
 
     def save_current_page(self):
-        self.pages[self.current_page] = {
+        # Sürüklenen görüntü ('image') sayfada kalır
+        self.pages[self.current_page].update({
             'urun_kodu': self.urun_kodu.text(),
             'urun_adi': self.urun_adi.text(),
             'seri': self.seri.text(),
-            'parcalar': [cb.isChecked() for cb in self.part_checkboxes]
-        }
+            'parcalar': [cb.isChecked() for cb in self.part_checkboxes],
+            'layout': self.layout_state(),
+            'part_images': dict(self.part_images)
+        })
 
     def load_page(self, page_index):
         page_data = self.pages[page_index]
@@ -1592,11 +1746,34 @@ class PaftaOlusturucu(QMainWindow):
         
         for checkbox, is_checked in zip(self.part_checkboxes, page_data.get('parcalar', [])):
             checkbox.setChecked(is_checked)
+        
+        # Sayfanın yerleşimini geri yükle
+        layout = page_data.get('layout')
+        if layout and layout['cells']:
+            # Sayfa geçişi: hücreler aşağıda sayfadan yüklenir, export geometrisi değişmez
+            grid_size = (len(layout['cells']), len(layout['cells'][0]))
+            self.layout_manager.grid_size = grid_size
+            self.show_grid_size(grid_size)
+        rows, cols = self.layout_manager.grid_size
+        self.layout_manager.cells = (
+            [row[:] for row in layout['cells']] if layout else [[None for _ in range(cols)] for _ in range(rows)]
+        )
+        self.layout_manager.part_rotations = dict(layout['rotations']) if layout else {}
+        self.layout_manager.part_scales = dict(layout['scales']) if layout else {}
+        # Eski sayfalarda yuva boyutu kaydı yoktur
+        self.layout_manager.slot_sizes = {
+            part_name: tuple(size) for part_name, size in (layout.get('slot_sizes', {}) if layout else {}).items()
+        }
+        self.part_images = dict(page_data.get('part_images', {}))
+        self.update_layout_grid()
             
         if 'image' in page_data:
             self.handle_dropped_image(page_data['image'])
         else:
+            # Önceki sayfanın yüklemesi yarıda kaldıysa iptal et
+            self.image_loader.cancel()
             self.current_image = None
+            self.preview_area.set_pyramid(None)
             self.preview_area.clear()
             self.preview_area.setText("Görüntü yüklemek için sürükle bırak")
 
@@ -1618,12 +1795,20 @@ class PaftaOlusturucu(QMainWindow):
         preview_label = QLabel()
         preview_label.setAlignment(Qt.AlignCenter)
         
-        if self.current_image:
-            preview_label.setPixmap(self.current_image.scaled(
-                preview.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
+        # Export ile aynı sayfa formatında, önizleme DPI'ında render et
+        self.save_current_page()
+        self.sync_export_grid()
+        export_project = self.build_export_project()
+        if export_project.pages:
+            try:
+                page_image = self.export_manager.render_preview(export_project, self.current_page)
+                preview_label.setPixmap(QPixmap.fromImage(pil_to_qimage(page_image)).scaled(
+                    preview.size(),
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                ))
+            except Exception as e:
+                print(f"Export önizleme hatası: {str(e)}")
         
         layout.addWidget(preview_label)
         preview.exec()
@@ -1640,14 +1825,12 @@ class PaftaOlusturucu(QMainWindow):
         
         if file_name:
             # Export verilerini hazırla
-            export_data = {
-                'pages': self.pages,
-                'current_page': self.current_page,
-                'current_image': self.current_image
-            }
+            self.save_current_page()
+            self.sync_export_grid()
+            export_project = self.build_export_project()
             
             try:
-                if self.export_manager.export(export_data, file_format, file_name):
+                if self.export_manager.export(export_project, file_format, file_name):
                     QMessageBox.information(
                         self,
                         "Başarılı",
@@ -1667,12 +1850,38 @@ class PaftaOlusturucu(QMainWindow):
                 )
 
     def export_as_pdf(self, file_name):
-        # PDF export işlemleri
-        pass
+        self.save_current_page()
+        self.sync_export_grid()
+        return self.export_manager.export(self.build_export_project(), 'pdf', file_name)
 
     def export_as_png(self, file_name):
-        if self.current_image:
-            self.current_image.save(file_name, "PNG")
+        self.save_current_page()
+        self.sync_export_grid()
+        return self.export_manager.export(self.build_export_project(), 'png', file_name)
+
+    def sync_export_grid(self):
+        # Export tek grid kullanır; sayfa geçişinde değil, export başlarken gösterilen sayfanınkine uyar
+        self.export_manager.set_grid_size(self.layout_manager.grid_size)
+
+    def build_export_project(self):
+        # Arayüz sayfalarını exporter'ların ortak Project yapısına çevir
+        project = Project(self.urun_adi.text() or "Pafta")
+        project.current_page = self.current_page
+        for page_data in self.pages:
+            # Önizlemeyle aynı parçalar: sürüklenen görüntü yerleşim parçalarının altında kalır
+            parts = self.page_parts(
+                page_data.get('layout'), page_data.get('part_images', {}), page_data.get('image'),
+                name=page_data.get('urun_adi', '')
+            )
+            project.pages.append({
+                'parts': parts,
+                'info': {
+                    'Ürün': page_data.get('urun_adi', ''),
+                    'Kod': page_data.get('urun_kodu', ''),
+                    'Seri': page_data.get('seri', '')
+                }
+            })
+        return project
 
     def autosave(self):
         try:
@@ -0,0 +1,71 @@
+# page_format.py
+from dataclasses import dataclass
+from typing import Dict, Tuple, Union
+
+MM_PER_INCH = 25.4
+POINTS_PER_INCH = 72
+
+@dataclass(frozen=True)
+class PageFormat:
+    name: str
+    width_mm: float
+    height_mm: float
+
+    @property
+    def size_mm(self) -> Tuple[float, float]:
+        return (self.width_mm, self.height_mm)
+
+    def size_pt(self) -> Tuple[float, float]:
+        """PDF/PostScript birimi (1/72 inç) cinsinden boyut"""
+        return (mm_to_pt(self.width_mm), mm_to_pt(self.height_mm))
+
+    def size_px(self, dpi: Union[int, str]) -> Tuple[int, int]:
+        """Verilen DPI'da piksel boyutu"""
+        dpi = resolve_dpi(dpi)
+        return (mm_to_px(self.width_mm, dpi), mm_to_px(self.height_mm, dpi))
+
+    def landscape(self) -> 'PageFormat':
+        """Yatay yönlendirilmiş kopya"""
+        return PageFormat(f"{self.name} yatay", self.height_mm, self.width_mm)
+
+# ISO 216 A serisi (mm)
+PAGE_FORMATS: Dict[str, PageFormat] = {
+    'A0': PageFormat('A0', 841, 1189),
+    'A1': PageFormat('A1', 594, 841),
+    'A2': PageFormat('A2', 420, 594),
+    'A3': PageFormat('A3', 297, 420),
+    'A4': PageFormat('A4', 210, 297),
+    'A5': PageFormat('A5', 148, 210)
+}
+
+# Kullanım amacına göre çözünürlük
+DPI_PRESETS: Dict[str, int] = {
+    'print': 300,
+    'web': 72,
+    'preview': 150
+}
+
+def mm_to_px(value_mm: float, dpi: int) -> int:
+    return int(round(value_mm / MM_PER_INCH * dpi))
+
+def mm_to_pt(value_mm: float) -> float:
+    return value_mm / MM_PER_INCH * POINTS_PER_INCH
+
+def resolve_dpi(dpi: Union[int, str]) -> int:
+    """'print', 'web', 'preview' ya da sayısal DPI değerini çöz"""
+    if isinstance(dpi, str):
+        if dpi not in DPI_PRESETS:
+            raise ValueError(f"Geçersiz DPI ön ayarı: {dpi}")
+        return DPI_PRESETS[dpi]
+    return int(dpi)
+
+def get_page_format(page_format: Union[str, Tuple[float, float], PageFormat]) -> PageFormat:
+    """Format adından, (genişlik, yükseklik) mm çiftinden ya da PageFormat'tan sayfa formatı getir"""
+    if isinstance(page_format, PageFormat):
+        return page_format
+    if isinstance(page_format, str):
+        if page_format not in PAGE_FORMATS:
+            raise ValueError(f"Geçersiz sayfa formatı: {page_format}")
+        return PAGE_FORMATS[page_format]
+    width_mm, height_mm = page_format
+    return PageFormat(f"{width_mm:g}x{height_mm:g}mm", float(width_mm), float(height_mm))
@@ -0,0 +1,140 @@
+# page_geometry.py
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+from data_structures import Part
+from page_format import PageFormat, PAGE_FORMATS, MM_PER_INCH, POINTS_PER_INCH, get_page_format
+
+# (x, y, genişlik, yükseklik) ve PDF/SVG sırasıyla afin matris (a, b, c, d, e, f)
+Rect = Tuple[float, float, float, float]
+Matrix = Tuple[float, float, float, float, float, float]
+
+PT_PER_MM = POINTS_PER_INCH / MM_PER_INCH
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Parçanın sayfadaki yerleşimi; birimler mm, orijin sol üst köşe, y ekseni aşağı"""
+    part_id: str
+    cell: Rect                  # parçanın kapladığı grid hücreleri
+    box: Tuple[float, float]    # görüntü kutusu (döndürmeden önce; 90/270'te hücre kenarları takas edilir)
+    rotation: int               # saat yönünün tersine derece
+    scale: float
+    matrix: Matrix              # kutu merkezli yerel koordinatlardan sayfa koordinatlarına
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.matrix[4], self.matrix[5])
+
+    @property
+    def placed_size(self) -> Tuple[float, float]:
+        """Ölçek uygulanmış görüntü kutusunun fiziksel boyutu (mm)"""
+        return (self.box[0] * self.scale, self.box[1] * self.scale)
+
+    def fit(self, image_size: Tuple[int, int]) -> Tuple[float, float]:
+        """Görüntünün en-boy oranını koruyarak kutuya sığan boyutu (yerel mm, ölçeksiz)"""
+        image_width, image_height = image_size
+        if image_width <= 0 or image_height <= 0:
+            return (0.0, 0.0)
+        fit = min(self.box[0] / image_width, self.box[1] / image_height)
+        return (image_width * fit, image_height * fit)
+
+    def rect(self, units_per_mm: float = 1.0, page_height_mm: Optional[float] = None) -> Rect:
+        """Hücre dikdörtgenini hedef birimde getir; page_height_mm verilirse y ekseni yukarı (PDF)"""
+        x, y, width, height = self.cell
+        if page_height_mm is not None:
+            y = page_height_mm - y - height
+        return (x * units_per_mm, y * units_per_mm, width * units_per_mm, height * units_per_mm)
+
+    def transform(self, units_per_mm: float = 1.0, page_height_mm: Optional[float] = None) -> Matrix:
+        """Matrisi hedef birimde getir; page_height_mm verilirse y ekseni yukarı (PDF)"""
+        a, b, c, d, e, f = self.matrix
+        if page_height_mm is not None:
+            # Hem yerel hem sayfa y ekseni ters döner: dönüş yönü görsel olarak korunur
+            b, c, f = -b, -c, page_height_mm - f
+        return (a, b, c, d, e * units_per_mm, f * units_per_mm)
+
+
+class PageGeometry:
+    def __init__(self, page_format: Union[str, tuple, PageFormat] = PAGE_FORMATS['A3'],
+                 grid_size: tuple = (3, 3), margin_mm: float = 10.0, header_mm: float = 45.0,
+                 cache_size: int = 256):
+        self.page_format = get_page_format(page_format)
+        self.grid_size = tuple(grid_size)  # (satır, sütun)
+        self.margin_mm = margin_mm
+        self.header_mm = header_mm         # başlık ve sayfa bilgileri için üstte ayrılan alan
+
+        # sayfadaki parçaların geometrik özeti -> {part_id: Placement}, en son kullanılan sonda
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+
+    @property
+    def signature(self) -> tuple:
+        """Render önbelleği anahtarlarına eklenen geometri özeti"""
+        return (self.page_format.size_mm, self.grid_size, self.margin_mm, self.header_mm)
+
+    def with_grid(self, grid_size: tuple) -> 'PageGeometry':
+        """Aynı sayfa ve kenar boşluklarıyla başka grid boyutundaki geometri"""
+        if tuple(grid_size) == self.grid_size:
+            return self
+        return PageGeometry(self.page_format, grid_size, self.margin_mm, self.header_mm, self.cache_size)
+
+    @property
+    def content_rect(self) -> Rect:
+        """Kenar boşlukları ve başlık dışında kalan yerleşim alanı"""
+        top = self.margin_mm + self.header_mm
+        return (
+            self.margin_mm,
+            top,
+            self.page_format.width_mm - 2 * self.margin_mm,
+            self.page_format.height_mm - top - self.margin_mm
+        )
+
+    @property
+    def cell_size(self) -> Tuple[float, float]:
+        rows, cols = self.grid_size
+        _, _, width, height = self.content_rect
+        return (width / cols, height / rows)
+
+    def cell_rect(self, position: Optional[tuple], span: tuple = (1, 1)) -> Rect:
+        """(satır, sütun) hücresinden başlayıp (genişlik, yükseklik) hücre kaplayan dikdörtgen"""
+        left, top, _, _ = self.content_rect
+        cell_width, cell_height = self.cell_size
+        row, col = position or (0, 0)
+        width, height = span
+        return (left + col * cell_width, top + row * cell_height, width * cell_width, height * cell_height)
+
+    def placement(self, part: Part, cell: Optional[Rect] = None) -> Placement:
+        """Parçanın dönüşümünü hesapla; cell verilmezse grid konumu kullanılır"""
+        cell = cell or self.cell_rect(part.position, part.size)
+        x, y, width, height = cell
+        box = (height, width) if part.rotation % 180 == 90 else (width, height)
+
+        angle = math.radians(part.rotation)
+        cos_scaled = math.cos(angle) * part.scale
+        sin_scaled = math.sin(angle) * part.scale
+        # y ekseni aşağı bakarken saat yönünün tersi dönüş
+        matrix = (cos_scaled, -sin_scaled, sin_scaled, cos_scaled, x + width / 2, y + height / 2)
+        return Placement(part.id, cell, box, part.rotation, part.scale, matrix)
+
+    def placements(self, page: Dict) -> Dict[str, Placement]:
+        """Sayfadaki tüm parçaların dönüşümleri (yerleşim değişmedikçe tekrar hesaplanmaz)"""
+        parts = [part for part in page.get('parts', []) if isinstance(part, Part)]
+        key = tuple(
+            (part.id, tuple(part.position or (0, 0)), tuple(part.size), part.rotation, part.scale)
+            for part in parts
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        result = {part.id: self.placement(part) for part in parts}
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear_cache(self):
+        self._cache.clear()
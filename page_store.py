@@ -0,0 +1,164 @@
+# page_store.py
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from data_structures import Part, FrozenPart, PartType
+
+# Parça tipi <-> int8 kodu
+PART_TYPES: List[PartType] = list(PartType)
+TYPE_CODES: Dict[PartType, int] = {part_type: code for code, part_type in enumerate(PART_TYPES)}
+
+# Yerleştirilmemiş parçanın konumu ve boş metin kodu
+NO_POSITION = -1
+NO_STRING = -1
+
+
+class StringTable:
+    """Tekrarlanan ad, id ve yolları bir kez saklar; sütunlarda sadece indeks tutulur"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self._codes[value] = code
+        return code
+
+    def get(self, code: int) -> Optional[str]:
+        return None if code == NO_STRING else self.strings[code]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class PageStore:
+    """Parçaların sütunlu (struct-of-arrays) deposu; her satır bir parça
+
+    Henüz Project.pages'in yerine geçmez; from_pages/to_pages ile toplu işlemler için kurulur.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.count = 0
+        self.strings = StringTable()
+        # sayfa numarası -> sayfanın 'parts' dışındaki verileri (info, layout...)
+        self.page_data: Dict[int, Dict] = {}
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        columns = {
+            'page': np.zeros(capacity, dtype=np.int32),
+            'type_code': np.zeros(capacity, dtype=np.int8),
+            'size': np.zeros((capacity, 2), dtype=np.int16),                  # (genişlik, yükseklik)
+            'position': np.full((capacity, 2), NO_POSITION, dtype=np.int16),  # (satır, sütun)
+            'rotation': np.zeros(capacity, dtype=np.int16),
+            'scale': np.ones(capacity, dtype=np.float64),
+            'id_code': np.full(capacity, NO_STRING, dtype=np.int32),
+            'name_code': np.full(capacity, NO_STRING, dtype=np.int32),
+            'image_code': np.full(capacity, NO_STRING, dtype=np.int32)
+        }
+        for name, column in columns.items():
+            if self.count:
+                column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.columns = tuple(columns)
+        self.capacity = capacity
+
+    def _reserve(self, count: int):
+        if count > self.capacity:
+            # Kapasite katlanarak büyür; eklemeler ortalamada O(1)
+            self._allocate(max(count, self.capacity * 2))
+
+    def append(self, part: Part, page: int = 0) -> int:
+        """Parçayı ekle, satır numarasını getir"""
+        self._reserve(self.count + 1)
+        row = self.count
+        self.page[row] = page
+        self.type_code[row] = TYPE_CODES[part.type]
+        self.size[row] = part.size
+        self.position[row] = part.position if part.position else (NO_POSITION, NO_POSITION)
+        self.rotation[row] = part.rotation
+        self.scale[row] = part.scale
+        self.id_code[row] = self.strings.intern(part.id)
+        self.name_code[row] = self.strings.intern(part.name)
+        self.image_code[row] = self.strings.intern(part.image_path)
+        self.count += 1
+        return row
+
+    def extend(self, parts: Iterable[Part], page: int = 0) -> np.ndarray:
+        """Parçaları toplu ekle, satır numaralarını getir"""
+        parts = list(parts)
+        self._reserve(self.count + len(parts))
+        start = self.count
+        for part in parts:
+            self.append(part, page)
+        return np.arange(start, self.count)
+
+    @classmethod
+    def from_pages(cls, pages: List[Dict]) -> 'PageStore':
+        store = cls(capacity=sum(len(page.get('parts', [])) for page in pages))
+        for page_number, page in enumerate(pages):
+            store.add_page(page, page_number)
+        return store
+
+    def add_page(self, page: Dict, page_number: int) -> np.ndarray:
+        self.page_data[page_number] = {key: value for key, value in page.items() if key != 'parts'}
+        return self.extend((part for part in page.get('parts', []) if isinstance(part, Part)), page_number)
+
+    def rows(self, page: Optional[int] = None) -> np.ndarray:
+        """Sayfadaki parçaların satır numaraları (page None ise tümü)"""
+        if page is None:
+            return np.arange(self.count)
+        return np.flatnonzero(self.page[:self.count] == page)
+
+    def part(self, row: int) -> FrozenPart:
+        position = self.position[row]
+        return FrozenPart(
+            id=self.strings.get(int(self.id_code[row])),
+            type=PART_TYPES[self.type_code[row]],
+            name=self.strings.get(int(self.name_code[row])),
+            size=(int(self.size[row, 0]), int(self.size[row, 1])),
+            position=None if position[0] == NO_POSITION else (int(position[0]), int(position[1])),
+            rotation=int(self.rotation[row]),
+            scale=float(self.scale[row]),
+            image_path=self.strings.get(int(self.image_code[row]))
+        )
+
+    def parts(self, page: Optional[int] = None) -> List[Part]:
+        """Mevcut yerleşim ve export arayüzleri için değiştirilebilir Part listesi"""
+        return [self.part(row).thaw() for row in self.rows(page)]
+
+    def to_pages(self) -> List[Dict]:
+        page_numbers = sorted(set(self.page_data) | set(np.unique(self.page[:self.count]).tolist()))
+        return [
+            dict(self.page_data.get(page_number, {}), parts=self.parts(page_number))
+            for page_number in page_numbers
+        ]
+
+    def set_positions(self, rows: np.ndarray, positions: np.ndarray):
+        """Yerleşim sonucunu tek seferde yaz"""
+        self.position[rows] = positions
+
+    def occupancy(self, page: int, grid_size: tuple) -> np.ndarray:
+        """Sayfanın grid doluluk sayımı; 1'den büyük hücreler çakışmadır"""
+        rows, cols = grid_size
+        grid = np.zeros((rows, cols), dtype=np.int16)
+        selected = self.rows(page)
+        selected = selected[self.position[selected, 0] != NO_POSITION]
+        for (row, col), (width, height) in zip(self.position[selected], self.size[selected]):
+            grid[row:row + height, col:col + width] += 1
+        return grid
+
+    def areas(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Parçaların ölçek uygulanmış hücre alanları"""
+        rows = self.rows() if rows is None else rows
+        size = self.size[rows].astype(np.float64)
+        return size[:, 0] * size[:, 1] * self.scale[rows] ** 2
+
+    def nbytes(self) -> int:
+        """Sütunların kullandığı bellek (metin tablosu hariç)"""
+        return sum(getattr(self, name).nbytes for name in self.columns)
@@ -0,0 +1,158 @@
+# part_index.py
+from typing import Dict, List, Optional, Tuple
+from data_structures import Part, PartType, Project
+
+
+class PartIndex:
+    """Proje genelinde parça dizini; sayfaları taramadan id, tip ve görüntü yoluyla arama"""
+
+    def __init__(self, project: Optional[Project] = None):
+        self.project: Optional[Project] = None
+        # id -> (sayfa, sayfadaki sıra)
+        self.locations: Dict[str, Tuple[int, int]] = {}
+        # tip / görüntü yolu -> sıralı id kümesi (dict anahtarları ekleme sırasını korur)
+        self.by_type: Dict[PartType, Dict[str, None]] = {}
+        self.by_image: Dict[str, Dict[str, None]] = {}
+        if project is not None:
+            self.rebuild(project)
+
+    def rebuild(self, project: Project):
+        """Dizini projeden baştan kur (proje yüklenince bir kez)"""
+        self.project = project
+        self.locations.clear()
+        self.by_type.clear()
+        self.by_image.clear()
+        for page_num, page in enumerate(project.pages):
+            for index, part in enumerate(page.get('parts', [])):
+                if isinstance(part, Part):
+                    self._index(part, page_num, index)
+
+    def _index(self, part: Part, page_num: int, index: int):
+        self.locations[part.id] = (page_num, index)
+        self.by_type.setdefault(part.type, {})[part.id] = None
+        if part.image_path:
+            self.by_image.setdefault(part.image_path, {})[part.id] = None
+
+    def _unindex(self, part: Part):
+        self.locations.pop(part.id, None)
+        ids = self.by_type.get(part.type)
+        if ids is not None:
+            ids.pop(part.id, None)
+            if not ids:
+                del self.by_type[part.type]
+        if part.image_path:
+            ids = self.by_image.get(part.image_path)
+            if ids is not None:
+                ids.pop(part.id, None)
+                if not ids:
+                    del self.by_image[part.image_path]
+
+    def _pages(self) -> List[Dict]:
+        if self.project is None:
+            raise ValueError("Parça dizini bir projeye bağlı değil")
+        return self.project.pages
+
+    def _check_page(self, page_num: int, allow_new: bool = False):
+        # allow_new: sonuna yeni sayfa eklemek için len(pages) de geçerlidir
+        limit = len(self._pages()) + (1 if allow_new else 0)
+        if not 0 <= page_num < limit:
+            raise ValueError(f"Geçersiz sayfa numarası: {page_num}")
+
+    def _reindex_from(self, page_num: int, start: int):
+        # Araya ekleme ve silmeden sonra sadece aynı sayfada kayan parçalar güncellenir
+        parts = self._pages()[page_num].get('parts', [])
+        for index in range(start, len(parts)):
+            if isinstance(parts[index], Part):
+                self.locations[parts[index].id] = (page_num, index)
+
+    def __contains__(self, part_id: str) -> bool:
+        return part_id in self.locations
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def location(self, part_id: str) -> Optional[Tuple[int, int]]:
+        return self.locations.get(part_id)
+
+    def get(self, part_id: str) -> Optional[Part]:
+        location = self.locations.get(part_id)
+        if location is None or self.project is None:
+            return None
+        page_num, index = location
+        return self.project.pages[page_num]['parts'][index]
+
+    def ids_by_type(self, part_type: PartType) -> List[str]:
+        return list(self.by_type.get(part_type, ()))
+
+    def parts_by_type(self, part_type: PartType) -> List[Part]:
+        """Projedeki tüm bu tipteki parçalar (örn. bütün kesitler)"""
+        return [self.get(part_id) for part_id in self.by_type.get(part_type, ())]
+
+    def ids_by_image(self, image_path: str) -> List[str]:
+        return list(self.by_image.get(image_path, ()))
+
+    def add_part(self, page_num: int, part: Part, index: Optional[int] = None) -> Tuple[int, int]:
+        """Parçayı sayfaya ekle ve dizine işle; page_num == sayfa sayısı ise yeni sayfa açılır"""
+        if part.id in self.locations:
+            raise ValueError(f"Parça zaten projede: {part.id}")
+        self._check_page(page_num, allow_new=True)
+        pages = self._pages()
+        if page_num == len(pages):
+            pages.append({'parts': []})
+        parts = pages[page_num].setdefault('parts', [])
+        index = len(parts) if index is None else max(0, min(index, len(parts)))
+        parts.insert(index, part)
+        self._index(part, page_num, index)
+        self._reindex_from(page_num, index + 1)
+        return (page_num, index)
+
+    def remove_part(self, part_id: str) -> Optional[Part]:
+        """Parçayı sayfasından çıkar"""
+        location = self.locations.get(part_id)
+        if location is None or self.project is None:
+            return None
+        page_num, index = location
+        part = self.project.pages[page_num]['parts'].pop(index)
+        self._unindex(part)
+        self._reindex_from(page_num, index)
+        return part
+
+    def move_part(self, part_id: str, page_num: int, index: Optional[int] = None) -> bool:
+        """Parçayı başka bir sayfaya ya da sıraya taşı"""
+        if part_id not in self.locations:
+            return False
+        # Hedef geçersizse parça yerinden çıkarılmaz
+        self._check_page(page_num, allow_new=True)
+        part = self.remove_part(part_id)
+        if part is None:
+            return False
+        self.add_part(page_num, part, index)
+        return True
+
+    def set_image(self, part_id: str, image_path: Optional[str]) -> bool:
+        part = self.get(part_id)
+        if part is None:
+            return False
+        location = self.locations[part_id]
+        self._unindex(part)
+        part.image_path = image_path
+        self._index(part, *location)
+        return True
+
+    def replace_image(self, old_path: str, new_path: Optional[str]) -> int:
+        """Bir çizimi projedeki her yerde değiştir; değişen parça sayısını getir"""
+        part_ids = self.ids_by_image(old_path)
+        for part_id in part_ids:
+            self.set_image(part_id, new_path)
+        return len(part_ids)
+
+    def remove_page(self, page_num: int) -> List[Part]:
+        """Sayfayı sil; sonraki sayfalardaki parçaların sayfa numaraları kayar"""
+        self._check_page(page_num)
+        page = self.project.pages.pop(page_num)
+        removed = [part for part in page.get('parts', []) if isinstance(part, Part)]
+        for part in removed:
+            self._unindex(part)
+        for later_page in range(page_num, len(self.project.pages)):
+            self._reindex_from(later_page, 0)
+        return removed
@@ -2,16 +2,21 @@
 import json
 import os
 from datetime import datetime
-from typing import Optional, Dict, List
-from data_structures import Project, Part
-from template_manager import TemplateManager
+from typing import Optional, Dict, List, Tuple
+from data_structures import Project, Part, PartType
+from part_index import PartIndex
+from template_system import TemplateManager
 from layout_system import LayoutManager
 
 class ProjectManager:
-    def __init__(self):
+    def __init__(self, template_manager: Optional[TemplateManager] = None):
         self.current_project: Optional[Project] = None
-        self.template_manager = TemplateManager()
+        # Arayüzle aynı şablon deposu verilir; ayrı önbellekler birbirinden habersiz kalmaz
+        self.template_manager = template_manager or TemplateManager()
         self.layout_manager = LayoutManager()
+        # Sayfaları taramadan parça arama; proje yüklenince kurulur, parça ekleme, çıkarma
+        # ve taşıma aşağıdaki metotlarla yapıldıkça güncel tutulur
+        self.part_index = PartIndex()
         
         # Temel dizinleri oluştur
         self.project_path = "projects/"
@@ -26,9 +31,10 @@ class ProjectManager:
             'modified_at': datetime.now().isoformat()
         })
         self.current_project = project
+        self.part_index.rebuild(project)
         return project
 
-    def save_project(self, path: str) -> bool:
+    def save_project(self, path: str, autosave: bool = True) -> bool:
         if not self.current_project:
             return False
             
@@ -43,8 +49,9 @@ class ProjectManager:
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(project_data, f, ensure_ascii=False, indent=4)
                 
-            # Otomatik yedek oluştur
-            self._create_autosave()
+            # Otomatik yedek oluştur (yedeğin kendisi tekrar yedeklenmez)
+            if autosave:
+                self._create_autosave()
             return True
             
         except Exception as e:
@@ -62,12 +69,76 @@ class ProjectManager:
             project.pages = [self.deserialize_page(page) for page in data['pages']]
             
             self.current_project = project
+            self.part_index.rebuild(project)
             return True
             
         except Exception as e:
             print(f"Yükleme hatası: {str(e)}")
             return False
 
+    def _touch(self):
+        self.current_project.metadata['modified_at'] = datetime.now().isoformat()
+
+    def add_part(self, page_num: int, part: Part, index: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """Parçayı sayfaya ekle; (sayfa, sıra) getir"""
+        try:
+            location = self.part_index.add_part(page_num, part, index)
+        except ValueError as e:
+            print(f"Parça ekleme hatası: {str(e)}")
+            return None
+        self._touch()
+        return location
+
+    def remove_part(self, part_id: str) -> Optional[Part]:
+        """Parçayı projeden çıkar"""
+        part = self.part_index.remove_part(part_id)
+        if part is not None:
+            self._touch()
+        return part
+
+    def move_part(self, part_id: str, page_num: int, index: Optional[int] = None) -> bool:
+        """Parçayı başka bir sayfaya ya da sıraya taşı"""
+        try:
+            moved = self.part_index.move_part(part_id, page_num, index)
+        except ValueError as e:
+            print(f"Parça taşıma hatası: {str(e)}")
+            return False
+        if moved:
+            self._touch()
+        return moved
+
+    def replace_image(self, old_path: str, new_path: Optional[str]) -> int:
+        """Bir çizimi projedeki her yerde değiştir; değişen parça sayısını getir"""
+        count = self.part_index.replace_image(old_path, new_path)
+        if count:
+            self._touch()
+        return count
+
+    def add_page(self) -> Optional[int]:
+        """Sona boş sayfa ekle, numarasını getir"""
+        if not self.current_project:
+            return None
+        self.current_project.pages.append({'parts': [], 'layout': {}})
+        self._touch()
+        return len(self.current_project.pages) - 1
+
+    def remove_page(self, page_num: int) -> Optional[List[Part]]:
+        """Sayfayı sil; sayfadaki parçaları getir"""
+        try:
+            removed = self.part_index.remove_page(page_num)
+        except ValueError as e:
+            print(f"Sayfa silme hatası: {str(e)}")
+            return None
+        self._touch()
+        return removed
+
+    def find_part(self, part_id: str) -> Optional[Part]:
+        return self.part_index.get(part_id)
+
+    def parts_by_type(self, part_type: PartType) -> List[Part]:
+        """Projedeki tüm bu tipteki parçalar (örn. bütün kesitler)"""
+        return self.part_index.parts_by_type(part_type)
+
     def serialize_page(self, page: dict) -> dict:
         return {
             'parts': [self.serialize_part(part) for part in page.get('parts', [])],
@@ -110,4 +181,4 @@ class ProjectManager:
                 self.autosave_path,
                 f"{self.current_project.name}_autosave.pafta"
             )
-            self.save_project(autosave_path)
\ No newline at end of file
+            self.save_project(autosave_path, autosave=False)
\ No newline at end of file
@@ -0,0 +1,160 @@
+# render_cache.py
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+from data_structures import Part
+
+
+def default_cache_path() -> str:
+    """Kullanıcıya özel önbellek klasörü (çalışma klasöründen bağımsız)"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'pafta', 'render')
+
+
+class RenderCache:
+    def __init__(self, cache_path: Optional[str] = None, max_size_mb: float = 512):
+        # Verilmezse kullanıcı önbellek klasörü; proje yanında tutmak için yol verilir
+        self.cache_path = cache_path or default_cache_path()
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        # Klasör ilk yazmada oluşturulur; önbellek kapalıyken diske dokunulmaz
+
+        # path -> (mtime_ns, dosya boyutu, içerik özeti)
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def image_digest(self, image_path: Optional[str]) -> Optional[str]:
+        """Görüntü içeriğinin özetini getir (dosya değişmedikçe tekrar okunmaz)"""
+        if not image_path:
+            return None
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._digests.get(image_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        sha = hashlib.sha256()
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._digests[image_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def page_fingerprint(self, page: Dict, image_paths: Dict[str, Optional[str]], extra: Dict) -> str:
+        """Sayfanın parçaları, konumları, dönüşümleri ve görüntü içeriklerinden anahtar üret"""
+        parts = []
+        for part in page.get('parts', []):
+            if isinstance(part, Part):
+                parts.append({
+                    'type': part.type.name,
+                    'name': part.name,
+                    'size': list(part.size),
+                    'position': list(part.position) if part.position else None,
+                    'rotation': part.rotation,
+                    'scale': part.scale,
+                    'image': self.image_digest(image_paths.get(part.id, part.image_path))
+                })
+
+        data = {
+            'parts': parts,
+            'info': page.get('info', {}),
+            'extra': extra
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+    def _entry_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_path, f"{key}.{suffix}")
+
+    def get(self, key: str, suffix: str) -> Optional[str]:
+        """Önbellekteki dosyanın yolunu getir, yoksa None"""
+        path = self._entry_path(key, suffix)
+        if not os.path.exists(path):
+            return None
+        # En son kullanım zamanını güncelle (tahliye sırası için)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return path
+
+    def reserve(self, key: str, suffix: str) -> str:
+        """Yeni render'ın yazılacağı benzersiz geçici yolu getir"""
+        os.makedirs(self.cache_path, exist_ok=True)
+        # Aynı sayfanın eşzamanlı export'ları farklı geçici dosyalara yazar
+        fd, temp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=f".{suffix}.tmp", dir=self.cache_path)
+        os.close(fd)
+        return temp_path
+
+    def commit(self, key: str, suffix: str, temp_path: str) -> str:
+        """Geçici dosyayı önbelleğe al ve boyut sınırını uygula"""
+        path = self._entry_path(key, suffix)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def discard(self, temp_path: str):
+        """Yarım kalan render'ın geçici dosyasını sil"""
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    def put(self, key: str, suffix: str, source_path: str) -> str:
+        """Mevcut bir dosyayı önbelleğe kopyala"""
+        temp_path = self.reserve(key, suffix)
+        try:
+            shutil.copyfile(source_path, temp_path)
+        except Exception:
+            self.discard(temp_path)
+            raise
+        return self.commit(key, suffix, temp_path)
+
+    def evict(self):
+        """Toplam boyut sınırı aşılırsa en uzun süredir kullanılmayanları sil"""
+        if not os.path.isdir(self.cache_path):
+            return
+        try:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_path):
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(self.cache_path, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_size:
+                    break
+                os.remove(path)
+                total -= size
+        except Exception as e:
+            print(f"Render önbelleği temizleme hatası: {str(e)}")
+
+    def clear(self):
+        """Tüm önbelleği temizle"""
+        if not os.path.isdir(self.cache_path):
+            return
+        for name in os.listdir(self.cache_path):
+            try:
+                os.remove(os.path.join(self.cache_path, name))
+            except OSError:
+                pass
@@ -1,55 +1,165 @@
 # resolution_checker.py
 from PIL import Image
-from typing import Dict, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, List, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from data_structures import Project, Part
+from page_format import PAGE_FORMATS, DPI_PRESETS
+import threading
 import os
 
 class ResolutionChecker:
-    def __init__(self):
-        self.min_dpi = 300
+    def __init__(self, cache_size: int = 16384):
+        self.min_dpi = DPI_PRESETS['print']
+        # 300 DPI'da A0-A5 piksel boyutları (ortak sayfa formatı tablosundan)
         self.min_dimensions = {
-            'A0': (9933, 14043),  # 300 DPI'da A0 boyutu
-            'A1': (7016, 9933),   # 300 DPI'da A1 boyutu
-            'A2': (4961, 7016),   # 300 DPI'da A2 boyutu
-            'A3': (3508, 4961),   # 300 DPI'da A3 boyutu
-            'A4': (2480, 3508),   # 300 DPI'da A4 boyutu
-            'A5': (1748, 2480)    # 300 DPI'da A5 boyutu
+            name: page_format.size_px(self.min_dpi)
+            for name, page_format in PAGE_FORMATS.items()
         }
         
-        self.optimal_dpi = {
-            'print': 300,
-            'web': 72,
-            'preview': 150
-        }
+        self.optimal_dpi = dict(DPI_PRESETS)
+        
+        # path -> (mtime_ns, dosya boyutu, başlık bilgisi), en son kullanılan sonda;
+        # kayıt başına birkaç yüz bayt: binlerce çizimlik sürüm kontrolü tek seferde sığar
+        self.cache_size = cache_size
+        self._header_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def check_image(self, image_path: str, format: str = 'A3') -> Dict:
         """Görüntü çözünürlüğünü ve boyutlarını kontrol et"""
+        header = self.read_header(image_path)
+        if 'error' in header:
+            return header
+        return self._evaluate_header(header, format)
+    
+    def read_header(self, image_path: str) -> Dict:
+        """Piksel verisini çözmeden boyut, DPI ve renk modunu oku (path + mtime ile önbellekli)"""
+        try:
+            stat = os.stat(image_path)
+        except FileNotFoundError:
+            return {'error': 'Dosya bulunamadı'}
+        except Exception as e:
+            return {'error': str(e)}
+        
+        with self._cache_lock:
+            cached = self._header_cache.get(image_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._header_cache.move_to_end(image_path)
+                # Çağıran değiştirse de önbellekteki kayıt bozulmaz (değerler değişmez tipler)
+                return dict(cached[2])
+        
         try:
-            if not os.path.exists(image_path):
-                return {'error': 'Dosya bulunamadı'}
-                
+            # Image.open sadece başlığı okur; load() çağrılmadıkça pikseller çözülmez
             with Image.open(image_path) as img:
-                width, height = img.size
-                dpi = img.info.get('dpi', (72, 72))
-                
-                min_width, min_height = self.min_dimensions.get(format, (0, 0))
-                
-                result = {
-                    'valid': width >= min_width and height >= min_height and dpi[0] >= self.min_dpi,
-                    'current_size': (width, height),
-                    'current_dpi': dpi,
-                    'required_size': (min_width, min_height),
-                    'required_dpi': self.min_dpi,
-                    'format': format,
-                    'file_size': os.path.getsize(image_path) / (1024 * 1024)  # MB cinsinden
+                header = {
+                    'size': img.size,
+                    'dpi': img.info.get('dpi', (72, 72)),
+                    'mode': img.mode,
+                    'image_format': img.format,
+                    'file_size': stat.st_size / (1024 * 1024)  # MB cinsinden
                 }
-                
-                if not result['valid']:
-                    result['issues'] = self._get_issues(width, height, dpi[0], min_width, min_height)
-                
-                return result
-                
         except Exception as e:
             return {'error': str(e)}
+        
+        with self._cache_lock:
+            self._header_cache[image_path] = (stat.st_mtime_ns, stat.st_size, header)
+            self._header_cache.move_to_end(image_path)
+            if len(self._header_cache) > self.cache_size:
+                self._header_cache.popitem(last=False)
+        return dict(header)
+    
+    def _evaluate_header(self, header: Dict, format: str) -> Dict:
+        """Okunan başlığı bir kağıt formatının gereksinimlerine göre değerlendir"""
+        width, height = header['size']
+        dpi = header['dpi']
+        min_width, min_height = self.min_dimensions.get(format, (0, 0))
+        
+        result = {
+            'valid': width >= min_width and height >= min_height and dpi[0] >= self.min_dpi,
+            'current_size': (width, height),
+            'current_dpi': dpi,
+            'required_size': (min_width, min_height),
+            'required_dpi': self.min_dpi,
+            'format': format,
+            'mode': header['mode'],
+            'file_size': header['file_size']
+        }
+        
+        if not result['valid']:
+            result['issues'] = self._get_issues(width, height, dpi[0], min_width, min_height)
+        
+        return result
+    
+    def check_batch(self, image_paths: Iterable[str], formats: Optional[List[str]] = None,
+                    max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """Birçok görüntüyü thread havuzunda kontrol et: path -> {format: sonuç}"""
+        formats = formats or list(self.min_dimensions.keys())
+        unique_paths = list(dict.fromkeys(image_paths))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            headers = dict(zip(unique_paths, executor.map(self.read_header, unique_paths)))
+        
+        results = {}
+        for path, header in headers.items():
+            if 'error' in header:
+                results[path] = {'error': header['error']}
+            else:
+                results[path] = {fmt: self._evaluate_header(header, fmt) for fmt in formats}
+        return results
+    
+    def check_project(self, project: Project, formats: Optional[List[str]] = None,
+                      max_workers: Optional[int] = None) -> Dict:
+        """Projenin tüm sayfalarındaki görüntüler için yapılandırılmış rapor üret"""
+        formats = formats or list(self.min_dimensions.keys())
+        
+        # Önce tüm görüntü yollarını topla, sonra tek seferde paralel kontrol et
+        page_parts: List[List[Part]] = []
+        image_paths = []
+        for page in project.pages:
+            parts = [
+                part for part in page.get('parts', [])
+                if isinstance(part, Part) and part.image_path
+            ]
+            page_parts.append(parts)
+            image_paths.extend(part.image_path for part in parts)
+        
+        results = self.check_batch(image_paths, formats, max_workers)
+        
+        summary = {
+            'total_images': len(results),
+            'errors': sum(1 for result in results.values() if 'error' in result),
+            'valid': {fmt: 0 for fmt in formats},
+            'invalid': {fmt: 0 for fmt in formats}
+        }
+        for result in results.values():
+            if 'error' in result:
+                continue
+            for fmt in formats:
+                summary['valid' if result[fmt]['valid'] else 'invalid'][fmt] += 1
+        
+        pages = []
+        for page_num, parts in enumerate(page_parts):
+            pages.append({
+                'page': page_num,
+                'parts': [{
+                    'part_id': part.id,
+                    'name': part.name,
+                    'image_path': part.image_path,
+                    'results': results[part.image_path]
+                } for part in parts]
+            })
+        
+        return {
+            'project': project.name,
+            'formats': formats,
+            'pages': pages,
+            'summary': summary
+        }
+    
+    def clear_cache(self):
+        """Başlık önbelleğini temizle"""
+        with self._cache_lock:
+            self._header_cache.clear()
     
     def _get_issues(self, width: int, height: int, dpi: int, min_width: int, min_height: int) -> list:
         """Tespit edilen sorunları listele"""
@@ -70,6 +180,15 @@ class ResolutionChecker:
         height_mm = (pixel_dimensions[1] / dpi) * 25.4
         return (width_mm, height_mm)
     
+    def calculate_effective_dpi(self, pixel_dimensions: Tuple[int, int],
+                                placed_size_mm: Tuple[float, float]) -> Tuple[float, float]:
+        """Sayfaya yerleştirilen görüntünün etkin DPI değerini hesapla"""
+        width_in = placed_size_mm[0] / 25.4
+        height_in = placed_size_mm[1] / 25.4
+        if width_in <= 0 or height_in <= 0:
+            return (0.0, 0.0)
+        return (pixel_dimensions[0] / width_in, pixel_dimensions[1] / height_in)
+    
     def suggest_resolution(self, format: str, target_dpi: int = 300) -> Dict:
         """Önerilen çözünürlük bilgilerini getir"""
         if format not in self.min_dimensions:
@@ -1,21 +1,75 @@
 # security_manager.py
+import calendar
 import hashlib
+import heapq
+import threading
+import time
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Iterable
+from token_store import TokenStore, MemoryTokenStore
 
 class SecurityManager:
-    def __init__(self):
+    def __init__(self, max_cached_tokens: int = 10000, token_store: Optional[TokenStore] = None):
         self.secret_key = "your-secret-key"  # Gerçek uygulamada environment variable'dan alınmalı
         self.users = {}
-        self.active_tokens = set()  # Aktif tokenları takip etmek için
+        # Aktif token özetleri; çok süreçli kurulumda paylaşılan depo verilir
+        self.token_store = token_store or MemoryTokenStore()
         
+        # Doğrulanmış token özeti -> (son geçerlilik zamanı, claim'ler); en son kullanılan sonda
+        self.max_cached_tokens = max_cached_tokens
+        self.token_cache: OrderedDict = OrderedDict()
+        # (son geçerlilik zamanı, özet) min-heap'i; süresi dolan claim'ler buradan temizlenir
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        
+        # Rolün kendi izinleri ve miras aldığı roller (admin ⊇ editor ⊇ viewer)
+        self.role_definitions = {
+            'viewer': {'actions': ['read'], 'inherits': []},
+            'editor': {'actions': ['write', 'export'], 'inherits': ['viewer']},
+            'admin': {'actions': ['delete', 'manage_users'], 'inherits': ['editor']}
+        }
+        self.compile_permissions()
+    
+    def compile_permissions(self):
+        """Rol mirasını bir kez çöz; her eylem bir bit, her rol bir bit maskesi olur"""
+        self.action_bits: Dict[str, int] = {}
+        for definition in self.role_definitions.values():
+            for action in definition['actions']:
+                if action not in self.action_bits:
+                    self.action_bits[action] = 1 << len(self.action_bits)
+        
+        self.role_masks: Dict[str, int] = {}
+        
+        def resolve(role: str, visiting: frozenset) -> int:
+            if role in self.role_masks:
+                return self.role_masks[role]
+            if role in visiting:
+                raise ValueError(f"Döngüsel rol mirası: {role}")
+            definition = self.role_definitions[role]
+            mask = 0
+            for action in definition['actions']:
+                mask |= self.action_bits[action]
+            for parent in definition['inherits']:
+                mask |= resolve(parent, visiting | {role})
+            self.role_masks[role] = mask
+            return mask
+        
+        for role in self.role_definitions:
+            resolve(role, frozenset())
+        
+        # Eski arayüz için açılmış izin listeleri
         self.permissions = {
-            'admin': ['read', 'write', 'export', 'delete', 'manage_users'],
-            'editor': ['read', 'write', 'export'],
-            'viewer': ['read']
+            role: [action for action, bit in self.action_bits.items() if mask & bit]
+            for role, mask in self.role_masks.items()
         }
     
+    def add_role(self, role: str, actions: List[str], inherits: Optional[List[str]] = None):
+        """Yeni rol ekle ya da güncelle"""
+        self.role_definitions[role] = {'actions': list(actions), 'inherits': list(inherits or [])}
+        self.compile_permissions()
+    
     def create_token(self, username: str, role: str) -> str:
         """Kullanıcı için JWT token oluştur"""
         payload = {
@@ -25,20 +79,77 @@ class SecurityManager:
             'iat': datetime.utcnow()
         }
         token = jwt.encode(payload, self.secret_key, algorithm='HS256')
-        self.active_tokens.add(token)
+        # exp UTC olarak kodlanır (naive datetime yerel saat sanılmamalı)
+        self.token_store.add(self._token_digest(token), calendar.timegm(payload['exp'].utctimetuple()))
         return token
     
+    def _token_digest(self, token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+    
+    def sweep_expired(self, now: Optional[float] = None) -> int:
+        """Süresi dolan claim'leri önbellekten sil (kilit altında çağrılır)"""
+        now = time.time() if now is None else now
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, digest = heapq.heappop(self._expiry_heap)
+            cached = self.token_cache.get(digest)
+            # Yeniden önbelleğe alınmış token eski heap kaydıyla silinmez
+            if cached is not None and cached[0] <= now:
+                del self.token_cache[digest]
+                removed += 1
+        return removed
+    
+    def _compact_heap(self):
+        """Önbellekten düşmüş tokenların heap kayıtlarını at (kilit altında çağrılır)"""
+        # LRU'dan düşen token tekrar doğrulanınca yeni kayıt eklenir; heap önbellek
+        # boyutunun iki katını geçince önbellekteki kayıtlardan yeniden kurulur
+        if len(self._expiry_heap) > 2 * self.max_cached_tokens:
+            self._expiry_heap = [(expires_at, digest) for digest, (expires_at, _) in self.token_cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def purge_expired_tokens(self, now: Optional[float] = None) -> int:
+        """Süresi dolan tokenları depodan sil (periyodik bakım için)"""
+        with self._lock:
+            self.sweep_expired(now)
+        return self.token_store.purge_expired(now)
+    
     def verify_token(self, token: str) -> Optional[Dict]:
-        """Token'ı doğrula"""
+        """Token'ı doğrula (doğrulanmış claim'ler süreleri dolana kadar önbellekte tutulur)"""
+        now = time.time()
+        digest = self._token_digest(token)
+        # İptal kontrolü her çağrıda depoya sorulur (başka süreçte yapılmış olabilir)
+        if not self.token_store.is_active(digest, now):
+            with self._lock:
+                self.token_cache.pop(digest, None)
+            return None
+        with self._lock:
+            self.sweep_expired(now)
+            cached = self.token_cache.get(digest)
+            if cached is not None and cached[0] > now:
+                self.token_cache.move_to_end(digest)
+                return cached[1]
+        
+        # Önbellekte yoksa imzayı tam olarak doğrula
         try:
-            if token not in self.active_tokens:
-                return None
-            return jwt.decode(token, self.secret_key, algorithms=['HS256'])
+            payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
         except jwt.ExpiredSignatureError:
-            self.active_tokens.discard(token)
+            self.token_store.revoke(digest)
             return None
-        except:
+        except jwt.InvalidTokenError:
             return None
+        
+        with self._lock:
+            expires_at = float(payload.get('exp', now))
+            previous = self.token_cache.get(digest)
+            self.token_cache[digest] = (expires_at, payload)
+            self.token_cache.move_to_end(digest)
+            # Aynı son geçerlilik için heap'te zaten kayıt varsa tekrar eklenmez
+            if previous is None or previous[0] != expires_at:
+                heapq.heappush(self._expiry_heap, (expires_at, digest))
+            if len(self.token_cache) > self.max_cached_tokens:
+                self.token_cache.popitem(last=False)
+            self._compact_heap()
+        return payload
     
     def check_permission(self, token: str, action: str) -> bool:
         """Kullanıcının yetkisini kontrol et"""
@@ -46,15 +157,28 @@ class SecurityManager:
         if not payload:
             return False
         
-        role = payload.get('role')
-        return action in self.permissions.get(role, [])
+        bit = self.action_bits.get(action, 0)
+        return bit != 0 and self.role_masks.get(payload.get('role'), 0) & bit == bit
+    
+    def authorize_batch(self, requests: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Birden çok (token, eylem) çiftini yetkilendir; her token bir kez doğrulanır"""
+        masks: Dict[str, int] = {}
+        results = []
+        for token, action in requests:
+            if token not in masks:
+                payload = self.verify_token(token)
+                masks[token] = self.role_masks.get(payload.get('role'), 0) if payload else 0
+            bit = self.action_bits.get(action, 0)
+            results.append(bit != 0 and masks[token] & bit == bit)
+        return results
     
     def invalidate_token(self, token: str) -> bool:
         """Token'ı geçersiz kıl (logout için)"""
-        if token in self.active_tokens:
-            self.active_tokens.discard(token)
-            return True
-        return False
+        digest = self._token_digest(token)
+        with self._lock:
+            # Heap kaydı süresi dolunca kendiliğinden atılır
+            self.token_cache.pop(digest, None)
+        return self.token_store.revoke(digest)
     
     def get_user_permissions(self, role: str) -> List[str]:
         """Rol için izinleri getir"""
@@ -0,0 +1,199 @@
+# sheet_preview.py
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from PIL import Image, ImageDraw
+from data_structures import Part
+from page_format import MM_PER_INCH, resolve_dpi
+from page_geometry import PageGeometry, Placement
+
+# (sol, üst, sağ, alt) piksel kutusu
+Box = Tuple[int, int, int, int]
+
+
+def _intersect(a: Box, b: Box) -> Optional[Box]:
+    box = (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+    return box if box[0] < box[2] and box[1] < box[3] else None
+
+
+def build_thumbnail(thumbnail_key: tuple) -> Optional[Image.Image]:
+    """Parça görüntüsünü önizleme boyutunda çöz (işçi thread'de çalışabilir)"""
+    image_path, _, box_px, rotation = thumbnail_key
+    try:
+        with Image.open(image_path) as image:
+            # JPEG'de çözme sırasında küçült; tam çözünürlük belleğe alınmaz
+            image.draft('RGB', box_px)
+            image.load()
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+            fit = min(box_px[0] / image.width, box_px[1] / image.height)
+            size = (max(1, round(image.width * fit)), max(1, round(image.height * fit)))
+            thumbnail = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    except Exception as e:
+        print(f"Önizleme görüntüsü hatası: {str(e)}")
+        return None
+
+    if rotation:
+        thumbnail = thumbnail.convert('RGBA').rotate(rotation, expand=True)
+    return thumbnail
+
+
+class SheetPreview:
+    def __init__(self, geometry: Optional[PageGeometry] = None, dpi: Union[int, str] = 'preview',
+                 cache_size: int = 64):
+        self.dpi = resolve_dpi(dpi)
+        self.cache_size = cache_size
+        # (yol, mtime, piksel boyutu, rotasyon) -> küçültülmüş parça görüntüsü (çözülemediyse None)
+        self.thumbnails: OrderedDict = OrderedDict()
+        # Son render'da önbellekte olmayan, dışarıda hazırlanması beklenen küçük resimler
+        self.pending: List[tuple] = []
+        # Son render'daki parçaların küçük resimleri; önbellek sınırında atılmazlar
+        self._live: set = set()
+        self.set_geometry(geometry or PageGeometry())
+
+    def set_geometry(self, geometry: PageGeometry):
+        """Sayfa geometrisini değiştir; tuval sıfırdan çizilir"""
+        self.geometry = geometry
+        self.px_per_mm = self.dpi / MM_PER_INCH
+        self.background = self._render_background()
+        self.canvas = self.background.copy()
+        # part_id -> (imza, kapladığı kutu, küçük resim anahtarı)
+        self._drawn: Dict[str, tuple] = {}
+
+    def _px(self, rect: Tuple[float, float, float, float]) -> Box:
+        x, y, width, height = rect
+        return (
+            int(x * self.px_per_mm),
+            int(y * self.px_per_mm),
+            int(round((x + width) * self.px_per_mm)),
+            int(round((y + height) * self.px_per_mm))
+        )
+
+    def _render_background(self) -> Image.Image:
+        """Boş sayfa ve grid hücre çizgileri (bir kez çizilir)"""
+        image = Image.new('RGB', self.geometry.page_format.size_px(self.dpi), 'white')
+        draw = ImageDraw.Draw(image)
+        rows, cols = self.geometry.grid_size
+        for row in range(rows):
+            for col in range(cols):
+                draw.rectangle(self._px(self.geometry.cell_rect((row, col))), outline='#dddddd')
+        return image
+
+    def render(self, parts: List[Part], build_missing: bool = True) -> List[Box]:
+        """Sadece değişen parçaların alanlarını yeniden çiz; güncellenen kutuları getir
+
+        build_missing False ise eksik küçük resimler çözülmez; parça çerçevesiyle çizilir ve
+        anahtarı pending'e eklenir. add_thumbnail sonrası render o parçayı yeniden çizer.
+        """
+        placements = self.geometry.placements({'parts': parts})
+        self.pending = []
+        keys = {part.id: self._thumbnail_key(part, placements[part.id]) for part in parts}
+        self._live = set(keys.values())
+        current = {}
+        for part in parts:
+            placement = placements[part.id]
+            thumbnail_key = keys[part.id]
+            if thumbnail_key and thumbnail_key not in self.thumbnails:
+                if build_missing:
+                    self.add_thumbnail(thumbnail_key, build_thumbnail(thumbnail_key))
+                elif thumbnail_key not in self.pending:
+                    self.pending.append(thumbnail_key)
+            # Küçük resim sonradan gelirse imza değişir ve parça yeniden çizilir
+            ready = thumbnail_key in self.thumbnails
+            signature = (part.type.name, part.name, placement, thumbnail_key, ready)
+            current[part.id] = (signature, part, placement, thumbnail_key)
+
+        dirty: List[Box] = []
+        for part_id, (signature, box, _) in self._drawn.items():
+            if part_id not in current or current[part_id][0] != signature:
+                dirty.append(box)
+        for part_id, (signature, part, placement, thumbnail_key) in current.items():
+            if part_id not in self._drawn or self._drawn[part_id][0] != signature:
+                dirty.append(self._bounds(placement, thumbnail_key))
+
+        self._drawn = {
+            part_id: (signature, self._bounds(placement, thumbnail_key), thumbnail_key)
+            for part_id, (signature, part, placement, thumbnail_key) in current.items()
+        }
+
+        for box in dirty:
+            # Alanı boş sayfayla temizle, kesişen tüm parçaları bu alana kırparak yeniden çiz
+            self.canvas.paste(self.background.crop(box), box[:2])
+            for part_id, (signature, part, placement, thumbnail_key) in current.items():
+                if _intersect(box, self._drawn[part_id][1]):
+                    self._draw_part(part, placement, thumbnail_key, box)
+        return dirty
+
+    def _thumbnail_key(self, part: Part, placement: Placement) -> Optional[tuple]:
+        if not part.image_path:
+            return None
+        try:
+            mtime = os.stat(part.image_path).st_mtime_ns
+        except OSError:
+            return None
+        box_px = (
+            max(1, round(placement.box[0] * placement.scale * self.px_per_mm)),
+            max(1, round(placement.box[1] * placement.scale * self.px_per_mm))
+        )
+        return (part.image_path, mtime, box_px, placement.rotation % 360)
+
+    def add_thumbnail(self, thumbnail_key: tuple, thumbnail: Optional[Image.Image]):
+        """Hazırlanan küçük resmi önbelleğe al (None: çözülemedi, tekrar denenmez)"""
+        self.thumbnails[thumbnail_key] = thumbnail
+        self.thumbnails.move_to_end(thumbnail_key)
+        excess = len(self.thumbnails) - self.cache_size
+        if excess > 0:
+            for key in [key for key in self.thumbnails if key not in self._live][:excess]:
+                del self.thumbnails[key]
+
+    def _thumbnail(self, thumbnail_key: tuple) -> Optional[Image.Image]:
+        """Önbellekteki küçük resim; yoksa None (burada dosya çözülmez)"""
+        thumbnail = self.thumbnails.get(thumbnail_key)
+        if thumbnail is not None:
+            self.thumbnails.move_to_end(thumbnail_key)
+        return thumbnail
+
+    def _image_box(self, placement: Placement, thumbnail: Image.Image) -> Box:
+        center_x, center_y = placement.center
+        left = round(center_x * self.px_per_mm - thumbnail.width / 2)
+        top = round(center_y * self.px_per_mm - thumbnail.height / 2)
+        return (left, top, left + thumbnail.width, top + thumbnail.height)
+
+    def _bounds(self, placement: Placement, thumbnail_key: Optional[tuple]) -> Box:
+        """Parçanın çizim sırasında değiştirebileceği tüm alan (hücre + taşan görüntü)"""
+        box = self._px(placement.cell)
+        thumbnail = self._thumbnail(thumbnail_key) if thumbnail_key else None
+        if thumbnail is not None:
+            image_box = self._image_box(placement, thumbnail)
+            box = (
+                min(box[0], image_box[0]), min(box[1], image_box[1]),
+                max(box[2], image_box[2]), max(box[3], image_box[3])
+            )
+        width, height = self.background.size
+        return (max(0, box[0]), max(0, box[1]), min(width, box[2]), min(height, box[3]))
+
+    def _draw_part(self, part: Part, placement: Placement, thumbnail_key: Optional[tuple], clip: Box):
+        thumbnail = self._thumbnail(thumbnail_key) if thumbnail_key else None
+        if thumbnail is not None:
+            image_box = self._image_box(placement, thumbnail)
+            visible = _intersect(image_box, clip)
+            if visible:
+                piece = thumbnail.crop((
+                    visible[0] - image_box[0], visible[1] - image_box[1],
+                    visible[2] - image_box[0], visible[3] - image_box[1]
+                ))
+                self.canvas.paste(piece, visible[:2], piece if piece.mode == 'RGBA' else None)
+
+        # Hücre çerçevesi ve parça adı; sadece kırpma alanına çizilir
+        cell = self._px(placement.cell)
+        visible = _intersect(cell, clip)
+        if visible:
+            layer = self.canvas.crop(visible)
+            draw = ImageDraw.Draw(layer)
+            offset_x, offset_y = cell[0] - visible[0], cell[1] - visible[1]
+            draw.rectangle(
+                (offset_x, offset_y, offset_x + cell[2] - cell[0] - 1, offset_y + cell[3] - cell[1] - 1),
+                outline='#2196F3'
+            )
+            draw.text((offset_x + 4, offset_y + cell[3] - cell[1] - 14), part.name, fill='#1976D2')
+            self.canvas.paste(layer, visible[:2])
@@ -0,0 +1,199 @@
+# template_catalog.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+
+@dataclass
+class TemplateEntry:
+    """Şablon listesinde gösterilen özet; gövde seçilene kadar ayrıştırılmaz"""
+    id: str
+    name: str
+    description: str
+    mtime_ns: int
+    size: int
+    hash: str
+
+
+class TemplateCatalog:
+    def __init__(self, templates_path: str = "templates/",
+                 index_path: str = "cache/template_index.json", cache_size: int = 32):
+        self.templates_path = templates_path
+        self.index_path = index_path
+        os.makedirs(self.templates_path, exist_ok=True)
+
+        # şablon id -> özet; dosyadan okunur, sadece değişen dosyalar yeniden ayrıştırılır
+        self.entries: Dict[str, TemplateEntry] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        # içerik özeti -> ayrıştırılmış gövde, en son kullanılan sonda
+        self.cache_size = cache_size
+        self._bodies: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._load_index()
+
+    def _template_file(self, template_id: str) -> str:
+        return os.path.join(self.templates_path, f"{template_id}.json")
+
+    def _load_index(self):
+        try:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('templates_path') == os.path.abspath(self.templates_path):
+                    self.entries = {
+                        entry['id']: TemplateEntry(**entry) for entry in data.get('entries', [])
+                    }
+        except Exception as e:
+            print(f"Şablon dizini yükleme hatası: {str(e)}")
+            self.entries = {}
+
+    def _save_index(self):
+        try:
+            directory = os.path.dirname(self.index_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            data = {
+                'templates_path': os.path.abspath(self.templates_path),
+                'entries': [asdict(entry) for entry in self.entries.values()]
+            }
+            temp_file = self.index_path + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_path)
+        except Exception as e:
+            print(f"Şablon dizini kaydetme hatası: {str(e)}")
+
+    def _read(self, template_id: str, stat: os.stat_result) -> Optional[Dict]:
+        """Şablon dosyasını ayrıştır, özetini dizine ve gövdesini önbelleğe yaz"""
+        try:
+            with open(self._template_file(template_id), 'rb') as f:
+                raw = f.read()
+            data = json.loads(raw.decode('utf-8'))
+        except Exception as e:
+            print(f"Şablon yükleme hatası: {str(e)}")
+            return None
+
+        digest = hashlib.sha256(raw).hexdigest()
+        self.entries[template_id] = TemplateEntry(
+            id=template_id,
+            name=data.get('name', template_id),
+            description=data.get('description', ''),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            hash=digest
+        )
+        self._remember(digest, data)
+        return data
+
+    def _remember(self, digest: str, data: Dict):
+        self._bodies[digest] = data
+        self._bodies.move_to_end(digest)
+        if len(self._bodies) > self.cache_size:
+            self._bodies.popitem(last=False)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Klasör değiştiyse dizini güncelle; sadece yeni ya da değişen dosyalar okunur"""
+        with self._lock:
+            try:
+                dir_mtime_ns = os.stat(self.templates_path).st_mtime_ns
+            except OSError:
+                return False
+            # Dosya ekleme, silme ve atomik kaydetme klasör zamanını değiştirir
+            if not force and dir_mtime_ns == self._dir_mtime_ns:
+                return False
+
+            changed = False
+            seen = set()
+            with os.scandir(self.templates_path) as scanner:
+                for item in scanner:
+                    if not item.name.endswith('.json') or not item.is_file():
+                        continue
+                    template_id = item.name[:-len('.json')]
+                    seen.add(template_id)
+                    stat = item.stat()
+                    entry = self.entries.get(template_id)
+                    if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                        continue
+                    if self._read(template_id, stat) is None:
+                        self.entries.pop(template_id, None)
+                    changed = True
+
+            for template_id in [template_id for template_id in self.entries if template_id not in seen]:
+                del self.entries[template_id]
+                changed = True
+
+            self._dir_mtime_ns = dir_mtime_ns
+            if changed:
+                self._save_index()
+            return changed
+
+    def list_entries(self) -> List[TemplateEntry]:
+        """Güncel şablon özetleri, isme göre sıralı"""
+        self.refresh()
+        with self._lock:
+            return sorted(self.entries.values(), key=lambda entry: entry.name.lower())
+
+    def load(self, template_id: str) -> Optional[Dict]:
+        """Şablonun tam gövdesini getir (dosya değişmedikçe tekrar ayrıştırılmaz)"""
+        with self._lock:
+            try:
+                stat = os.stat(self._template_file(template_id))
+            except OSError:
+                self.entries.pop(template_id, None)
+                return None
+
+            entry = self.entries.get(template_id)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                data = self._bodies.get(entry.hash)
+                if data is not None:
+                    self._bodies.move_to_end(entry.hash)
+                    return data
+            data = self._read(template_id, stat)
+            if data is not None and entry != self.entries.get(template_id):
+                self._save_index()
+            return data
+
+    def save(self, template_id: str, data: Dict) -> bool:
+        """Şablonu atomik olarak yaz; dosya yeniden ayrıştırılmadan dizine işlenir"""
+        with self._lock:
+            try:
+                path = self._template_file(template_id)
+                raw = json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8')
+                with open(path + ".tmp", 'wb') as f:
+                    f.write(raw)
+                os.replace(path + ".tmp", path)
+
+                stat = os.stat(path)
+                digest = hashlib.sha256(raw).hexdigest()
+                self.entries[template_id] = TemplateEntry(
+                    id=template_id,
+                    name=data.get('name', template_id),
+                    description=data.get('description', ''),
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    hash=digest
+                )
+                self._remember(digest, data)
+                self._save_index()
+                return True
+            except Exception as e:
+                print(f"Şablon kaydetme hatası: {str(e)}")
+                return False
+
+    def delete(self, template_id: str) -> bool:
+        with self._lock:
+            try:
+                path = self._template_file(template_id)
+                if not os.path.exists(path):
+                    return False
+                os.remove(path)
+                self.entries.pop(template_id, None)
+                self._save_index()
+                return True
+            except Exception as e:
+                print(f"Şablon silme hatası: {str(e)}")
+                return False
@@ -0,0 +1,67 @@
+# template_layout.py
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from data_structures import PartType, Template
+
+# ((satır, sütun), (genişlik, yükseklik)); layout_rules boyutları (satır, sütun) sırasındadır
+Slot = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def _part_type(part_key: Union[str, PartType]) -> PartType:
+    """'front_view' gibi kural anahtarını ya da 'Ön Görünüş' gibi değeri parça tipine çevir"""
+    if isinstance(part_key, PartType):
+        return part_key
+    try:
+        return PartType[part_key.upper()]
+    except KeyError:
+        return PartType(part_key)
+
+
+class CompiledLayout:
+    """Şablonun layout_rules'u grid üzerinde bir kez doğrulanmış hali; uygulamada arama yapılmaz"""
+
+    def __init__(self, layout_rules: Dict, grid_size: tuple):
+        self.grid_size = tuple(grid_size)
+        rows, cols = self.grid_size
+        self.slots: Dict[PartType, Slot] = {}
+        # Kuralların kapladığı hücreler; bit = satır * sütun sayısı + sütun
+        self.mask = 0
+
+        for part_key, rule in layout_rules.items():
+            try:
+                part_type = _part_type(part_key)
+            except ValueError:
+                print(f"Şablon kuralı hatası: bilinmeyen parça {part_key}")
+                continue
+
+            row, col = rule['position']
+            height, width = rule.get('size', (1, 1))
+            if row < 0 or col < 0 or width < 1 or height < 1 or row + height > rows or col + width > cols:
+                print(f"Şablon kuralı hatası: {part_key} grid dışında")
+                continue
+
+            slot_mask = 0
+            for i in range(row, row + height):
+                slot_mask |= ((1 << width) - 1) << (i * cols + col)
+            if slot_mask & self.mask or part_type in self.slots:
+                print(f"Şablon kuralı hatası: {part_key} başka bir kuralla çakışıyor")
+                continue
+
+            self.mask |= slot_mask
+            self.slots[part_type] = ((row, col), (width, height))
+
+    def assign(self, part_types: Sequence[PartType]) -> List[Optional[Slot]]:
+        """Her parçanın şablon yuvası; yuvası olmayan ya da yuvası dolmuş parçalar için None"""
+        used = set()
+        result = []
+        for part_type in part_types:
+            slot = self.slots.get(part_type)
+            if slot is None or part_type in used:
+                result.append(None)
+            else:
+                used.add(part_type)
+                result.append(slot)
+        return result
+
+
+def compile_layout(template: Template) -> CompiledLayout:
+    return CompiledLayout(template.layout_rules, template.grid_size)
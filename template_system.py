@@ -1,92 +1,192 @@
 # template_system.py
 import json
-import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from data_structures import Template, PartType
+from template_catalog import TemplateCatalog
+from template_layout import CompiledLayout, compile_layout
+
+# Yerleşik şablonlar; aynı id'li bir dosya şablonu bunları geçersiz kılar
+DEFAULT_TEMPLATES = {
+    'standard': {
+        'name': 'Standart Layout',
+        'description': 'Temel 3x3 yerleşim',
+        'grid_size': (3, 3),
+        'layout_rules': {
+            'front_view': {'position': (0,0), 'size': (2,2)},
+            'side_view': {'position': (0,2), 'size': (2,1)},
+            'top_view': {'position': (2,0), 'size': (1,2)}
+        },
+        'default_parts': [
+            PartType.FRONT_VIEW,
+            PartType.SIDE_VIEW,
+            PartType.TOP_VIEW
+        ]
+    },
+    'detailed': {
+        'name': 'Detaylı Layout',
+        'description': 'Detay görünümlü yerleşim',
+        'grid_size': (3, 3),
+        'layout_rules': {
+            'front_view': {'position': (0,0), 'size': (2,2)},
+            'detail': {'position': (0,2), 'size': (1,1)},
+            'section': {'position': (1,2), 'size': (1,1)},
+            'dimensions': {'position': (2,0), 'size': (1,3)}
+        },
+        'default_parts': [
+            PartType.FRONT_VIEW,
+            PartType.DETAIL,
+            PartType.SECTION,
+            PartType.DIMENSIONS
+        ]
+    },
+    'assembly': {
+        'name': 'Montaj Layout',
+        'description': 'Yoğun montaj paftası için 12x8 yerleşim',
+        'grid_size': (12, 8),
+        'layout_rules': {},
+        'default_parts': [
+            PartType.ASSEMBLY,
+            PartType.PARTS_LIST,
+            PartType.DETAIL,
+            PartType.SECTION
+        ]
+    }
+}
+
+
+def template_from_dict(template_id: str, data: Dict) -> Template:
+    """Şablon verisini doğrulayarak Template'e çevir
+
+    Eski dosya biçimleri de okunur: ayarları 'settings' altında tutan GUI şablonları
+    ve grid boyutunu 'layout' altında tutan sözlük şablonlar.
+    """
+    settings = dict(data.get('settings') or {})
+    legacy_layout = data.get('layout') or {}
+
+    grid_size = data.get('grid_size') or settings.pop('grid_size', None) or legacy_layout.get('grid_size') or (3, 3)
+    if len(grid_size) != 2 or any(not isinstance(value, int) or value < 1 for value in grid_size):
+        raise ValueError(f"Geçersiz grid boyutu: {grid_size}")
+
+    layout_rules = {}
+    for part_key, rule in (data.get('layout_rules') or {}).items():
+        layout_rules[part_key] = {
+            'position': tuple(rule['position']),
+            'size': tuple(rule.get('size', (1, 1)))
+        }
+
+    default_parts = []
+    part_values = data.get('default_parts') or settings.pop('default_parts', None) or legacy_layout.get('default_parts') or []
+    for value in part_values:
+        default_parts.append(value if isinstance(value, PartType) else PartType(value))
+
+    return Template(
+        id=template_id,
+        name=data.get('name') or template_id,
+        description=data.get('description', ''),
+        layout_rules=layout_rules,
+        default_parts=default_parts,
+        grid_size=tuple(grid_size),
+        settings=settings
+    )
+
+
+def template_to_dict(template: Template) -> Dict:
+    return {
+        'id': template.id,
+        'name': template.name,
+        'description': template.description,
+        'grid_size': list(template.grid_size),
+        'layout_rules': {
+            part_key: {'position': list(rule['position']), 'size': list(rule['size'])}
+            for part_key, rule in template.layout_rules.items()
+        },
+        'default_parts': [part.value for part in template.default_parts],
+        'settings': template.settings
+    }
+
 
 class TemplateManager:
-    def __init__(self):
-        self.templates: Dict[str, Template] = {}
-        self.templates_path = "templates/"
-        os.makedirs(self.templates_path, exist_ok=True)
+    """Yerleşik ve dosya şablonlarının tek deposu; her şablon bir kez ayrıştırılıp doğrulanır"""
+
+    def __init__(self, templates_path: str = "templates/", catalog: Optional[TemplateCatalog] = None):
+        self.templates_path = templates_path
+        self.catalog = catalog or TemplateCatalog(templates_path)
+        self.builtin_templates: Dict[str, Template] = {}
+        # şablon id -> (dosya içerik özeti, doğrulanmış Template)
+        self._parsed: Dict[str, Tuple[str, Optional[Template]]] = {}
+        # şablon id -> (derlendiği Template, derlenmiş yerleşim)
+        self._compiled: Dict[str, Tuple[Template, CompiledLayout]] = {}
         self.load_default_templates()
-        
+
     def load_default_templates(self):
-        default_templates = {
-            'standard': {
-                'name': 'Standart Layout',
-                'description': 'Temel 3x3 yerleşim',
-                'layout_rules': {
-                    'front_view': {'position': (0,0), 'size': (2,2)},
-                    'side_view': {'position': (0,2), 'size': (2,1)},
-                    'top_view': {'position': (2,0), 'size': (1,2)}
-                },
-                'default_parts': [
-                    PartType.FRONT_VIEW,
-                    PartType.SIDE_VIEW,
-                    PartType.TOP_VIEW
-                ]
-            },
-            'detailed': {
-                'name': 'Detaylı Layout',
-                'description': 'Detay görünümlü yerleşim',
-                'layout_rules': {
-                    'front_view': {'position': (0,0), 'size': (2,2)},
-                    'detail': {'position': (0,2), 'size': (1,1)},
-                    'section': {'position': (1,2), 'size': (1,1)},
-                    'dimensions': {'position': (2,0), 'size': (1,3)}
-                },
-                'default_parts': [
-                    PartType.FRONT_VIEW,
-                    PartType.DETAIL,
-                    PartType.SECTION,
-                    PartType.DIMENSIONS
-                ]
-            }
-        }
-        
-        for template_id, data in default_templates.items():
-            self.templates[template_id] = Template(
-                id=template_id,
-                name=data['name'],
-                description=data['description'],
-                layout_rules=data['layout_rules'],
-                default_parts=data['default_parts']
-            )
-            
-    def save_template(self, template: Template) -> bool:
+        for template_id, data in DEFAULT_TEMPLATES.items():
+            self.builtin_templates[template_id] = template_from_dict(template_id, data)
+
+    @property
+    def templates(self) -> Dict[str, Template]:
+        """Yerleşik ve dosya şablonları; aynı id'de dosya şablonu geçerlidir"""
+        templates = dict(self.builtin_templates)
+        for entry in self.catalog.list_entries():
+            template = self.get_template(entry.id)
+            if template:
+                templates[entry.id] = template
+        return templates
+
+    def get_template(self, template_id: str) -> Optional[Template]:
+        """Şablonu getir (dosya değişmedikçe tekrar ayrıştırılmaz)"""
+        self.catalog.refresh()
+        entry = self.catalog.entries.get(template_id)
+        if entry is None:
+            self._parsed.pop(template_id, None)
+            return self.builtin_templates.get(template_id)
+
+        parsed = self._parsed.get(template_id)
+        if parsed and parsed[0] == entry.hash:
+            return parsed[1]
+
+        data = self.catalog.load(template_id)
+        if data is None:
+            return self.builtin_templates.get(template_id)
         try:
-            template_data = {
-                'id': template.id,
-                'name': template.name,
-                'description': template.description,
-                'layout_rules': template.layout_rules,
-                'default_parts': [part.value for part in template.default_parts]
-            }
-            
-            path = os.path.join(self.templates_path, f"{template.id}.json")
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(template_data, f, ensure_ascii=False, indent=4)
-            return True
+            template = template_from_dict(template_id, data)
         except Exception as e:
-            print(f"Şablon kaydetme hatası: {str(e)}")
-            return False
-            
+            # Geçersiz dosya değişene kadar tekrar denenmez
+            print(f"Şablon doğrulama hatası: {str(e)}")
+            template = None
+        # load() dizin kaydını yenilemiş olabilir
+        self._parsed[template_id] = (self.catalog.entries[template_id].hash, template)
+        return template
+
     def load_template(self, template_id: str) -> Optional[Template]:
-        try:
-            path = os.path.join(self.templates_path, f"{template_id}.json")
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return Template(
-                    id=data['id'],
-                    name=data['name'],
-                    description=data['description'],
-                    layout_rules=data['layout_rules'],
-                    default_parts=[PartType(part) for part in data['default_parts']]
-                )
-        except Exception as e:
-            print(f"Şablon yükleme hatası: {str(e)}")
+        return self.get_template(template_id)
+
+    def get_grid_size(self, template_id: str, default: tuple = (3, 3)) -> tuple:
+        # Şablonun (satır, sütun) grid boyutu
+        template = self.get_template(template_id)
+        return template.grid_size if template else default
+
+    def get_compiled_layout(self, template_id: str) -> Optional[CompiledLayout]:
+        """Şablonun layout_rules'unu derlenmiş olarak getir (şablon değişmedikçe tekrar derlenmez)"""
+        template = self.get_template(template_id)
+        if template is None:
             return None
+        compiled = self._compiled.get(template_id)
+        if compiled and compiled[0] is template and compiled[1].grid_size == tuple(template.grid_size):
+            return compiled[1]
+        layout = compile_layout(template)
+        self._compiled[template_id] = (template, layout)
+        return layout
+
+    def save_template(self, template: Template) -> bool:
+        if not self.catalog.save(template.id, template_to_dict(template)):
+            return False
+        # Önbellekteki nesneler paylaşılır; kayıttan sonra dosyadan yeniden kurulur ve derlenir
+        self._parsed.pop(template.id, None)
+        self._compiled.pop(template.id, None)
+        return True
+
+    def add_template(self, template: Template) -> bool:
+        return self.save_template(template)
 
     def get_all_templates(self) -> List[Template]:
         """Tüm şablonları listele"""
@@ -94,14 +194,40 @@ class TemplateManager:
 
     def delete_template(self, template_id: str) -> bool:
         """Şablon sil"""
+        self._parsed.pop(template_id, None)
+        self._compiled.pop(template_id, None)
+        return self.catalog.delete(template_id)
+
+    def export_templates(self, path: str, template_ids: Optional[List[str]] = None) -> bool:
+        """Şablonları tek bir paket dosyasına yaz"""
         try:
-            path = os.path.join(self.templates_path, f"{template_id}.json")
-            if os.path.exists(path):
-                os.remove(path)
-                if template_id in self.templates:
-                    del self.templates[template_id]
-                return True
+            templates = self.templates
+            ids = template_ids if template_ids is not None else list(templates)
+            bundle = {'templates': [template_to_dict(templates[template_id]) for template_id in ids if template_id in templates]}
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(bundle, f, ensure_ascii=False, indent=4)
+            return True
+        except Exception as e:
+            print(f"Şablon dışa aktarma hatası: {str(e)}")
             return False
+
+    def import_templates(self, path: str) -> int:
+        """Paket dosyasındaki şablonları doğrula ve kaydet; içe aktarılan sayıyı getir"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                bundle = json.load(f)
         except Exception as e:
-            print(f"Şablon silme hatası: {str(e)}")
-            return False
\ No newline at end of file
+            print(f"Şablon içe aktarma hatası: {str(e)}")
+            return 0
+
+        imported = 0
+        for data in bundle.get('templates', []):
+            try:
+                template_id = data.get('id') or data['name']
+                template = template_from_dict(template_id, data)
+            except Exception as e:
+                print(f"Şablon doğrulama hatası: {str(e)}")
+                continue
+            if self.save_template(template):
+                imported += 1
+        return imported
@@ -0,0 +1,6 @@
+# conftest.py
+import os
+import sys
+
+# Modüller depo kökünde düz duruyor; testler kökten içe aktarır
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,14 @@
+# test_export_manager.py
+from export_system import ExportManager
+
+
+def test_set_grid_size_keeps_page_format_and_dpi():
+    manager = ExportManager()
+    manager.set_page_format('A4', dpi=150, grid_size=(2, 2))
+    geometry = manager.geometry
+    manager.set_grid_size((2, 2))
+    assert manager.geometry is geometry
+    manager.set_grid_size((4, 3))
+    assert manager.grid_size == (4, 3)
+    assert manager.page_format == geometry.page_format
+    assert manager.dpi == 150
@@ -0,0 +1,33 @@
+# test_image_loader.py
+import pytest
+from PIL import Image
+
+pytest.importorskip('PySide6')
+from image_loader import quick_draft, reduced_frame  # noqa: E402
+
+
+def test_pyramid_tiff_uses_the_smallest_covering_page(tmp_path):
+    path = str(tmp_path / "pyramid.tif")
+    base = Image.new('RGB', (4000, 3000), 'red')
+    pages = [base.resize((2000, 1500)), base.resize((1000, 750)), base.resize((500, 375)),
+             Image.new('RGB', (100, 900))]
+    base.save(path, save_all=True, append_images=pages)
+    with Image.open(path) as image:
+        assert reduced_frame(image, (620, 877)) == 3
+        # Arama sonrası ilk sayfaya dönülür
+        assert image.tell() == 0
+        assert image.size == (4000, 3000)
+
+
+def test_single_page_images_have_no_reduced_frame(tmp_path):
+    path = str(tmp_path / "image.png")
+    Image.new('RGB', (300, 200)).save(path)
+    with Image.open(path) as image:
+        assert reduced_frame(image, (620, 877)) is None
+
+
+def test_quick_draft_reduces_by_integer_factor():
+    image = Image.new('RGB', (2480, 3508))
+    assert quick_draft(image, (620, 877)).size == (620, 877)
+    small = Image.new('RGB', (600, 800))
+    assert quick_draft(small, (620, 877)) is small
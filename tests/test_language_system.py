@@ -0,0 +1,68 @@
+# test_language_system.py
+import json
+import os
+import pickle
+import pytest
+from language_system import LanguageManager
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # LanguageManager göreli 'languages/' klasörünü kullanır
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_construction_reads_nothing(workdir):
+    manager = LanguageManager()
+    assert manager.translations == {}
+    assert manager._custom_translations is None
+    assert os.listdir('languages') == []
+
+
+def test_builtin_table_is_compiled_on_first_use(workdir):
+    manager = LanguageManager()
+    assert manager.get_text('save') == 'Kaydet'
+    assert os.listdir('languages') == ['TR.catalog']
+    assert 'EN' not in manager.translations
+
+
+def test_catalog_is_the_source(workdir):
+    os.makedirs('languages')
+    with open('languages/TR.catalog', 'wb') as f:
+        pickle.dump({'save': 'Kaydet!'}, f)
+    manager = LanguageManager()
+    assert manager.get_text('save') == 'Kaydet!'
+    assert manager.get_text('export') == 'export'
+
+
+def test_stale_builtin_catalog_is_rebuilt(workdir):
+    os.makedirs('languages')
+    with open('languages/TR.catalog', 'wb') as f:
+        pickle.dump({'save': 'eski'}, f)
+    os.utime('languages/TR.catalog', ns=(0, 0))
+    assert LanguageManager().get_text('save') == 'Kaydet'
+
+
+def test_non_builtin_language_catalog(workdir):
+    manager = LanguageManager()
+    assert not manager.compile_catalog('FR')
+    assert manager.compile_catalog('DE', {'save': 'Speichern'})
+    assert 'DE' in manager.get_available_languages()
+    assert manager.change_language('DE')
+    assert manager.get_text('save') == 'Speichern'
+
+
+def test_overlay_wins_and_builtin_copies_are_pruned(workdir):
+    os.makedirs('languages')
+    with open('languages/custom_translations.json', 'w', encoding='utf-8') as f:
+        json.dump({'TR': {'save': 'Kaydet', 'my_key': 'Benim'}}, f)
+    manager = LanguageManager(save_delay=60)
+    assert manager.get_text('my_key') == 'Benim'
+    manager.update_translations({'TR': {'export': 'Çıkar'}})
+    assert manager.get_text('export') == 'Çıkar'
+    assert manager.flush()
+    with open('languages/custom_translations.json', encoding='utf-8') as f:
+        assert json.load(f) == {'TR': {'my_key': 'Benim', 'export': 'Çıkar'}}
+    with open('languages/TR.catalog', 'rb') as f:
+        assert 'my_key' not in pickle.load(f)
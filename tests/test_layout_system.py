@@ -0,0 +1,56 @@
+# test_layout_system.py
+from data_structures import Part, PartType
+from layout_system import LayoutManager
+from template_layout import CompiledLayout
+
+
+def make_part(part_type, size, part_id=None):
+    return Part(part_id or part_type.name, part_type, part_type.value, size)
+
+
+def test_apply_template_uses_slots_and_packs_leftovers():
+    layout = CompiledLayout({'front_view': {'position': (0, 0), 'size': (2, 2)}}, (3, 3))
+    front = make_part(PartType.FRONT_VIEW, (1, 1))
+    detail = make_part(PartType.DETAIL, (1, 1))
+    manager = LayoutManager()
+    assert manager.apply_template(layout, [front, detail])
+    assert front.position == (0, 0) and front.size == (2, 2)
+    assert manager.slot_sizes == {front.id: (2, 2)}
+    # Yuvası olmayan parça boş hücreye paketlenir
+    assert detail.position == (0, 2)
+    assert detail.id not in manager.slot_sizes
+
+
+def test_second_part_of_same_type_is_packed():
+    layout = CompiledLayout({'detail': {'position': (2, 2)}}, (3, 3))
+    first = make_part(PartType.DETAIL, (1, 1), 'd1')
+    second = make_part(PartType.DETAIL, (1, 1), 'd2')
+    manager = LayoutManager()
+    assert manager.apply_template(layout, [first, second])
+    assert first.position == (2, 2)
+    assert second.position == (0, 0)
+    assert list(manager.slot_sizes) == ['d1']
+
+
+def test_pack_continues_after_part_that_does_not_fit():
+    manager = LayoutManager(2, 2)
+    big = make_part(PartType.ASSEMBLY, (3, 3))
+    small = make_part(PartType.DETAIL, (1, 1))
+    assert not manager.auto_layout([big, small])
+    assert small.position == (0, 0)
+    assert big.id not in manager.grid.parts
+    assert manager.slot_sizes == {}
+
+
+def test_set_grid_size_keeps_fitting_parts_and_returns_dropped():
+    manager = LayoutManager()
+    front = make_part(PartType.FRONT_VIEW, (2, 2))
+    detail = make_part(PartType.DETAIL, (1, 1))
+    manager.grid.place_part(front, (0, 0))
+    manager.grid.place_part(detail, (2, 2))
+    assert manager.set_grid_size(2, 2) == [detail]
+    assert list(manager.grid.parts) == [front.id]
+    assert manager.grid.grid == [[front.id, front.id], [front.id, front.id]]
+    # Büyütmede tüm parçalar yerinde kalır
+    assert manager.set_grid_size(4, 4) == []
+    assert front.position == (0, 0)
@@ -0,0 +1,22 @@
+# test_pafta_layout.py
+import pytest
+
+pytest.importorskip('PySide6')
+from pafta import LayoutManager  # noqa: E402
+
+
+def test_set_grid_size_reports_dropped_parts():
+    manager = LayoutManager((3, 3))
+    manager.place_part("Ön Görünüş", (0, 0))
+    manager.place_part("Detay", (2, 2))
+    assert manager.overflow_parts((2, 2)) == {"Detay"}
+    assert manager.set_grid_size((2, 2)) == ["Detay"]
+    assert manager.cells == [["Ön Görünüş"] * 2, ["Ön Görünüş"] * 2]
+
+
+def test_growing_the_grid_keeps_every_part():
+    manager = LayoutManager((2, 2))
+    manager.place_part("Detay", (1, 1))
+    assert manager.overflow_parts((3, 3)) == set()
+    assert manager.set_grid_size((3, 3)) == []
+    assert manager.cells[1][1] == "Detay"
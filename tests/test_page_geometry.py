@@ -0,0 +1,100 @@
+# test_page_geometry.py
+import pytest
+from data_structures import Part, PartType
+from page_format import PAGE_FORMATS
+from page_geometry import PageGeometry, PT_PER_MM
+
+
+def make_geometry():
+    # A4, 10 mm kenar, 15 mm başlık: yerleşim alanı 190 x 262 mm
+    return PageGeometry(PAGE_FORMATS['A4'], (2, 2), margin_mm=10.0, header_mm=15.0)
+
+
+def make_part(position=(0, 0), size=(1, 1), rotation=0, scale=1.0, part_id='p1'):
+    return Part(part_id, PartType.DETAIL, 'Detay', size, position, rotation, scale)
+
+
+def test_content_rect_and_cells():
+    geometry = make_geometry()
+    assert geometry.content_rect == (10.0, 25.0, 190.0, 262.0)
+    assert geometry.cell_size == (95.0, 131.0)
+    assert geometry.cell_rect((1, 1)) == (105.0, 156.0, 95.0, 131.0)
+    assert geometry.cell_rect((0, 0), (2, 1)) == (10.0, 25.0, 190.0, 131.0)
+
+
+def test_placement_without_rotation():
+    placement = make_geometry().placement(make_part(position=(0, 1), scale=0.5))
+    assert placement.cell == (105.0, 25.0, 95.0, 131.0)
+    assert placement.box == (95.0, 131.0)
+    assert placement.center == (152.5, 90.5)
+    assert placement.matrix[:4] == pytest.approx((0.5, 0.0, 0.0, 0.5))
+    assert placement.placed_size == (47.5, 65.5)
+
+
+def test_quarter_turn_swaps_box():
+    placement = make_geometry().placement(make_part(rotation=90))
+    assert placement.box == (131.0, 95.0)
+    # y ekseni aşağıyken saat yönünün tersine 90°
+    assert placement.matrix[:4] == pytest.approx((0.0, -1.0, 1.0, 0.0))
+
+    half_turn = make_geometry().placement(make_part(rotation=180))
+    assert half_turn.box == (95.0, 131.0)
+    assert half_turn.matrix[:4] == pytest.approx((-1.0, 0.0, 0.0, -1.0))
+
+
+def test_fit_keeps_aspect_ratio():
+    placement = make_geometry().placement(make_part())
+    width, height = placement.fit((1900, 1000))
+    assert width == pytest.approx(95.0)
+    assert height == pytest.approx(50.0)
+    assert width / height == pytest.approx(1.9)
+
+    # Döndürülmüş kutuda sığdırma yerel (takas edilmiş) kutuya göre yapılır
+    rotated = make_geometry().placement(make_part(rotation=90))
+    assert rotated.fit((1310, 100)) == pytest.approx((131.0, 10.0))
+    assert placement.fit((0, 100)) == (0.0, 0.0)
+
+
+def test_pdf_transform_flips_y_axis():
+    geometry = make_geometry()
+    placement = geometry.placement(make_part(rotation=90, scale=2.0))
+    page_height = geometry.page_format.height_mm
+    a, b, c, d, e, f = placement.transform(PT_PER_MM, page_height)
+    assert (a, b, c, d) == pytest.approx((0.0, 2.0, -2.0, 0.0), abs=1e-12)
+    assert e == pytest.approx(placement.center[0] * PT_PER_MM)
+    assert f == pytest.approx((page_height - placement.center[1]) * PT_PER_MM)
+
+    x, y, width, height = placement.rect(1.0, page_height)
+    assert (x, width, height) == (10.0, 95.0, 131.0)
+    assert y == pytest.approx(page_height - 25.0 - 131.0)
+
+
+def test_placements_are_cached_until_layout_changes():
+    geometry = make_geometry()
+    part = make_part()
+    page = {'parts': [part, 'etiket']}
+    first = geometry.placements(page)
+    assert list(first) == ['p1']
+    assert geometry.placements(page) is first
+
+    part.rotation = 90
+    rotated = geometry.placements(page)
+    assert rotated is not first
+    assert rotated['p1'].box == (131.0, 95.0)
+
+
+def test_placement_cache_is_bounded():
+    geometry = PageGeometry(PAGE_FORMATS['A4'], (2, 2), cache_size=2)
+    for col in range(2):
+        for row in range(2):
+            geometry.placements({'parts': [make_part(position=(row, col))]})
+    assert len(geometry._cache) == 2
+
+
+def test_with_grid_keeps_page_and_margins():
+    geometry = make_geometry()
+    assert geometry.with_grid((2, 2)) is geometry
+    resized = geometry.with_grid((3, 4))
+    assert resized.grid_size == (3, 4)
+    assert resized.content_rect == geometry.content_rect
+    assert geometry.grid_size == (2, 2)
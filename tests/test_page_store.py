@@ -0,0 +1,87 @@
+# test_page_store.py
+import numpy as np
+from data_structures import FrozenPart, Part, PartType
+from page_store import PageStore
+
+
+def make_pages():
+    return [
+        {
+            'info': {'urun_adi': 'Masa'},
+            'parts': [
+                Part('a', PartType.FRONT_VIEW, 'Ön Görünüş', (2, 2), (0, 0), 90, 1.5, 'a.png'),
+                Part('b', PartType.DETAIL, 'Detay', (1, 1), None),
+                'etiket'
+            ]
+        },
+        {'parts': []},
+        {'parts': [Part('c', PartType.PARTS_LIST, 'Parça Listesi', (1, 2), (2, 0), image_path='a.png')]}
+    ]
+
+
+def test_round_trip_keeps_parts_and_page_data():
+    pages = make_pages()
+    store = PageStore.from_pages(pages)
+    assert store.count == 3
+
+    restored = store.to_pages()
+    assert len(restored) == 3
+    assert restored[0]['info'] == {'urun_adi': 'Masa'}
+    assert restored[1]['parts'] == []
+    # Part olmayan girdiler sütunlara alınmaz
+    assert restored[0]['parts'] == [part for part in pages[0]['parts'] if isinstance(part, Part)]
+    assert restored[2]['parts'] == pages[2]['parts']
+
+
+def test_part_rows_are_frozen_and_thaw_to_parts():
+    store = PageStore.from_pages(make_pages())
+    frozen = store.part(0)
+    assert isinstance(frozen, FrozenPart)
+    assert frozen == make_pages()[0]['parts'][0].freeze()
+    assert store.part(1).position is None
+    assert isinstance(store.parts(0)[0], Part)
+
+
+def test_strings_are_interned_once():
+    store = PageStore.from_pages(make_pages())
+    assert store.image_code[0] == store.image_code[2]
+    assert store.strings.get(int(store.image_code[1])) is None
+
+
+def test_growth_keeps_existing_rows():
+    store = PageStore(capacity=1)
+    rows = store.extend(
+        (Part(f'p{index}', PartType.DETAIL, 'Detay', (1, 1), (0, index)) for index in range(5)), page=3
+    )
+    assert list(rows) == [0, 1, 2, 3, 4]
+    assert store.capacity >= 5
+    assert [part.position for part in store.parts(3)] == [(0, index) for index in range(5)]
+
+
+def test_rows_and_positions():
+    store = PageStore.from_pages(make_pages())
+    assert list(store.rows(0)) == [0, 1]
+    assert list(store.rows(2)) == [2]
+    store.set_positions(np.array([1]), np.array([[1, 2]]))
+    assert store.part(1).position == (1, 2)
+
+
+def test_occupancy_counts_overlaps():
+    store = PageStore()
+    store.append(Part('a', PartType.FRONT_VIEW, 'a', (2, 2), (0, 0)))
+    store.append(Part('b', PartType.DETAIL, 'b', (1, 1), (1, 1)))
+    store.append(Part('c', PartType.DETAIL, 'c', (1, 1), None))
+    grid = store.occupancy(0, (3, 3))
+    assert grid.tolist() == [[1, 1, 0], [1, 2, 0], [0, 0, 0]]
+
+
+def test_areas_apply_scale():
+    store = PageStore.from_pages(make_pages())
+    assert store.areas().tolist() == [9.0, 1.0, 2.0]
+
+
+def test_scale_round_trips_exactly():
+    store = PageStore()
+    store.append(Part('a', PartType.DETAIL, 'a', (1, 1), (0, 0), scale=0.1))
+    assert store.part(0).scale == 0.1
+    assert store.parts()[0].scale == 0.1
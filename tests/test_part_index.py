@@ -0,0 +1,115 @@
+# test_part_index.py
+import pytest
+from data_structures import Part, PartType, Project
+from part_index import PartIndex
+
+
+def make_part(part_id, part_type=PartType.DETAIL, image_path=None):
+    return Part(part_id, part_type, part_id, (1, 1), image_path=image_path)
+
+
+def make_index():
+    project = Project('test')
+    project.pages = [
+        {'parts': [make_part('a'), make_part('b', PartType.SECTION, 'x.png'), make_part('c')]},
+        {'parts': [make_part('d', PartType.SECTION, 'x.png')], 'info': {}}
+    ]
+    return project, PartIndex(project)
+
+
+def test_rebuild_indexes_every_page():
+    project, index = make_index()
+    assert len(index) == 4
+    assert index.location('d') == (1, 0)
+    assert index.get('b') is project.pages[0]['parts'][1]
+    assert index.ids_by_type(PartType.SECTION) == ['b', 'd']
+    assert index.ids_by_image('x.png') == ['b', 'd']
+
+
+def test_add_shifts_later_parts_on_same_page():
+    project, index = make_index()
+    assert index.add_part(0, make_part('e'), 1) == (0, 1)
+    assert [part.id for part in project.pages[0]['parts']] == ['a', 'e', 'b', 'c']
+    assert index.location('b') == (0, 2)
+    assert index.location('c') == (0, 3)
+    assert index.location('d') == (1, 0)
+
+    # Sayfa sayısı kadar numara yeni sayfa açar
+    assert index.add_part(2, make_part('f')) == (2, 0)
+    assert len(project.pages) == 3
+
+    with pytest.raises(ValueError):
+        index.add_part(0, make_part('a'))
+
+
+def test_remove_reindexes_and_unindexes():
+    project, index = make_index()
+    removed = index.remove_part('b')
+    assert removed.id == 'b'
+    assert 'b' not in index
+    assert index.location('c') == (0, 1)
+    assert index.ids_by_type(PartType.SECTION) == ['d']
+    assert index.ids_by_image('x.png') == ['d']
+    assert index.remove_part('b') is None
+
+
+def test_move_between_pages():
+    project, index = make_index()
+    assert index.move_part('a', 1, 0)
+    assert [part.id for part in project.pages[0]['parts']] == ['b', 'c']
+    assert [part.id for part in project.pages[1]['parts']] == ['a', 'd']
+    assert index.location('b') == (0, 0)
+    assert index.location('d') == (1, 1)
+    assert not index.move_part('missing', 0)
+
+
+def test_invalid_move_keeps_the_part():
+    project, index = make_index()
+    with pytest.raises(ValueError):
+        index.move_part('a', 5)
+    assert index.location('a') == (0, 0)
+    assert project.pages[0]['parts'][0].id == 'a'
+
+
+def test_remove_page_shifts_later_pages():
+    project, index = make_index()
+    removed = index.remove_page(0)
+    assert [part.id for part in removed] == ['a', 'b', 'c']
+    assert len(index) == 1
+    assert index.location('d') == (0, 0)
+    assert index.ids_by_type(PartType.DETAIL) == []
+
+
+@pytest.mark.parametrize('page_num', [-1, 2])
+def test_remove_page_rejects_invalid_numbers(page_num):
+    project, index = make_index()
+    with pytest.raises(ValueError):
+        index.remove_page(page_num)
+    assert len(project.pages) == 2
+
+
+@pytest.mark.parametrize('page_num', [-1, 3])
+def test_add_rejects_invalid_numbers(page_num):
+    project, index = make_index()
+    with pytest.raises(ValueError):
+        index.add_part(page_num, make_part('e'))
+    assert 'e' not in index
+
+
+def test_replace_image_everywhere():
+    project, index = make_index()
+    assert index.replace_image('x.png', 'y.png') == 2
+    assert index.ids_by_image('x.png') == []
+    assert index.ids_by_image('y.png') == ['b', 'd']
+    assert project.pages[1]['parts'][0].image_path == 'y.png'
+
+
+def test_unbound_index():
+    index = PartIndex()
+    assert index.get('a') is None
+    assert index.remove_part('a') is None
+    assert not index.move_part('a', 0)
+    with pytest.raises(ValueError):
+        index.add_part(0, make_part('a'))
+    with pytest.raises(ValueError):
+        index.remove_page(0)
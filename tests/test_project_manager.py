@@ -0,0 +1,66 @@
+# test_project_manager.py
+import os
+import pytest
+from data_structures import Part, PartType
+from project_manager import ProjectManager
+from template_system import TemplateManager
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # ProjectManager göreli projects/ ve autosave/ klasörlerini kullanır
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_template_repository_is_shared(workdir):
+    templates = TemplateManager(str(workdir / "templates"))
+    manager = ProjectManager(templates)
+    assert manager.template_manager is templates
+
+
+def test_save_writes_one_autosave_and_loads_back(workdir):
+    manager = ProjectManager(TemplateManager(str(workdir / "templates")))
+    manager.create_project('masa')
+    path = str(workdir / "masa.pafta")
+    assert manager.save_project(path)
+    assert os.listdir('autosave') == ['masa_autosave.pafta']
+
+    reopened = ProjectManager(manager.template_manager)
+    assert reopened.load_project(path)
+    assert reopened.current_project.name == 'masa'
+
+
+def make_part(part_id, part_type=PartType.DETAIL, image_path=None):
+    return Part(part_id, part_type, part_id, (1, 1), image_path=image_path)
+
+
+def test_part_edits_keep_the_index_current(workdir):
+    manager = ProjectManager(TemplateManager(str(workdir / "templates")))
+    assert manager.add_part(0, make_part('a')) is None  # proje yok
+    manager.create_project('masa')
+    assert manager.add_part(0, make_part('a', image_path='x.png')) == (0, 0)
+    assert manager.add_part(0, make_part('b', PartType.SECTION, 'x.png'), 0) == (0, 0)
+    assert manager.add_page() == 1
+    assert manager.move_part('a', 1)
+    assert manager.part_index.location('a') == (1, 0)
+    assert [part.id for part in manager.parts_by_type(PartType.SECTION)] == ['b']
+    assert manager.replace_image('x.png', 'y.png') == 2
+    assert manager.find_part('a').image_path == 'y.png'
+    assert manager.add_part(5, make_part('c')) is None
+    assert manager.remove_page(0)[0].id == 'b'
+    assert manager.part_index.location('a') == (0, 0)
+    assert manager.remove_part('a').id == 'a'
+    assert len(manager.part_index) == 0
+
+
+def test_loaded_project_is_indexed(workdir):
+    manager = ProjectManager(TemplateManager(str(workdir / "templates")))
+    manager.create_project('masa')
+    manager.add_part(0, make_part('a'))
+    path = str(workdir / "masa.pafta")
+    assert manager.save_project(path, autosave=False)
+
+    reopened = ProjectManager(manager.template_manager)
+    assert reopened.load_project(path)
+    assert reopened.find_part('a').name == 'a'
@@ -0,0 +1,47 @@
+# test_render_cache.py
+import builtins
+import os
+import sys
+import export_system
+from export_system import PDFExporter
+from render_cache import RenderCache, default_cache_path
+
+
+def test_default_path_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, 'platform', 'linux')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert default_cache_path() == os.path.join(str(tmp_path), 'pafta', 'render')
+    assert RenderCache().cache_path == default_cache_path()
+    assert os.path.isabs(RenderCache().cache_path)
+
+
+def test_explicit_path_is_kept(tmp_path):
+    cache = RenderCache(str(tmp_path / "render"))
+    assert cache.cache_path == str(tmp_path / "render")
+    # Klasör ilk yazmaya kadar oluşturulmaz
+    assert not os.path.exists(cache.cache_path)
+
+
+def test_put_and_get(tmp_path):
+    source = tmp_path / "sayfa.pdf"
+    source.write_bytes(b"%PDF-")
+    cache = RenderCache(str(tmp_path / "render"))
+    assert cache.get("anahtar", "pdf") is None
+    path = cache.put("anahtar", "pdf", str(source))
+    assert cache.get("anahtar", "pdf") == path
+
+
+def test_missing_pypdf_logged_once(monkeypatch, capsys):
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == 'pypdf':
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', fake_import)
+    monkeypatch.setattr(export_system, '_pypdf_missing_logged', False)
+    exporter = PDFExporter()
+    assert not exporter._can_splice()
+    assert not exporter._can_splice()
+    assert capsys.readouterr().out.count("pypdf") == 1
@@ -0,0 +1,53 @@
+# test_resolution_checker.py
+import os
+import pytest
+from PIL import Image
+from resolution_checker import ResolutionChecker
+
+
+def make_images(directory, count):
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"cizim{index}.png")
+        Image.new('RGB', (10 + index, 10)).save(path, dpi=(300, 300))
+        paths.append(path)
+    return paths
+
+
+def test_headers_are_copies(tmp_path):
+    checker = ResolutionChecker()
+    path = make_images(str(tmp_path), 1)[0]
+    header = checker.read_header(path)
+    header['size'] = (1, 1)
+    assert checker.read_header(path)['size'] == (10, 10)
+
+
+def test_cache_is_bounded_lru(tmp_path):
+    checker = ResolutionChecker(cache_size=3)
+    paths = make_images(str(tmp_path), 5)
+    for path in paths:
+        checker.read_header(path)
+    checker.read_header(paths[2])
+    assert list(checker._header_cache) == [paths[3], paths[4], paths[2]]
+
+
+def test_default_cache_holds_a_release_check():
+    # Sürüm öncesi kontrol edilen binlerce çizim tek çalıştırmada önbellekten düşmez
+    assert ResolutionChecker().cache_size >= 10000
+
+
+def test_changed_file_is_read_again(tmp_path):
+    checker = ResolutionChecker()
+    path = make_images(str(tmp_path), 1)[0]
+    assert checker.read_header(path)['size'] == (10, 10)
+    Image.new('RGB', (40, 20)).save(path)
+    assert checker.read_header(path)['size'] == (40, 20)
+
+
+def test_check_batch_reports_missing_files(tmp_path):
+    checker = ResolutionChecker()
+    path = make_images(str(tmp_path), 1)[0]
+    results = checker.check_batch([path, path, str(tmp_path / "yok.png")], formats=['A4'])
+    assert set(results) == {path, str(tmp_path / "yok.png")}
+    assert results[path]['A4']['current_dpi'] == pytest.approx((300, 300), abs=0.01)
+    assert 'error' in results[str(tmp_path / "yok.png")]
@@ -0,0 +1,47 @@
+# test_security_manager.py
+import time
+from security_manager import SecurityManager
+
+
+def test_permissions_follow_role_inheritance():
+    manager = SecurityManager()
+    token = manager.create_token('ali', 'editor')
+    assert manager.check_permission(token, 'read')
+    assert manager.check_permission(token, 'export')
+    assert not manager.check_permission(token, 'delete')
+    assert manager.authorize_batch([(token, 'write'), (token, 'manage_users')]) == [True, False]
+
+
+def test_invalid_and_revoked_tokens():
+    manager = SecurityManager()
+    assert manager.verify_token('bozuk.token') is None
+    token = manager.create_token('ali', 'viewer')
+    assert manager.verify_token(token)['username'] == 'ali'
+    assert manager.invalidate_token(token)
+    assert manager.verify_token(token) is None
+
+
+def test_heap_stays_bounded_when_tokens_are_evicted():
+    manager = SecurityManager(max_cached_tokens=4)
+    tokens = [manager.create_token(f'user{index}', 'viewer') for index in range(10)]
+    for _ in range(20):
+        for token in tokens:
+            assert manager.verify_token(token) is not None
+    assert len(manager.token_cache) == 4
+    assert len(manager._expiry_heap) <= 2 * manager.max_cached_tokens + 1
+
+
+def test_cache_hit_does_not_push_again():
+    manager = SecurityManager()
+    token = manager.create_token('ali', 'viewer')
+    for _ in range(5):
+        manager.verify_token(token)
+    assert len(manager._expiry_heap) == 1
+
+
+def test_sweep_removes_expired_claims():
+    manager = SecurityManager()
+    token = manager.create_token('ali', 'viewer')
+    manager.verify_token(token)
+    assert manager.sweep_expired(time.time() + 25 * 3600) == 1
+    assert manager.token_cache == {}
@@ -0,0 +1,57 @@
+# test_sheet_preview.py
+from PIL import Image
+from data_structures import Part, PartType
+from page_format import PAGE_FORMATS
+from page_geometry import PageGeometry
+from sheet_preview import SheetPreview
+
+
+def make_preview():
+    return SheetPreview(PageGeometry(PAGE_FORMATS['A4'], (2, 2), margin_mm=10.0, header_mm=15.0), dpi=72)
+
+
+def make_part(part_id, position, image_path=None):
+    return Part(part_id, PartType.DETAIL, 'Detay', (1, 1), position, image_path=image_path)
+
+
+def test_first_render_returns_every_cell_box():
+    preview = make_preview()
+    parts = [make_part('a', (0, 0)), make_part('b', (1, 1))]
+    boxes = preview.render(parts)
+    assert len(boxes) == 2
+    assert boxes[0] == preview._px(preview.geometry.cell_rect((0, 0)))
+
+
+def test_unchanged_parts_are_not_redrawn():
+    preview = make_preview()
+    parts = [make_part('a', (0, 0)), make_part('b', (1, 1))]
+    preview.render(parts)
+    assert preview.render(parts) == []
+
+
+def test_moved_part_dirties_old_and_new_cells():
+    preview = make_preview()
+    preview.render([make_part('a', (0, 0)), make_part('b', (1, 1))])
+    boxes = preview.render([make_part('a', (0, 1)), make_part('b', (1, 1))])
+    old_cell = preview._px(preview.geometry.cell_rect((0, 0)))
+    new_cell = preview._px(preview.geometry.cell_rect((0, 1)))
+    assert boxes == [old_cell, new_cell]
+
+
+def test_missing_thumbnail_is_pending_until_added(tmp_path):
+    path = str(tmp_path / "parca.png")
+    Image.new('RGB', (400, 300), 'red').save(path)
+    preview = make_preview()
+    part = make_part('a', (0, 0), path)
+    preview.render([part], build_missing=False)
+    assert len(preview.pending) == 1
+    key = preview.pending[0]
+
+    preview.add_thumbnail(key, Image.new('RGB', key[2], 'red'))
+    boxes = preview.render([part], build_missing=False)
+    assert preview.pending == []
+    assert len(boxes) == 2
+    # Parça alanı artık görüntüyle çizili
+    center = preview._px(preview.geometry.cell_rect((0, 0)))
+    x, y = (center[0] + center[2]) // 2, (center[1] + center[3]) // 2
+    assert preview.canvas.getpixel((x, y)) == (255, 0, 0)
@@ -0,0 +1,132 @@
+# test_template_catalog.py
+import copy
+import json
+import os
+from template_catalog import TemplateCatalog
+from template_system import TemplateManager
+
+
+def write_template(directory, template_id, **data):
+    path = os.path.join(directory, f"{template_id}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    return path
+
+
+def touch_dir(directory):
+    # Dosya sistemi zaman çözünürlüğünden bağımsız olarak klasör değişmiş görünsün
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def make_catalog(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    return str(templates), TemplateCatalog(str(templates), str(tmp_path / "index.json"))
+
+
+def test_refresh_tracks_added_changed_and_deleted_files(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    write_template(templates, 'a', name='Beta')
+    write_template(templates, 'b', name='alfa')
+    assert catalog.refresh()
+    assert [entry.id for entry in catalog.list_entries()] == ['b', 'a']
+
+    # Klasör değişmedikçe tarama yapılmaz
+    assert not catalog.refresh()
+
+    first_hash = catalog.entries['a'].hash
+    write_template(templates, 'a', name='Gamma', description='yeni')
+    os.remove(os.path.join(templates, 'b.json'))
+    touch_dir(templates)
+    assert catalog.refresh()
+    assert set(catalog.entries) == {'a'}
+    assert catalog.entries['a'].name == 'Gamma'
+    assert catalog.entries['a'].hash != first_hash
+
+
+def test_index_is_reused_by_a_new_catalog(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    write_template(templates, 'a', name='A')
+    catalog.refresh()
+
+    reopened = TemplateCatalog(templates, str(tmp_path / "index.json"))
+    assert reopened.entries == catalog.entries
+
+    # Başka bir klasörün dizini kullanılmaz
+    other = tmp_path / "other"
+    other.mkdir()
+    assert TemplateCatalog(str(other), str(tmp_path / "index.json")).entries == {}
+
+
+def test_load_rereads_only_changed_files(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    path = write_template(templates, 'a', name='A', grid_size=[3, 3])
+    body = catalog.load('a')
+    assert body['grid_size'] == [3, 3]
+    assert catalog.load('a') is body
+
+    # Yerinde düzenleme: boyut değiştiği için klasör zamanı olmadan da fark edilir
+    write_template(templates, 'a', name='A', grid_size=[12, 8])
+    assert catalog.load('a')['grid_size'] == [12, 8]
+
+    os.remove(path)
+    assert catalog.load('a') is None
+    assert 'a' not in catalog.entries
+
+
+def test_save_and_delete_update_the_index(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    assert catalog.save('a', {'name': 'A'})
+    assert catalog.entries['a'].name == 'A'
+    assert not catalog.refresh()
+    assert catalog.load('a') == {'name': 'A'}
+
+    assert catalog.delete('a')
+    assert 'a' not in catalog.entries
+    assert not catalog.delete('a')
+
+
+def test_body_cache_is_bounded(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    catalog.cache_size = 2
+    for template_id in 'abc':
+        write_template(templates, template_id, name=template_id)
+        catalog.load(template_id)
+    assert len(catalog._bodies) == 2
+
+
+def test_manager_invalidates_parsed_and_compiled_on_save(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    manager = TemplateManager(templates, catalog)
+    template = copy.deepcopy(manager.get_template('detailed'))
+    template.id = 'custom'
+    assert manager.save_template(template)
+
+    stored = manager.get_template('custom')
+    assert manager.get_template('custom') is stored
+    layout = manager.get_compiled_layout('custom')
+    assert manager.get_compiled_layout('custom') is layout
+    assert len(layout.slots) == 4
+
+    edited = copy.deepcopy(stored)
+    edited.layout_rules = {'detail': {'position': (0, 0), 'size': (1, 1)}}
+    assert manager.save_template(edited)
+    # Düzenleme kopya üzerinde yapıldı; eski nesne değişmedi
+    assert len(stored.layout_rules) == 4
+    assert len(manager.get_compiled_layout('custom').slots) == 1
+
+    assert manager.delete_template('custom')
+    assert manager.get_template('custom') is None
+    assert manager.get_compiled_layout('custom') is None
+
+
+def test_file_template_overrides_builtin(tmp_path):
+    templates, catalog = make_catalog(tmp_path)
+    manager = TemplateManager(templates, catalog)
+    write_template(templates, 'standard', name='Dosya', grid_size=[4, 4])
+    touch_dir(templates)
+    assert manager.get_grid_size('standard') == (4, 4)
+    os.remove(os.path.join(templates, 'standard.json'))
+    touch_dir(templates)
+    assert manager.get_grid_size('standard') == (3, 3)
@@ -0,0 +1,39 @@
+# test_tile_pyramid.py
+import pytest
+from PIL import Image
+
+pytest.importorskip('PySide6')
+from tile_pyramid import ImagePyramid  # noqa: E402
+
+
+def test_levels_halve_until_one_tile():
+    pyramid = ImagePyramid(Image.new('RGB', (2000, 1000)), tile_size=256)
+    assert [level.size for level in pyramid.levels] == [
+        (2000, 1000), (1000, 500), (500, 250), (250, 125)
+    ]
+    assert pyramid.size == (2000, 1000)
+
+
+def test_small_image_has_single_level():
+    pyramid = ImagePyramid(Image.new('L', (200, 100)), tile_size=256)
+    assert len(pyramid.levels) == 1
+    assert pyramid.levels[0].mode == 'RGB'
+
+
+def test_level_for_scale():
+    pyramid = ImagePyramid(Image.new('RGB', (2000, 1000)), tile_size=256)
+    assert pyramid.level_for_scale(2.0) == 0
+    assert pyramid.level_for_scale(1.0) == 0
+    assert pyramid.level_for_scale(0.6) == 0
+    assert pyramid.level_for_scale(0.5) == 1
+    assert pyramid.level_for_scale(0.3) == 1
+    assert pyramid.level_for_scale(0.25) == 2
+    # En kaba seviyenin altına inilmez
+    assert pyramid.level_for_scale(0.01) == 3
+
+
+def test_fit_level():
+    pyramid = ImagePyramid(Image.new('RGB', (2000, 1000)), tile_size=256)
+    assert pyramid.fit_level((2480, 3508)).size == (2000, 1000)
+    assert pyramid.fit_level((600, 600)).size == (500, 250)
+    assert pyramid.fit_level((10, 10)).size == (250, 125)
@@ -0,0 +1,90 @@
+# test_token_store.py
+import time
+import pytest
+from token_store import CachedTokenStore, MemoryTokenStore, SQLiteTokenStore
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'cached'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryTokenStore()
+    if request.param == 'sqlite':
+        return SQLiteTokenStore(str(tmp_path / "tokens.db"))
+    return CachedTokenStore(SQLiteTokenStore(str(tmp_path / "tokens.db")), ttl=2.0)
+
+
+def test_token_expires(store):
+    now = time.time()
+    store.add('a', now + 60)
+    assert store.is_active('a', now)
+    assert not store.is_active('a', now + 60)
+    assert not store.is_active('unknown', now)
+
+
+def test_revoke(store):
+    now = time.time()
+    store.add('a', now + 60)
+    assert store.revoke('a')
+    assert not store.is_active('a', now)
+    assert not store.revoke('a')
+
+
+def test_purge_expired(store):
+    now = time.time()
+    store.add('a', now + 10)
+    store.add('b', now + 20)
+    store.add('c', now + 30)
+    assert store.purge_expired(now + 25) == 2
+    assert store.is_active('c', now + 25)
+    assert store.purge_expired(now + 25) == 0
+
+
+def test_memory_store_renewal_survives_old_heap_entry():
+    store = MemoryTokenStore()
+    now = time.time()
+    store.add('a', now + 10)
+    store.add('a', now + 100)
+    # Eski son geçerlilik kaydı yenilenen token'ı silmez
+    assert store.purge_expired(now + 50) == 0
+    assert store.is_active('a', now + 50)
+
+
+def test_memory_store_purges_on_add():
+    store = MemoryTokenStore()
+    now = time.time()
+    store.add('old', now - 1)
+    store.add('new', now + 60)
+    assert set(store.tokens) == {'new'}
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    first = SQLiteTokenStore(path)
+    second = SQLiteTokenStore(path)
+    now = time.time()
+    first.add('a', now + 60)
+    assert second.is_active('a', now)
+    assert second.revoke('a')
+    assert not first.is_active('a', now)
+
+
+def test_cached_store_sees_remote_revocation_after_ttl(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    cached = CachedTokenStore(SQLiteTokenStore(path), ttl=2.0)
+    other_process = SQLiteTokenStore(path)
+    now = time.time()
+    other_process.add('a', now + 60)
+    assert cached.is_active('a', now)
+
+    other_process.revoke('a')
+    assert cached.is_active('a', now + 1)
+    assert not cached.is_active('a', now + 3)
+
+
+def test_cached_store_is_bounded(tmp_path):
+    cached = CachedTokenStore(MemoryTokenStore(), max_size=2)
+    now = time.time()
+    for digest in 'abc':
+        cached.add(digest, now + 60)
+    assert list(cached._cache) == ['b', 'c']
+    assert cached.is_active('a', now)
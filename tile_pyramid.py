@@ -0,0 +1,128 @@
+# tile_pyramid.py
+import math
+from collections import OrderedDict
+from typing import List, Tuple
+from PIL import Image
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QImage, QPainter, QPixmap
+
+TILE_SIZE = 256
+
+
+def pil_to_qimage(image: Image.Image) -> QImage:
+    """PIL görüntüsünü PNG'ye kodlamadan, ham tamponu paylaşan QImage'a dönüştür"""
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    if image.mode == 'RGBA':
+        qformat, channels = QImage.Format_RGBA8888, 4
+    else:
+        qformat, channels = QImage.Format_RGB888, 3
+
+    data = image.tobytes('raw', image.mode)
+    qimage = QImage(data, image.width, image.height, image.width * channels, qformat)
+    # QImage tamponu kopyalamaz; baytlar görüntü yaşadığı sürece tutulmalı
+    qimage._buffer = data
+    return qimage
+
+
+class ImagePyramid:
+    def __init__(self, image: Image.Image, tile_size: int = TILE_SIZE, cache_size: int = 256):
+        """Mip seviyelerini önceden hesapla (işçi thread'de çağrılabilir)"""
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self.levels: List[Image.Image] = [image]
+
+        # Her seviye bir öncekinin yarısı; en küçük seviye tek karoya sığar
+        level = image
+        while max(level.size) > tile_size:
+            level = level.reduce(2)
+            self.levels.append(level)
+
+        # (seviye, karo_x, karo_y) -> QPixmap, en son kullanılan sonda
+        self.tile_cache: OrderedDict = OrderedDict()
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.levels[0].size
+
+    def level_for_scale(self, scale: float) -> int:
+        """İstenen ölçeği karşılayan en küçük (en kaba) mip seviyesini bul"""
+        if scale >= 1.0:
+            return 0
+        level = int(math.floor(math.log2(1.0 / scale)))
+        return min(level, len(self.levels) - 1)
+
+    def fit_level(self, max_size: Tuple[int, int]) -> Image.Image:
+        """Verilen boyuta sığan en büyük seviyeyi getir"""
+        for level in self.levels:
+            if level.width <= max_size[0] and level.height <= max_size[1]:
+                return level
+        return self.levels[-1]
+
+    def tile(self, level: int, tx: int, ty: int) -> QPixmap:
+        """Karoyu önbellekten getir, yoksa üret (sadece GUI thread'de)"""
+        key = (level, tx, ty)
+        pixmap = self.tile_cache.get(key)
+        if pixmap is not None:
+            self.tile_cache.move_to_end(key)
+            return pixmap
+
+        source = self.levels[level]
+        box = (
+            tx * self.tile_size,
+            ty * self.tile_size,
+            min((tx + 1) * self.tile_size, source.width),
+            min((ty + 1) * self.tile_size, source.height)
+        )
+        pixmap = QPixmap.fromImage(pil_to_qimage(source.crop(box)))
+
+        self.tile_cache[key] = pixmap
+        if len(self.tile_cache) > self.cache_size:
+            self.tile_cache.popitem(last=False)
+        return pixmap
+
+    def draw(self, painter: QPainter, target: QRectF, viewport: QRectF):
+        """Görüntüyü target dikdörtgenine çiz; sadece görünür karoları işle"""
+        width, height = self.size
+        if target.width() <= 0 or target.height() <= 0:
+            return
+
+        level = self.level_for_scale(target.width() / width)
+        source = self.levels[level]
+
+        # Seviye pikseli başına ekran pikseli
+        step_x = target.width() / source.width
+        step_y = target.height() / source.height
+
+        visible = target.intersected(viewport)
+        if visible.isEmpty():
+            return
+
+        first_x = max(0, int((visible.left() - target.left()) / step_x) // self.tile_size)
+        last_x = min(
+            (source.width - 1) // self.tile_size,
+            int((visible.right() - target.left()) / step_x) // self.tile_size
+        )
+        first_y = max(0, int((visible.top() - target.top()) / step_y) // self.tile_size)
+        last_y = min(
+            (source.height - 1) // self.tile_size,
+            int((visible.bottom() - target.top()) / step_y) // self.tile_size
+        )
+
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        for ty in range(first_y, last_y + 1):
+            for tx in range(first_x, last_x + 1):
+                pixmap = self.tile(level, tx, ty)
+                dest = QRectF(
+                    target.left() + tx * self.tile_size * step_x,
+                    target.top() + ty * self.tile_size * step_y,
+                    pixmap.width() * step_x,
+                    pixmap.height() * step_y
+                )
+                painter.drawPixmap(dest, pixmap, QRectF(pixmap.rect()))
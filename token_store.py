@@ -0,0 +1,173 @@
+# token_store.py
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class TokenStore(ABC):
+    """Aktif token özetlerini ve son geçerlilik zamanlarını tutan depo"""
+
+    @abstractmethod
+    def add(self, digest: str, expires_at: float):
+        pass
+
+    @abstractmethod
+    def is_active(self, digest: str, now: Optional[float] = None) -> bool:
+        pass
+
+    @abstractmethod
+    def revoke(self, digest: str) -> bool:
+        pass
+
+    @abstractmethod
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        pass
+
+
+class MemoryTokenStore(TokenStore):
+    """Tek süreç için varsayılan depo"""
+
+    def __init__(self):
+        self.tokens: Dict[str, float] = {}
+        # (son geçerlilik zamanı, özet) min-heap'i
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, digest: str, expires_at: float):
+        # Süresi dolanlar her eklemede heap başından atılır; depo sınırsız büyümez
+        self.purge_expired()
+        with self._lock:
+            self.tokens[digest] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, digest))
+
+    def is_active(self, digest: str, now: Optional[float] = None) -> bool:
+        expires_at = self.tokens.get(digest)
+        return expires_at is not None and expires_at > (time.time() if now is None else now)
+
+    def revoke(self, digest: str) -> bool:
+        with self._lock:
+            # Heap kaydı süresi dolunca kendiliğinden atılır
+            return self.tokens.pop(digest, None) is not None
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, digest = heapq.heappop(self._expiry_heap)
+                if self.tokens.get(digest) == expires_at:
+                    del self.tokens[digest]
+                    removed += 1
+        return removed
+
+
+class SQLiteTokenStore(TokenStore):
+    """Aynı makinedeki birden çok süreç (export işçileri) arasında paylaşılan depo"""
+
+    def __init__(self, db_path: str = "data/tokens.db", purge_interval: float = 60.0):
+        self.db_path = db_path
+        self.purge_interval = purge_interval
+        self._last_purge = 0.0
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Bağlantılar thread'ler arasında paylaşılmaz
+        self._local = threading.local()
+
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "digest TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS tokens_expires_at ON tokens (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            # WAL: okuyucular yazıcıyı beklemez
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def add(self, digest: str, expires_at: float):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO tokens (digest, expires_at) VALUES (?, ?)", (digest, expires_at)
+        )
+        self._maybe_purge()
+
+    def is_active(self, digest: str, now: Optional[float] = None) -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM tokens WHERE digest = ? AND expires_at > ?",
+            (digest, time.time() if now is None else now)
+        ).fetchone()
+        return row is not None
+
+    def revoke(self, digest: str) -> bool:
+        cursor = self._connection().execute("DELETE FROM tokens WHERE digest = ?", (digest,))
+        return cursor.rowcount > 0
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        self._last_purge = now
+        cursor = self._connection().execute("DELETE FROM tokens WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
+
+    def _maybe_purge(self):
+        # Süresi dolan satırlar sorguda zaten elenir; silme seyrek yapılır
+        now = time.time()
+        if now - self._last_purge >= self.purge_interval:
+            try:
+                self.purge_expired(now)
+            except sqlite3.Error as e:
+                print(f"Token deposu temizleme hatası: {str(e)}")
+
+
+class CachedTokenStore(TokenStore):
+    """Paylaşılan deponun önünde kısa ömürlü yerel okuma önbelleği"""
+
+    def __init__(self, backend: TokenStore, ttl: float = 2.0, max_size: int = 10000):
+        self.backend = backend
+        self.ttl = ttl  # başka süreçteki iptal en geç bu kadar saniyede görülür
+        self.max_size = max_size
+        # özet -> (aktif mi, son geçerlilik, önbelleğe alınma zamanı)
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, digest: str, active: bool, expires_at: float, now: float):
+        with self._lock:
+            self._cache[digest] = (active, expires_at, now)
+            self._cache.move_to_end(digest)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def add(self, digest: str, expires_at: float):
+        self.backend.add(digest, expires_at)
+        self._remember(digest, True, expires_at, time.time())
+
+    def is_active(self, digest: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            cached = self._cache.get(digest)
+        if cached is not None and now - cached[2] < self.ttl:
+            return cached[0] and cached[1] > now
+
+        # Sonuç TTL boyunca yerelde tutulur; son geçerlilik arka uçta denetlendi
+        active = self.backend.is_active(digest, now)
+        self._remember(digest, active, float('inf'), now)
+        return active
+
+    def revoke(self, digest: str) -> bool:
+        with self._lock:
+            self._cache.pop(digest, None)
+        return self.backend.revoke(digest)
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        # Yerel kayıtlar TTL ve boyut sınırıyla zaten eskir
+        return self.backend.purge_expired(now)